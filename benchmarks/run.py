@@ -0,0 +1,434 @@
+# benchmarks/run.py
+"""
+Benchmarks for the render and asset hot paths.
+
+    python -m benchmarks.run                     # run, compare with benchmarks/baseline.json
+    python -m benchmarks.run --save-baseline     # run and store the results as the new baseline
+    python -m benchmarks.run --filter omdb --output results.json
+
+Runs under the SDL dummy video driver, so no window is needed. Each
+benchmark times its step function repeatedly and reports percentiles in
+milliseconds as JSON; the suite runs --rounds times and each benchmark
+keeps its fastest round. Posters are decoded from the local
+PNG assets (the compiled poster directory is ignored) and the OMDb path
+talks to a local stub server, with a throwaway disk cache.
+
+A benchmark is a regression when its median is more than --threshold
+slower than the baseline's; the exit status is then 1. Baselines are only
+comparable on the machine that recorded them.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+from src.profiler import percentile
+
+BENCHMARK_DIR = os.path.dirname(__file__)
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 0.25 # 25% slower median counts as a regression
+DEFAULT_ROUNDS = 3 # the suite is repeated and each benchmark keeps its fastest round
+PERCENTILES = (50, 95, 99)
+
+BENCHMARKS = [] # (name, make_step, repeat, warmup, batch)
+
+
+def benchmark(name, repeat=200, warmup=5, batch=1):
+    """
+    Registers make_step(ctx), which does any setup and returns the step to
+    time, or (reset, step) when untimed work has to run before every step,
+    or None when the benchmark can't run here (an optional package is missing).
+    Steps far below a millisecond are timed batch at a time and averaged,
+    so timer overhead and scheduler noise don't dominate.
+    """
+    def register(make_step):
+        BENCHMARKS.append((name, make_step, repeat, warmup, batch))
+        return make_step
+    return register
+
+
+def summarize(timings_ms):
+    ordered = sorted(timings_ms)
+    summary = {"n": len(ordered), "min": round(ordered[0], 4), "mean": round(sum(ordered) / len(ordered), 4)}
+    for pct in PERCENTILES:
+        summary[f"p{pct}"] = round(percentile(ordered, pct), 4)
+    summary["max"] = round(ordered[-1], 4)
+    return summary
+
+
+def time_step(make_step, ctx, repeat, warmup, batch=1):
+    step = make_step(ctx)
+    if step is None:
+        return None
+    reset = None
+    if isinstance(step, tuple):
+        reset, step = step
+
+    timings = []
+    for i in range(warmup + repeat):
+        if reset is not None:
+            reset()
+        started = time.perf_counter()
+        for _ in range(batch):
+            step()
+        elapsed = (time.perf_counter() - started) * 1000 / batch
+        if i >= warmup:
+            timings.append(elapsed)
+    return summarize(timings)
+
+
+# --- Context ---
+
+class BenchmarkContext:
+    """The game module wired to a dummy display, a temporary disk cache and the OMDb stub."""
+
+    def __init__(self, stub_url, temp_dir):
+        from src import game
+        from src.core import load_movie_categories
+        from src.disk_cache import DiskCache
+        from src.poster_assets import CompiledPosters
+
+        self.game = game
+        self.temp_dir = temp_dir
+        self.screen = game.init_display()
+        game.poster_cache = DiskCache(os.path.join(temp_dir, "posters"))
+        # An empty compiled directory: local posters are decoded from their PNGs
+        game.compiled_posters = CompiledPosters(os.path.join(temp_dir, "compiled"))
+        game.OMDB_URL = stub_url
+
+        categories = load_movie_categories()
+        self.titles = [title for movies in categories.values() for title in movies]
+        self.local_titles = sorted(
+            os.path.splitext(name)[0] for name in os.listdir(game.POSTER_ASSET_DIR)
+            if name.endswith((".png", ".jpg"))
+        )
+        local = set(self.local_titles)
+        self.remote_titles = [title for title in self.titles if title not in local]
+
+    def titles_for(self, count):
+        """count titles, cycling through the catalog with a suffix once it runs out."""
+        return [
+            self.titles[i % len(self.titles)] + (f" ({i // len(self.titles)})" if i >= len(self.titles) else "")
+            for i in range(count)
+        ]
+
+
+def stub_poster_png():
+    import pygame
+
+    surface = pygame.Surface((300, 450))
+    surface.fill((150, 40, 40))
+    data = io.BytesIO()
+    pygame.image.save(surface, data, "poster.png")
+    return data.getvalue()
+
+
+# --- Text ---
+
+@benchmark("wrap_text_multi.catalog", repeat=50)
+def bench_wrap_catalog(ctx):
+    import pygame
+
+    game = ctx.game
+    panel_font = pygame.font.Font(None, 28)
+
+    def step():
+        # Every title as a poster title box and as a panel entry
+        for title in ctx.titles:
+            game.wrap_text_multi(title, game.font, 216 - 10)
+            game.wrap_text_multi(title, panel_font, 250)
+    return step
+
+
+# --- Running screen ---
+
+@benchmark("poster.draw", repeat=300, warmup=10, batch=20)
+def bench_poster_draw(ctx):
+    from src.core import PosterState
+
+    game = ctx.game
+    image = game.make_placeholder_surface().convert()
+    state = PosterState(0, "The Lord of the Rings: The Return of the King", *image.get_size())
+    state.y = state.prev_y = 100.0
+    poster = game.Poster(state, image)
+    return lambda: poster.draw(ctx.screen, 0.5)
+
+
+def bench_selection_panel(entries):
+    def make_step(ctx):
+        game = ctx.game
+        panel = game.SelectionPanel(game.PANEL_X, game.PANEL_WIDTH)
+        for title in ctx.titles_for(entries):
+            panel.add_title(title)
+        frame = [0]
+
+        def step():
+            # Scroll through the whole list, a wheel notch per frame
+            frame[0] += 1
+            panel.scroll_y = -((frame[0] * panel.scroll_speed) % max(1, panel.total_content_height))
+            panel.draw(ctx.screen)
+        return step
+    return make_step
+
+for _entries in (10, 1000, 10000):
+    benchmark(f"selection_panel.draw.{_entries}", repeat=300, warmup=10, batch=5)(bench_selection_panel(_entries))
+
+
+def bench_stress_tick(lane_count):
+    def make_step(ctx):
+        from src.core import GameCore
+        from src.headless import stress_poster_size
+
+        # A pair every tick, run until the road is full (several hundred posters in flight)
+        titles = ctx.titles
+        pairs = [(titles[i % len(titles)], titles[(i + 1) % len(titles)]) for i in range(0, 20000, 2)]
+        core = GameCore(pairs, stress_poster_size(lane_count), lane_count, spawn_interval=1)
+        core.start()
+        for _ in range(600):
+            core.tick()
+        return core.tick
+    return make_step
+
+for _lanes in (2, 8):
+    benchmark(f"core.tick.stress.{_lanes}_lanes", repeat=300, warmup=10, batch=10)(bench_stress_tick(_lanes))
+
+
+# --- Results screen ---
+
+def bench_results_list(entries):
+    def make_step(ctx):
+        game = ctx.game
+        results_list = game.ResultsList(game.results_content_rect(), game.RESULTS_LIST_FONT)
+        results_list.sync(ctx.titles_for(entries))
+        frame = [0]
+
+        def step():
+            frame[0] += 1
+            scroll_y = -((frame[0] * 30) % max(1, results_list.total_content_height))
+            results_list.draw(ctx.screen, scroll_y)
+        return step
+    return make_step
+
+for _entries in (1000, 10000):
+    benchmark(f"results_list.draw.{_entries}", repeat=300, warmup=10, batch=5)(bench_results_list(_entries))
+
+
+# --- Poster loading ---
+
+@benchmark("get_poster_image.local_cold", repeat=30, warmup=2)
+def bench_local_cold(ctx):
+    game = ctx.game
+    counter = [0]
+
+    def reset():
+        game.poster_surface_cache.clear()
+
+    def step():
+        counter[0] += 1
+        game.get_poster_image(ctx.local_titles[counter[0] % len(ctx.local_titles)], game.OMDB_API_KEY)
+    return reset, step
+
+
+@benchmark("get_poster_image.warm", repeat=300, warmup=10, batch=200)
+def bench_warm(ctx):
+    game = ctx.game
+    title = ctx.local_titles[0]
+    game.get_poster_image(title, game.OMDB_API_KEY)
+    return lambda: game.get_poster_image(title, game.OMDB_API_KEY)
+
+
+# --- OMDb (local stub server) ---
+
+@benchmark("omdb.metadata_cold", repeat=100, warmup=5)
+def bench_omdb_metadata(ctx):
+    game = ctx.game
+    title = ctx.remote_titles[0]
+    return (lambda: game.poster_cache.discard("omdb:" + title),
+            lambda: game.fetch_omdb_metadata(title, game.OMDB_API_KEY))
+
+
+@benchmark("omdb.poster_cold", repeat=50, warmup=3)
+def bench_omdb_poster_cold(ctx):
+    game = ctx.game
+    title = ctx.remote_titles[1]
+
+    def reset():
+        game.poster_surface_cache.clear()
+        data = game.poster_cache.get_json("omdb:" + title)
+        if data is not None:
+            game.poster_cache.discard("image:" + data["Poster"])
+        game.poster_cache.discard("omdb:" + title)
+
+    return reset, lambda: game.get_poster_image(title, game.OMDB_API_KEY)
+
+
+@benchmark("omdb.poster_disk_cached", repeat=100, warmup=5)
+def bench_omdb_poster_disk(ctx):
+    game = ctx.game
+    title = ctx.remote_titles[2]
+    return game.poster_surface_cache.clear, lambda: game.get_poster_image(title, game.OMDB_API_KEY)
+
+
+# --- Choice log rankings ---
+
+CHOICE_BENCH_PICKS = 2000
+CHOICE_BENCH_TITLES = 200
+
+
+def choice_log_for_bench(ctx):
+    """A log of CHOICE_BENCH_PICKS picks between CHOICE_BENCH_TITLES catalog titles, written once."""
+    from src.choices import ChoiceLog
+
+    directory = os.path.join(ctx.temp_dir, "choices")
+    log = ChoiceLog(directory)
+    if len(log) == 0:
+        titles = ctx.titles[:CHOICE_BENCH_TITLES]
+        for i in range(CHOICE_BENCH_PICKS):
+            a, b = titles[(i * 7) % len(titles)], titles[(i * 13 + 1) % len(titles)]
+            if a != b:
+                log.record(*sorted((a, b)), timestamp=float(i))
+        log.close()
+        log = ChoiceLog(directory)
+    return log
+
+
+@benchmark("choices.bradley_terry.python", repeat=5, warmup=1)
+def bench_bradley_terry_python(ctx):
+    from src.choices import _bradley_terry_python
+
+    log = choice_log_for_bench(ctx)
+    return lambda: _bradley_terry_python(log.titles(), log.read_records(), 200, 1e-6)
+
+
+@benchmark("choices.bradley_terry.numpy", repeat=20, warmup=2)
+def bench_bradley_terry_numpy(ctx):
+    from src.choices import _numpy, bradley_terry
+
+    if _numpy() is None:
+        return None
+    log = choice_log_for_bench(ctx)
+    return lambda: bradley_terry(log)
+
+
+@benchmark("choices.elo.update", repeat=20, warmup=2)
+def bench_elo_update(ctx):
+    from src.choices import EloRanking
+
+    log = choice_log_for_bench(ctx)
+    ranking = EloRanking(os.path.join(ctx.temp_dir, "ranking.json"))
+
+    def reset():
+        # From scratch, so every pick in the log is applied
+        ranking.ratings = {}
+        ranking.offset = 0
+
+    return reset, lambda: ranking.update(log)
+
+
+# --- Running and comparing ---
+
+def run(name_filter=None, rounds=DEFAULT_ROUNDS):
+    from benchmarks.stub_server import StubOmdbServer
+
+    temp_dir = tempfile.mkdtemp(prefix="movie-bench-")
+    results = {}
+    try:
+        # Loading messages from the game would drown the report
+        with StubOmdbServer(stub_poster_png()) as stub, open(os.devnull, "w") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                ctx = BenchmarkContext(stub.url, temp_dir)
+                # Whole-suite rounds: a slow spell on the host only costs one round
+                for _ in range(rounds):
+                    for name, make_step, repeat, warmup, batch in BENCHMARKS:
+                        if name_filter and name_filter not in name:
+                            continue
+                        summary = time_step(make_step, ctx, repeat, warmup, batch)
+                        if summary is None:
+                            continue
+                        if name not in results or summary["p50"] < results[name]["p50"]:
+                            results[name] = summary
+            for name, summary in results.items():
+                print(f"{name:34} p50 {summary['p50']:9.4f} ms", file=sys.stderr)
+            stub_stats = stub.stats()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    import pygame
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+            "unit": "ms",
+            "rounds": rounds,
+            "stub": stub_stats,
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD, metric="p50"):
+    """Returns [(name, baseline value, current value, ratio)] for benchmarks that got slower than allowed."""
+    regressions = []
+    for name, current in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get(metric):
+            continue
+        ratio = current[metric] / previous[metric]
+        if ratio > 1 + threshold:
+            regressions.append((name, previous[metric], current[metric], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the render and asset hot paths.")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline report to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="times to repeat the suite")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown of the median before it is a regression (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    report = run(args.filter, args.rounds)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare with (run with --save-baseline first)", file=sys.stderr)
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.threshold)
+    for name, before, after, ratio in regressions:
+        print(f"REGRESSION {name}: p50 {before:.4f} -> {after:.4f} ms ({ratio:.2f}x)", file=sys.stderr)
+    if not regressions:
+        print("No regressions against the baseline", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
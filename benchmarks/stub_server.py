@@ -0,0 +1,137 @@
+# benchmarks/stub_server.py
+"""
+Local stand-in for OMDb and its poster host, so the network path can be
+benchmarked without the real services (or their rate limits).
+"""
+import http.server
+import json
+import threading
+import time
+from urllib.parse import parse_qs, quote, urlsplit
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive, like the real hosts
+    wbufsize = -1 # send headers and body together; separate small writes stall on delayed ACKs
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, content_type, body):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            status = None
+            broken = False
+            if server.failures_left:
+                server.failures_left -= 1
+                status = server.failure_status
+            elif server.broken_left:
+                server.broken_left -= 1
+                broken = True
+        if server.delay:
+            time.sleep(server.delay)
+        if status is not None:
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if broken:
+            # A chunked body whose first chunk size isn't hex, then hang up
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(b"zz\r\n")
+            self.close_connection = True
+            return
+
+        if parts.path.startswith("/img/"):
+            server.image_requests += 1
+            self._send("image/png", server.poster_png)
+            return
+
+        server.omdb_requests += 1
+        title = parse_qs(parts.query).get("t", [""])[0]
+        if title.startswith("Missing"):
+            body = {"Response": "False", "Error": "Movie not found!"}
+        else:
+            body = {
+                "Response": "True",
+                "Title": title,
+                "Poster": f"{server.url}/img/{quote(title)}.png",
+            }
+        self._send("application/json", json.dumps(body).encode("utf-8"))
+
+
+class StubOmdbServer:
+    """
+    Answers OMDb title lookups with a poster URL on itself and serves the
+    same PNG for every poster. Titles starting with "Missing" are not found.
+    fail_next(), break_next() and delay inject errors, garbled answers and
+    slow answers for client tests.
+    """
+
+    def __init__(self, poster_png):
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.poster_png = poster_png
+        self._server.omdb_requests = 0
+        self._server.image_requests = 0
+        self._server.requests = 0       # every request, failed ones included
+        self._server.failures_left = 0
+        self._server.failure_status = 503
+        self._server.broken_left = 0
+        self._server.delay = 0.0
+        self._server.lock = threading.Lock()
+        self._server.url = f"http://127.0.0.1:{self._server.server_port}"
+        self._thread = None
+
+    @property
+    def url(self):
+        return self._server.url
+
+    @property
+    def delay(self):
+        return self._server.delay
+
+    @delay.setter
+    def delay(self, seconds):
+        """Seconds every answer is held back."""
+        self._server.delay = seconds
+
+    def fail_next(self, count, status=503):
+        """Answers the next count requests with status and an empty body."""
+        with self._server.lock:
+            self._server.failures_left = count
+            self._server.failure_status = status
+
+    def break_next(self, count):
+        """Answers the next count requests with a garbled chunked body (a ChunkedEncodingError for requests)."""
+        with self._server.lock:
+            self._server.broken_left = count
+
+    def stats(self):
+        return {
+            "omdb_requests": self._server.omdb_requests,
+            "image_requests": self._server.image_requests,
+            "requests": self._server.requests,
+        }
+
+    def __enter__(self):
+        # A short poll interval so shutting down doesn't wait half a second
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -1,4 +1,41 @@
+import time
+
+STARTED_AT = time.perf_counter() # before the imports, for --startup-report
+
+import argparse
+
 from src import game
+from src.profiler import StartupTimer
+from src.replay import SessionLog
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pick your favorite movie, one pair at a time.")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print where the time went between process start and the first frame")
+    sessions = parser.add_mutually_exclusive_group()
+    sessions.add_argument("--record", metavar="FILE", help="log this session's input to FILE")
+    sessions.add_argument("--replay", metavar="FILE", help="play back a session logged with --record")
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__":
-    game.main()
+    args = parse_args()
+    startup = None
+    if args.startup_report:
+        startup = StartupTimer(STARTED_AT)
+        startup.mark("imports")
+
+    replay_log = None
+    if args.replay:
+        replay_log = SessionLog.load(args.replay)
+        # Pairs come from the categories the session was recorded with, on the same road
+        game.MOVIE_CATEGORIES = replay_log.metadata.get("categories")
+        game.LANE_COUNT = replay_log.metadata.get("lanes", game.LANE_COUNT)
+        game.STRESS_SPAWN_INTERVAL = replay_log.metadata.get("spawn_interval")
+        scheduler = replay_log.metadata.get("scheduler")
+        if scheduler:
+            game.PAIR_SCHEDULER = scheduler["mode"]
+            game.RANKING_POOL = scheduler["pool"]
+            game.RANKING_TOP_K = scheduler["top_k"]
+    game.main(startup, record_path=args.record, replay_log=replay_log)
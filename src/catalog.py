@@ -0,0 +1,294 @@
+# src/catalog.py
+"""
+Movie catalog in SQLite, with random pairs streamed from it.
+
+    python -m src.catalog build [--json FILE] [--output FILE]
+    python -m src.catalog info [--catalog FILE]
+
+`build` converts movies_by_category.json into an indexed database. Movies
+of a category get consecutive ids, so a category is a (first id, count)
+range and picking movies never needs the full list in memory. The game
+walks the movies of the chosen categories in a seeded pseudo-random
+order (a keyed Feistel permutation over the ids) and looks titles up a
+page at a time, so startup time and memory don't grow with the catalog.
+"""
+import argparse
+import bisect
+import json
+import os
+import random
+import sqlite3
+import tempfile
+from collections import OrderedDict
+from collections.abc import Sequence
+
+SRC_DIR = os.path.dirname(__file__)
+CATALOG_JSON_PATH = os.path.join(SRC_DIR, "data", "movies_by_category.json")
+CATALOG_DB_PATH = os.path.join(SRC_DIR, "data", "movies.sqlite3")
+CATALOG_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    first_movie INTEGER NOT NULL,   -- movies of a category have consecutive ids
+    movie_count INTEGER NOT NULL
+);
+CREATE TABLE movies (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    category_id INTEGER NOT NULL REFERENCES categories(id)
+);
+CREATE INDEX movies_by_category ON movies (category_id, id);
+"""
+
+_MASK64 = (1 << 64) - 1
+
+
+class RandomPermutation:
+    """
+    A seeded bijection on range(n), evaluated one index at a time in O(1)
+    memory: a 4-round Feistel network over the smallest even power of two
+    covering n, cycle-walking any result that lands outside the range.
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, n, seed=None):
+        self.n = n
+        rng = random.Random(seed)
+        half_bits = max(1, ((max(n, 2) - 1).bit_length() + 1) // 2)
+        self._half_bits = half_bits
+        self._half_mask = (1 << half_bits) - 1
+        self._keys = [rng.getrandbits(64) for _ in range(self.ROUNDS)]
+
+    @staticmethod
+    def _mix(value, key):
+        # splitmix64 finaliser
+        value = ((value ^ key) * 0xBF58476D1CE4E5B9) & _MASK64
+        value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return value ^ (value >> 31)
+
+    def _feistel(self, value):
+        left = value >> self._half_bits
+        right = value & self._half_mask
+        for key in self._keys:
+            left, right = right, left ^ (self._mix(right, key) & self._half_mask)
+        return (left << self._half_bits) | right
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.n:
+            raise IndexError(index)
+        value = self._feistel(index)
+        while value >= self.n:
+            value = self._feistel(value)
+        return value
+
+    def __len__(self):
+        return self.n
+
+
+class PairSequence(Sequence):
+    """
+    The movies of some categories in a seeded random order, as (left, right)
+    title pairs. Pairs are worked out on demand and their titles fetched a
+    page at a time; a few recent pages are kept.
+    """
+
+    PAIRS_PER_PAGE = 64
+    MAX_CACHED_PAGES = 8
+
+    def __init__(self, catalog, ranges, seed=None):
+        self.catalog = catalog
+        self._ranges = ranges           # [(first movie id, count)]
+        self._starts = []               # ordinal where each range begins
+        total = 0
+        for _, count in ranges:
+            self._starts.append(total)
+            total += count
+        self.movie_count = total
+        self._permutation = RandomPermutation(total, seed)
+        self._pages = OrderedDict()     # page index -> list of pairs, least recent first
+
+    def __len__(self):
+        return self.movie_count // 2
+
+    def _movie_id(self, ordinal):
+        position = self._permutation[ordinal]
+        range_index = bisect.bisect_right(self._starts, position) - 1
+        first_movie, _ = self._ranges[range_index]
+        return first_movie + position - self._starts[range_index]
+
+    def _page(self, page_index):
+        page = self._pages.get(page_index)
+        if page is not None:
+            self._pages.move_to_end(page_index)
+            return page
+
+        first_pair = page_index * self.PAIRS_PER_PAGE
+        last_pair = min(first_pair + self.PAIRS_PER_PAGE, len(self))
+        ids = [self._movie_id(ordinal) for ordinal in range(first_pair * 2, last_pair * 2)]
+        titles = self.catalog.titles(ids)
+        page = [(titles[ids[i]], titles[ids[i + 1]]) for i in range(0, len(ids), 2)]
+
+        self._pages[page_index] = page
+        if len(self._pages) > self.MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+        return page
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("pair index out of range")
+        return self._page(index // self.PAIRS_PER_PAGE)[index % self.PAIRS_PER_PAGE]
+
+
+class Catalog:
+    """Read access to a catalog database built by build_catalog()."""
+
+    def __init__(self, path=CATALOG_DB_PATH, connection=None):
+        self.path = path
+        self._conn = connection or sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        version = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if version is None or int(version[0]) != CATALOG_VERSION:
+            raise ValueError(f"{path} is not a version {CATALOG_VERSION} movie catalog")
+
+    @classmethod
+    def from_json(cls, json_path=CATALOG_JSON_PATH):
+        """Builds an in-memory catalog straight from a movies_by_category.json file."""
+        with open(json_path, "r", encoding="utf-8") as f:
+            movie_categories = json.load(f)
+        connection = sqlite3.connect(":memory:")
+        _write_catalog(connection, movie_categories)
+        return cls(json_path, connection)
+
+    def categories(self):
+        """[(name, movie count)] in catalog order."""
+        return self._conn.execute("SELECT name, movie_count FROM categories ORDER BY id").fetchall()
+
+    def ranges(self, categories=None):
+        """[(first movie id, count)] for the named categories, or all of them."""
+        rows = self._conn.execute("SELECT name, first_movie, movie_count FROM categories ORDER BY id").fetchall()
+        if categories is None:
+            return [(first, count) for _, first, count in rows]
+
+        by_name = {name: (first, count) for name, first, count in rows}
+        unknown = [name for name in categories if name not in by_name]
+        if unknown:
+            raise KeyError(f"Unknown categories: {', '.join(unknown)}")
+        return [by_name[name] for name in dict.fromkeys(categories)]
+
+    def count(self, categories=None):
+        return sum(count for _, count in self.ranges(categories))
+
+    def iter_titles(self, categories=None, batch_size=1000):
+        """Every title of the named categories (or all), read batch_size rows at a time."""
+        for first, count in self.ranges(categories):
+            for start in range(first, first + count, batch_size):
+                end = min(start + batch_size, first + count)
+                rows = self._conn.execute(
+                    "SELECT title FROM movies WHERE id >= ? AND id < ? ORDER BY id", (start, end)
+                ).fetchall()
+                for (title,) in rows:
+                    yield title
+
+    def titles(self, ids):
+        """id -> title for the given movie ids."""
+        titles = {}
+        ids = list(ids)
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            titles.update(self._conn.execute(
+                f"SELECT id, title FROM movies WHERE id IN ({placeholders})", chunk
+            ))
+        return titles
+
+    def random_pairs(self, categories=None, seed=None):
+        """A fresh PairSequence over the chosen categories; a random seed unless one is given."""
+        if seed is None:
+            seed = random.getrandbits(64)
+        return PairSequence(self, self.ranges(categories), seed)
+
+    def close(self):
+        self._conn.close()
+
+
+def open_catalog(path=CATALOG_DB_PATH, json_path=CATALOG_JSON_PATH):
+    """The built catalog if there is one, otherwise one loaded from the JSON file."""
+    if os.path.exists(path):
+        return Catalog(path)
+    return Catalog.from_json(json_path)
+
+
+def _write_catalog(connection, movie_categories):
+    connection.executescript(SCHEMA)
+    next_id = 1
+    for category_id, (name, movies) in enumerate(movie_categories.items(), start=1):
+        connection.execute(
+            "INSERT INTO categories (id, name, first_movie, movie_count) VALUES (?, ?, ?, ?)",
+            (category_id, name, next_id, len(movies))
+        )
+        connection.executemany(
+            "INSERT INTO movies (id, title, category_id) VALUES (?, ?, ?)",
+            ((next_id + offset, title, category_id) for offset, title in enumerate(movies))
+        )
+        next_id += len(movies)
+    connection.execute("INSERT INTO meta (key, value) VALUES ('version', ?)", (str(CATALOG_VERSION),))
+    connection.commit()
+
+
+def build_catalog(json_path=CATALOG_JSON_PATH, output_path=CATALOG_DB_PATH):
+    """Converts a movies_by_category.json file into a catalog database at output_path."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        movie_categories = json.load(f)
+
+    # Build next to the target and swap it in, so a running game never sees half a catalog
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        connection = sqlite3.connect(tmp_path)
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        _write_catalog(connection, movie_categories)
+        connection.close()
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    total = sum(len(movies) for movies in movie_categories.values())
+    print(f"Catalog: {total} movies in {len(movie_categories)} categories written to {output_path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and inspect the movie catalog database.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="convert movies_by_category.json into a catalog database")
+    build_parser.add_argument("--json", default=CATALOG_JSON_PATH, help="movies_by_category.json to convert")
+    build_parser.add_argument("--output", default=CATALOG_DB_PATH, help="catalog database to write")
+
+    info_parser = commands.add_parser("info", help="list the categories of a catalog")
+    info_parser.add_argument("--catalog", default=CATALOG_DB_PATH)
+
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        build_catalog(args.json, args.output)
+    else:
+        catalog = open_catalog(args.catalog)
+        for name, count in catalog.categories():
+            print(f"{count:8}  {name}")
+        print(f"{catalog.count():8}  total")
+        catalog.close()
+
+
+if __name__ == "__main__":
+    main()
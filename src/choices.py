@@ -0,0 +1,418 @@
+# src/choices.py
+"""
+Every pick the player makes, kept across sessions, and rankings built on them.
+
+A pick is a pairwise preference: the chosen title beat the other one of
+its pair. ChoiceLog appends each as a (winner, loser, time) record of 16
+bytes to choices.bin, with the titles numbered in titles.jsonl next to it.
+Records are buffered and written in batches by a background thread, so the
+frame loop never waits on the disk. Several game processes can share the
+directory: a batch is written under a lock on choices.lock, after reading
+any titles the others have numbered since.
+
+EloRanking is brought up to date with the picks made since it last looked
+and is saved with the log offset it covers, so it never reads the log from
+the start again. bradley_terry() fits strengths to the whole log in one go.
+
+NumPy is optional and not in requirements.txt: the game itself never needs
+it. With NumPy bradley_terry() is vectorized; without it the same fit runs
+in pure Python, which is fine for the picks one player makes (see the
+choices.bradley_terry.* benchmarks for both).
+
+    python -m src.choices info
+    python -m src.choices rank [--method elo|bradley-terry] [--top 20]
+"""
+import argparse
+import contextlib
+import heapq
+import json
+import math
+import os
+import struct
+import threading
+import time
+
+from src.disk_cache import atomic_write
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+CHOICES_FILENAME = "choices.bin"
+TITLES_FILENAME = "titles.jsonl"
+LOCK_FILENAME = "choices.lock"
+RANKING_FILENAME = "ranking.json"
+RECORD = struct.Struct("<IId") # winner id, loser id, unix time
+FLUSH_INTERVAL = 1.0 # seconds a pick may wait in memory before it is written
+FLUSH_BATCH = 64 # picks that wake the writer early
+
+RANKING_VERSION = 1
+ELO_K = 32
+ELO_INITIAL = 1500.0
+BRADLEY_TERRY_ITERATIONS = 200
+BRADLEY_TERRY_TOLERANCE = 1e-6
+
+
+def _numpy():
+    """NumPy if it is installed; it is optional."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    """Holds an exclusive lock on path (created if missing), shared with other processes."""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass # LK_LOCK gives up after 10 seconds; keep waiting
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class ChoiceLog:
+    """The append-only log of picks in a directory. Writes happen on a background thread."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.choices_path = os.path.join(directory, CHOICES_FILENAME)
+        self.titles_path = os.path.join(directory, TITLES_FILENAME)
+        self.lock_path = os.path.join(directory, LOCK_FILENAME)
+        try:
+            size = os.path.getsize(self.choices_path)
+        except OSError:
+            size = 0
+        self.opened_with = size // RECORD.size # records on disk when the log was opened
+        self.recent = []                # (winner, loser) picked since then, in log order
+        self._title_ids = {}            # title -> id, as far as titles.jsonl has been read
+        self._title_count = 0           # lines of titles.jsonl read; the next title's id
+        self._titles_read = 0           # bytes of titles.jsonl read into _title_ids
+        self._pending = []              # (winner, loser, time) not written yet
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock() # keeps batches in order between the writer and flush()
+        self._writer = None
+        self._closing = False
+        self.written = 0                # records written since the log was opened
+        self.errors = 0
+
+    def __len__(self):
+        return self.opened_with + len(self.recent)
+
+    def record(self, winner, loser, timestamp=None):
+        """Logs that winner was picked over loser. Returns at once; the record is written in the background."""
+        with self._condition:
+            self.recent.append((winner, loser))
+            self._pending.append((winner, loser, time.time() if timestamp is None else timestamp))
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="choice-log", daemon=True)
+                self._writer.start()
+            elif len(self._pending) >= FLUSH_BATCH:
+                self._condition.notify()
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                if not self._closing:
+                    self._condition.wait(FLUSH_INTERVAL)
+                closing = self._closing
+            self.flush()
+            if closing:
+                return
+
+    def _read_titles(self):
+        titles = []
+        try:
+            with open(self.titles_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.endswith("\n"):
+                        titles.append(json.loads(line))
+        except OSError:
+            pass # no log yet
+        return titles
+
+    def _read_new_titles(self):
+        """
+        Numbers the titles appended to titles.jsonl since the last call, by
+        this process or another. Call with the lock held.
+        """
+        try:
+            with open(self.titles_path, "r+b") as f:
+                f.seek(self._titles_read)
+                data = f.read()
+                whole = data[:data.rfind(b"\n") + 1]
+                if len(whole) < len(data):
+                    # A crash left half a line at the end; drop it before appending after it
+                    f.truncate(self._titles_read + len(whole))
+        except FileNotFoundError:
+            return # no log yet
+        ids = self._title_ids
+        for line in whole.splitlines():
+            ids.setdefault(json.loads(line), self._title_count)
+            self._title_count += 1
+        self._titles_read += len(whole)
+
+    def _write(self, batch):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with _file_lock(self.lock_path):
+                # Another process may have numbered titles since this one last wrote
+                self._read_new_titles()
+                self._trim_partial_record()
+                ids = self._title_ids
+                new_titles = []
+                records = bytearray()
+                for winner, loser, timestamp in batch:
+                    for title in (winner, loser):
+                        if title not in ids:
+                            ids[title] = self._title_count
+                            self._title_count += 1
+                            new_titles.append(title)
+                    records += RECORD.pack(ids[winner], ids[loser], timestamp)
+
+                # Titles first: a record must never point past the end of the title list
+                if new_titles:
+                    with open(self.titles_path, "ab") as f:
+                        f.write("".join(json.dumps(title) + "\n" for title in new_titles).encode("utf-8"))
+                        self._titles_read = f.tell()
+                with open(self.choices_path, "ab") as f:
+                    f.write(records)
+            self.written += len(batch)
+        except OSError as e:
+            self.errors += 1
+            print(f"Choice log not written ({len(batch)} picks lost): {e}")
+
+    def _trim_partial_record(self):
+        # A crash mid-write can leave part of a record at the end; drop it so the rest stay aligned
+        try:
+            size = os.path.getsize(self.choices_path)
+        except OSError:
+            return
+        if size % RECORD.size:
+            with open(self.choices_path, "r+b") as f:
+                f.truncate(size - size % RECORD.size)
+
+    def flush(self):
+        """Writes everything recorded so far before returning."""
+        with self._write_lock:
+            # record() only waits for the swap, never for the disk
+            with self._condition:
+                batch, self._pending = self._pending, []
+            if batch:
+                self._write(batch)
+
+    def close(self):
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
+
+    # --- Reading ---
+
+    def titles(self):
+        """Every title in the log, indexed by id."""
+        return self._read_titles()
+
+    def read_records(self, start=0, stop=None):
+        """The (winner id, loser id, time) records on disk from start to stop, as a list."""
+        with open(self.choices_path, "rb") as f:
+            f.seek(start * RECORD.size)
+            data = f.read() if stop is None else f.read((stop - start) * RECORD.size)
+        data = data[:len(data) - len(data) % RECORD.size]
+        return list(RECORD.iter_unpack(data))
+
+    def read_arrays(self):
+        """(winners, losers, times) NumPy arrays of every record on disk; needs NumPy."""
+        numpy = _numpy()
+        dtype = numpy.dtype([("winner", "<u4"), ("loser", "<u4"), ("time", "<f8")])
+        size = os.path.getsize(self.choices_path) if os.path.exists(self.choices_path) else 0
+        records = numpy.fromfile(self.choices_path, dtype=dtype, count=size // RECORD.size) if size else \
+            numpy.zeros(0, dtype=dtype)
+        return records["winner"], records["loser"], records["time"]
+
+    def since(self, offset):
+        """(winner, loser) titles of every pick from log position offset on."""
+        if offset >= self.opened_with:
+            return self.recent[offset - self.opened_with:]
+        # Picks from before this run that a saved ranking hasn't seen
+        titles = self.titles()
+        older = [(titles[winner], titles[loser]) for winner, loser, _ in self.read_records(offset, self.opened_with)]
+        return older + self.recent
+
+
+class EloRanking:
+    """
+    Elo ratings of every title picked or passed over, updated pick by pick.
+    Saved to path with the log offset it covers; update() catches up from
+    there.
+    """
+
+    def __init__(self, path, k=ELO_K):
+        self.path = path
+        self.k = k
+        self.ratings = None             # title -> [rating, comparisons], read on first use
+        self.offset = 0                 # log records included in the ratings
+
+    def load(self):
+        self.ratings = {}
+        self.offset = 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == RANKING_VERSION and data.get("k") == self.k:
+                self.ratings = data["ratings"]
+                self.offset = data["offset"]
+        except (OSError, ValueError, KeyError):
+            pass # none saved yet, or unreadable: rebuilt from the log
+
+    def apply(self, winner, loser):
+        ratings = self.ratings
+        winner_entry = ratings.get(winner)
+        if winner_entry is None:
+            winner_entry = ratings[winner] = [ELO_INITIAL, 0]
+        loser_entry = ratings.get(loser)
+        if loser_entry is None:
+            loser_entry = ratings[loser] = [ELO_INITIAL, 0]
+        expected = 1.0 / (1.0 + 10 ** ((loser_entry[0] - winner_entry[0]) / 400))
+        change = self.k * (1.0 - expected)
+        winner_entry[0] += change
+        loser_entry[0] -= change
+        winner_entry[1] += 1
+        loser_entry[1] += 1
+
+    def update(self, log):
+        """Applies the picks the log got since the ratings were last updated."""
+        if self.ratings is None:
+            self.load()
+        if self.offset > len(log):
+            # The log lost records the ratings had seen (it was deleted or cut short): start over
+            self.ratings = {}
+            self.offset = 0
+        for winner, loser in log.since(self.offset):
+            self.apply(winner, loser)
+        self.offset = len(log)
+
+    def top(self, n):
+        """The n best rated titles as (title, rating, comparisons)."""
+        best = heapq.nlargest(n, self.ratings.items(), key=lambda item: item[1][0])
+        return [(title, rating, comparisons) for title, (rating, comparisons) in best]
+
+    def save(self):
+        if self.ratings is None:
+            return
+        data = {"version": RANKING_VERSION, "k": self.k, "offset": self.offset, "ratings": self.ratings}
+        try:
+            atomic_write(self.path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        except OSError as e:
+            print(f"Ranking not saved: {e}")
+
+
+def bradley_terry(log, iterations=BRADLEY_TERRY_ITERATIONS, tolerance=BRADLEY_TERRY_TOLERANCE):
+    """
+    Bradley-Terry strengths of every title in the log, by the MM algorithm.
+    Every title also gets one win and one loss against a virtual opponent of
+    strength 1, so titles that never won (or never lost) still get a finite
+    strength. Returns {title: strength}, normalized to a geometric mean of 1.
+    """
+    titles = log.titles()
+    numpy = _numpy()
+    if numpy is None:
+        return _bradley_terry_python(titles, log.read_records() if os.path.exists(log.choices_path) else [],
+                                     iterations, tolerance)
+
+    winners, losers, _ = log.read_arrays()
+    n = len(titles)
+    if n == 0:
+        return {}
+    wins = numpy.bincount(winners, minlength=n) + 1.0
+    strengths = numpy.ones(n)
+    for _ in range(iterations):
+        inverse = 1.0 / (strengths[winners] + strengths[losers])
+        denominator = (numpy.bincount(winners, inverse, n) + numpy.bincount(losers, inverse, n)
+                       + 2.0 / (strengths + 1.0))
+        updated = wins / denominator
+        updated /= numpy.exp(numpy.log(updated).mean())
+        converged = numpy.abs(updated - strengths).max() < tolerance
+        strengths = updated
+        if converged:
+            break
+    return dict(zip(titles, strengths.tolist()))
+
+
+def _bradley_terry_python(titles, records, iterations, tolerance):
+    n = len(titles)
+    wins = [1.0] * n
+    for winner, _, _ in records:
+        wins[winner] += 1
+    strengths = [1.0] * n
+    for _ in range(iterations):
+        denominator = [2.0 / (strength + 1.0) for strength in strengths]
+        for winner, loser, _ in records:
+            inverse = 1.0 / (strengths[winner] + strengths[loser])
+            denominator[winner] += inverse
+            denominator[loser] += inverse
+        updated = [w / d for w, d in zip(wins, denominator)]
+        scale = math.exp(sum(math.log(value) for value in updated) / n) if n else 1.0
+        updated = [value / scale for value in updated]
+        converged = max((abs(a - b) for a, b in zip(updated, strengths)), default=0.0) < tolerance
+        strengths = updated
+        if converged:
+            break
+    return dict(zip(titles, strengths))
+
+
+def main(argv=None):
+    from src.game import CHOICE_LOG_DIR
+
+    parser = argparse.ArgumentParser(description="Inspect the log of picks and rank the titles in it.")
+    parser.add_argument("command", choices=("info", "rank"))
+    parser.add_argument("--dir", default=CHOICE_LOG_DIR, help="choice log directory")
+    parser.add_argument("--method", choices=("elo", "bradley-terry"), default="elo")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    log = ChoiceLog(args.dir)
+    if args.command == "info":
+        print(f"{len(log)} picks between {len(log.titles())} titles in {args.dir}")
+        print(f"NumPy: {'available' if _numpy() else 'not installed (pure Python fallback)'}")
+        return 0
+
+    started = time.perf_counter()
+    if args.method == "elo":
+        ranking = EloRanking(os.path.join(args.dir, RANKING_FILENAME))
+        ranking.update(log)
+        ranking.save()
+        rows = [f"{rating:7.1f}  {title} ({comparisons} comparisons)" for title, rating, comparisons in ranking.top(args.top)]
+    else:
+        strengths = bradley_terry(log)
+        best = heapq.nlargest(args.top, strengths.items(), key=lambda item: item[1])
+        rows = [f"{strength:7.3f}  {title}" for title, strength in best]
+    elapsed = time.perf_counter() - started
+
+    for rank, row in enumerate(rows, 1):
+        print(f"{rank:3}. {row}")
+    print(f"Ranked {len(log)} picks with {args.method} in {elapsed * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
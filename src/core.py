@@ -0,0 +1,355 @@
+# src/core.py
+"""
+The game itself, without pygame: pair scheduling, lane movement, falling
+posters, collisions, selections and state transitions. The pygame front
+end in src/game.py draws a GameCore; src/headless.py runs it without a
+display.
+"""
+import json
+import math
+import os
+import random
+
+# --- Screen and layout ---
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+GAME_WIDTH = int(SCREEN_WIDTH * 0.65)
+PANEL_X = GAME_WIDTH
+PANEL_WIDTH = SCREEN_WIDTH - GAME_WIDTH
+LANE_COUNT = 2 # default; GameCore takes any number
+
+PLAYER_SIZE = 60
+PLAYER_CENTER_Y = SCREEN_HEIGHT - 80
+DEFAULT_POSTER_SIZE = (216, 320) # scaled poster width and height limit
+
+# --- Simulation timing ---
+SIMULATION_HZ = 60
+SIMULATION_DT = 1.0 / SIMULATION_HZ
+POSTER_SPEED = 120 # pixels per second (2px per tick at 60 Hz)
+
+# --- Game States ---
+TITLE_SCREEN = 0
+RUNNING = 1
+DONE = 2
+
+# --- Events reported by GameCore.tick() ---
+SPAWN = "spawn"   # (SPAWN, pair_index, titles by lane)
+SELECT = "select" # (SELECT, title, pair_index)
+NO_EVENTS = () # what a tick without events returns
+
+
+def load_movie_categories():
+    json_path = os.path.join(os.path.dirname(__file__), "data", "movies_by_category.json")
+    with open(json_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def make_movie_pairs(movie_categories, rng=random):
+    """Flattens every category, shuffles the movies and pairs them up."""
+    all_movies = []
+    for category, movies in movie_categories.items():
+        all_movies.extend(movies)
+
+    rng.shuffle(all_movies)
+    return list(zip(all_movies[0::2], all_movies[1::2]))  # pair every 2 items
+
+def lane_width(lane_count=LANE_COUNT):
+    return GAME_WIDTH // lane_count
+
+def lane_poster_size(lane_count=LANE_COUNT):
+    """(width, height limit) of posters on a road of lane_count lanes: the default 216:320, narrowed to fit a lane."""
+    width = min(DEFAULT_POSTER_SIZE[0], lane_width(lane_count) - 4)
+    return width, width * DEFAULT_POSTER_SIZE[1] // DEFAULT_POSTER_SIZE[0]
+
+def lane_center_x(lane, lane_count=LANE_COUNT):
+    width = lane_width(lane_count)
+    return lane * width + width // 2
+
+def spread_lanes(choices, lane_count):
+    """Lanes for the titles of a pair (or any number of choices), spread evenly across the road."""
+    if choices > lane_count:
+        raise ValueError(f"{choices} titles don't fit in {lane_count} lanes")
+    if choices == 1:
+        return [lane_count // 2]
+    return [round(i * (lane_count - 1) / (choices - 1)) for i in range(choices)]
+
+def lanes_covered(x, width, lane_count):
+    """The lanes an object spanning x .. x + width overlaps."""
+    lane_w = lane_width(lane_count)
+    first = max(0, min(lane_count - 1, x // lane_w))
+    last = max(0, min(lane_count - 1, (x + width - 1) // lane_w))
+    return range(first, last + 1)
+
+def rects_overlap(a, b):
+    """Same test as pygame.Rect.colliderect for (x, y, width, height) tuples."""
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return (aw > 0 and ah > 0 and bw > 0 and bh > 0
+            and ax < bx + bw and bx < ax + aw
+            and ay < by + bh and by < ay + ah)
+
+def first_tick_reaching(y, step, threshold):
+    """Smallest k >= 1 with round(y + k * step) >= threshold, for step > 0."""
+    k = max(1, math.ceil((threshold - 0.5 - y) / step))
+    # The estimate can be a tick off either way around .5 rounding
+    while k > 1 and round(y + (k - 1) * step) >= threshold:
+        k -= 1
+    while round(y + k * step) < threshold:
+        k += 1
+    return k
+
+
+class PosterState:
+    """
+    A falling poster. Its size comes from the image the front end will draw.
+    GameCore recycles them, so serial tells one spawn from the next.
+    """
+
+    __slots__ = ("lane", "title", "width", "height", "pair_index", "serial", "speed",
+                 "x", "y", "top", "prev_y", "alive")
+
+    def __init__(self, lane, title, width, height, pair_index=None, lane_count=LANE_COUNT, serial=0):
+        self.reset(lane, title, width, height, pair_index, lane_count, serial)
+
+    def reset(self, lane, title, width, height, pair_index=None, lane_count=LANE_COUNT, serial=0):
+        self.lane = lane
+        self.title = title
+        self.width = width
+        self.height = height
+        self.pair_index = pair_index # the pair it was spawned with; its sibling goes when it's picked
+        self.serial = serial
+        self.speed = POSTER_SPEED # pixels per second
+        self.x = lane_center_x(lane, lane_count) - width // 2
+        # Starts with its bottom edge at the top of the screen
+        self.y = float(-height) # exact position
+        self.top = -height # y rounded, used for collisions
+        self.prev_y = self.y # position at the previous tick, for interpolated drawing
+        self.alive = True
+
+    @property
+    def rect(self):
+        return (self.x, self.top, self.width, self.height)
+
+    def update(self, dt):
+        self.prev_y = self.y
+        self.y += self.speed * dt
+        self.top = round(self.y)
+        if self.top > SCREEN_HEIGHT:
+            self.alive = False
+
+
+class GameCore:
+    """
+    One game session. The front end feeds it input (start, move_left,
+    move_right, finish) and calls tick() at SIMULATION_HZ; tick() returns
+    what happened as SPAWN and SELECT events.
+
+    movie_pairs can be any sequence of (left, right) titles, such as the
+    lazily loaded src.catalog.PairSequence.
+
+    poster_size(title) -> (width, height) is asked when a poster spawns, so
+    the pygame front end can collide against the real image sizes.
+
+    The road has lane_count lanes; a pair's posters are spread across them
+    and a pair the player lets by is skipped. Normally the next pair spawns
+    once the last one is decided. With spawn_interval, a pair spawns every
+    spawn_interval ticks regardless, so many are in flight at once (the
+    stress mode). Posters are kept in per-lane buckets, and only the ones
+    sharing a lane with the player are tested for collisions.
+    """
+
+    def __init__(self, movie_pairs, poster_size=None, lane_count=LANE_COUNT, spawn_interval=None):
+        if lane_count < 2:
+            raise ValueError("the road needs at least 2 lanes")
+        self.poster_size = poster_size or (lambda title: DEFAULT_POSTER_SIZE)
+        self.lane_count = lane_count
+        self.lane_width = lane_width(lane_count)
+        self.spawn_interval = spawn_interval
+        self._pair_lanes = {}           # titles in a pair -> the lanes they spawn in
+        self._free_posters = []         # PosterStates that left the game, for the next spawns
+        self._serial = 0
+        self.posters = []
+        self.poster_generation = 0      # bumped whenever posters come or go
+        self.reset(movie_pairs)
+
+    def reset(self, movie_pairs):
+        """Back to the title screen with a new pair order."""
+        self.movie_pairs = movie_pairs
+        # Adaptive schedulers (src.scheduler) decide each pair from the outcome of the last
+        self._choose = getattr(movie_pairs, "choose", None)
+        self.state = TITLE_SCREEN
+        self.player_lane = 0
+        self._free_posters.extend(self.posters)
+        self.posters = []
+        self.poster_generation += 1
+        self.lanes = [[] for _ in range(self.lane_count)] # posters overlapping each lane
+        self.selections = []
+        self.current_pair_index = 0     # next pair to spawn
+        self.pair_active = False
+        self.ticks = 0
+
+    # --- Input ---
+
+    def start(self):
+        if self.state == TITLE_SCREEN:
+            self.state = RUNNING
+
+    def move_left(self):
+        if self.state == RUNNING and self.player_lane > 0:
+            self.player_lane -= 1
+
+    def move_right(self):
+        if self.state == RUNNING and self.player_lane < self.lane_count - 1:
+            self.player_lane += 1
+
+    def finish(self):
+        """The Done button: ends the session with the selections made so far."""
+        if self.state == RUNNING:
+            self.state = DONE
+
+    # --- Simulation ---
+
+    @property
+    def player_rect(self):
+        return (self.player_lane * self.lane_width + self.lane_width // 2 - PLAYER_SIZE // 2,
+                PLAYER_CENTER_Y - PLAYER_SIZE // 2, PLAYER_SIZE, PLAYER_SIZE)
+
+    def _spawn_pair(self):
+        pair_index = self.current_pair_index
+        titles = self.movie_pairs[pair_index]
+        lanes = self._pair_lanes.get(len(titles))
+        if lanes is None:
+            lanes = self._pair_lanes[len(titles)] = spread_lanes(len(titles), self.lane_count)
+        if self.spawn_interval is not None:
+            # Stress mode: rotate pairs across the road so every lane gets traffic
+            lanes = [(lane + pair_index) % self.lane_count for lane in lanes]
+
+        lane_width = self.lane_width
+        free = self._free_posters
+        for lane, title in zip(lanes, titles):
+            width, height = self.poster_size(title)
+            self._serial += 1
+            if free:
+                poster = free.pop()
+                poster.reset(lane, title, width, height, pair_index, self.lane_count, self._serial)
+            else:
+                poster = PosterState(lane, title, width, height, pair_index, self.lane_count, self._serial)
+            self.posters.append(poster)
+            lane_x = lane * lane_width
+            if lane_x <= poster.x and poster.x + width <= lane_x + lane_width:
+                self.lanes[lane].append(poster)
+            else:
+                # A poster wider than its lane is bucketed in every lane it reaches into
+                for covered in lanes_covered(poster.x, width, self.lane_count):
+                    self.lanes[covered].append(poster)
+        self.pair_active = True
+        self.current_pair_index += 1
+        self.poster_generation += 1
+        return (SPAWN, pair_index, titles)
+
+    def _remove_dead(self, passed_by=True):
+        if passed_by and self._choose is not None:
+            # Pairs whose last poster just left unpicked
+            gone = {poster.pair_index for poster in self.posters if not poster.alive}
+            gone.difference_update(poster.pair_index for poster in self.posters if poster.alive)
+            for pair_index in sorted(gone):
+                self._choose(pair_index, None)
+        self._free_posters.extend(poster for poster in self.posters if not poster.alive)
+        self.posters = [poster for poster in self.posters if poster.alive]
+        self.poster_generation += 1
+        if self.posters:
+            self.lanes = [[poster for poster in bucket if poster.alive] for bucket in self.lanes]
+        else:
+            self.lanes = [[] for _ in range(self.lane_count)]
+            if self.spawn_interval is None:
+                # The pair went by without a pick
+                self.pair_active = False
+
+    def tick(self, dt=SIMULATION_DT):
+        """
+        Advances the game by one fixed step of dt seconds and returns the events
+        it produced: a list, or the shared empty NO_EVENTS on the usual tick
+        where nothing happens, so that tick allocates nothing.
+        """
+        if self.state != RUNNING:
+            return NO_EVENTS
+
+        events = NO_EVENTS
+        self.ticks += 1
+
+        pairs_left = self.current_pair_index < len(self.movie_pairs)
+        if pairs_left and (not self.pair_active if self.spawn_interval is None
+                           else (self.ticks - 1) % self.spawn_interval == 0):
+            events = [self._spawn_pair()]
+
+        any_gone = False
+        for poster in self.posters:
+            poster.update(dt)
+            if not poster.alive:
+                any_gone = True
+        if any_gone:
+            self._remove_dead()
+
+        # Collision detection, against the posters in the player's lane only
+        player_rect = self.player_rect
+        for poster in self.lanes[self.player_lane]:
+            if rects_overlap(player_rect, (poster.x, poster.top, poster.width, poster.height)):
+                self.selections.append(poster.title)
+                if events is NO_EVENTS:
+                    events = []
+                events.append((SELECT, poster.title, poster.pair_index))
+                # The pick decides its pair: the other posters of it go too
+                for other in self.posters:
+                    if other.pair_index == poster.pair_index:
+                        other.alive = False
+                if self._choose is not None:
+                    self._choose(poster.pair_index, poster.title)
+                self._remove_dead(passed_by=False)
+                self.pair_active = False
+                break
+
+        if not self.posters and self.current_pair_index >= len(self.movie_pairs):
+            self.state = DONE
+
+        return events
+
+    def skip_ticks(self, max_ticks, dt=SIMULATION_DT):
+        """
+        Jumps over up to max_ticks ticks in which nothing but movement can
+        happen, stopping just before the tick where a poster hits the player
+        or leaves the screen. Returns how many were skipped; tick() takes
+        over from there. Used by headless runs to go straight from one
+        decision to the next.
+
+        Posters move by k * step in one go. With the default speed (2px a
+        tick) that is exactly where k ticks would have left them.
+        """
+        pairs_left = self.current_pair_index < len(self.movie_pairs)
+        if self.state != RUNNING or (self.spawn_interval is None and pairs_left and not self.pair_active):
+            return 0
+
+        player_x, player_y, _, _ = self.player_rect
+        skip = max_ticks
+        if self.spawn_interval is not None and pairs_left:
+            # Stop before the tick that spawns the next pair
+            skip = min(skip, -self.ticks % self.spawn_interval)
+        for poster in self.posters:
+            step = poster.speed * dt
+            if step <= 0:
+                continue
+            # Next event: touching the player (if in its lane) or dropping off the screen
+            threshold = SCREEN_HEIGHT + 1
+            # Only a poster still above the player's bottom edge can touch it; one that went by below is just leaving
+            if (poster.x < player_x + PLAYER_SIZE and player_x < poster.x + poster.width
+                    and poster.top < player_y + PLAYER_SIZE):
+                threshold = min(threshold, player_y - poster.height + 1)
+            skip = min(skip, first_tick_reaching(poster.y, step, threshold) - 1)
+
+        if skip > 0:
+            for poster in self.posters:
+                step = poster.speed * dt
+                poster.y += step * skip
+                poster.top = round(poster.y)
+                poster.prev_y = poster.y - step
+            self.ticks += skip
+            return skip
+        return 0
@@ -0,0 +1,100 @@
+# src/dirty_rects.py
+import pygame
+
+MAX_DIRTY_RECTS = 256 # a frame with more changed regions than this is flipped whole
+
+
+class DirtyRectTracker:
+    """
+    Collects the screen regions that changed during a frame and presents
+    only those with pygame.display.update(rects). A frame that was marked
+    with invalidate_all(), or that changed in more than MAX_DIRTY_RECTS
+    places, is presented with a full flip instead.
+
+    Counts the pixels pushed to the display so the dirty-rect path can be
+    compared with flipping the whole screen every frame.
+    """
+
+    def __init__(self, screen_size):
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self.rects = []
+        self.full = True                # first frame always pushes everything
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.frames = 0
+        self.pixels_pushed = 0
+        self.last_frame_pixels = 0
+
+    @property
+    def needs_full_redraw(self):
+        return self.full
+
+    def invalidate(self, rect):
+        rect = self.screen_rect.clip(rect)
+        if rect.width and rect.height:
+            self.rects.append(rect)
+
+    def invalidate_all(self):
+        self.full = True
+
+    def _merged_rects(self):
+        """
+        Overlapping regions are pushed once: one sort by left edge, then a
+        sweep that merges each rect with the open ones it touches. A rect is
+        closed once the sweep has passed its right edge, since nothing after
+        it starts further left. (A union can still reach back over a closed
+        rect; those few pixels are pushed twice, which is harmless.)
+        """
+        closed = []
+        open_rects = []
+        for rect in sorted(self.rects, key=lambda rect: rect.left):
+            rect = rect.copy()
+            still_open = []
+            for other in open_rects:
+                if other.right <= rect.left:
+                    closed.append(other)
+                elif rect.colliderect(other):
+                    rect.union_ip(other)
+                else:
+                    still_open.append(other)
+            # The union may have grown into open rects it missed
+            i = 0
+            while i < len(still_open):
+                if rect.colliderect(still_open[i]):
+                    rect.union_ip(still_open.pop(i))
+                    i = 0
+                else:
+                    i += 1
+            still_open.append(rect)
+            open_rects = still_open
+        return closed + open_rects
+
+    def present(self):
+        if len(self.rects) > MAX_DIRTY_RECTS:
+            # Cheaper to push everything than to merge and send that many
+            self.full = True
+        if self.full:
+            pygame.display.flip()
+            pixels = self.screen_rect.width * self.screen_rect.height
+        else:
+            rects = self._merged_rects()
+            if rects:
+                pygame.display.update(rects)
+            pixels = sum(rect.width * rect.height for rect in rects)
+
+        self.frames += 1
+        self.pixels_pushed += pixels
+        self.last_frame_pixels = pixels
+        self.rects = []
+        self.full = False
+
+    def stats(self):
+        screen_pixels = self.screen_rect.width * self.screen_rect.height
+        average = self.pixels_pushed / self.frames if self.frames else 0
+        return {
+            "frames": self.frames,
+            "last_frame_pixels": self.last_frame_pixels,
+            "avg_pixels_per_frame": round(average),
+            "avg_screen_fraction": round(average / screen_pixels, 3),
+        }
@@ -0,0 +1,295 @@
+# src/disk_cache.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+INDEX_FLUSH_INTERVAL = 5.0 # seconds a changed index may go unwritten; flush() or close() writes it sooner
+
+# Read once at import: os.umask() can only be queried by setting it, which isn't thread safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write(path, data):
+    """Writes bytes to path so readers only ever see the old or the new file, never half of one."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates owner-only files; give the result normal permissions
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class DiskCache:
+    """
+    Content-addressed cache for OMDb responses and poster bytes.
+
+    Blobs live under objects/<first two hex chars>/<sha256>, so identical
+    content is only stored once. index.json maps cache keys such as
+    "omdb:Die Hard" to a blob digest, its size, when it was last used and an
+    optional expiry time. When the stored bytes go over max_bytes the least
+    recently used keys are evicted first.
+
+    The entries are kept in least recently used order and the blob sizes and
+    reference counts are kept up to date as keys come and go, so a put costs
+    the same however big the cache is. The index is written at most every
+    INDEX_FLUSH_INTERVAL seconds by puts, and by flush() and close().
+
+    The lock only guards the index in memory. Blobs are read, hashed and
+    written outside it (a blob's name is its hash, so writing one twice is
+    harmless) and the index is written from a snapshot, so a reader never
+    waits for a disk sync. A value bigger than max_bytes is not stored.
+    """
+
+    def __init__(self, root, max_bytes=200 * 1024 * 1024, flush_interval=INDEX_FLUSH_INTERVAL, clock=time.time):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.clock = clock              # wall time, for last use and expiry
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock() # keeps index writes in snapshot order
+        self._entries = None            # loaded lazily from index.json, least recently used first
+        self._refcounts = {}            # digest -> keys pointing at the blob
+        self._blob_sizes = {}           # digest -> size of the blob
+        self._total_bytes = 0           # every blob counted once
+        self._dirty = False
+        self._flushed_at = time.monotonic()
+
+    # --- Paths and index ---
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest)
+
+    def _index_path(self):
+        return os.path.join(self.root, INDEX_FILENAME)
+
+    def _load_index(self):
+        if self._entries is not None:
+            return
+        entries = {}
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION:
+                entries = index.get("entries", {})
+        except (OSError, ValueError) as e:
+            if os.path.exists(self._index_path()):
+                print(f"Poster cache index unreadable, starting empty: {e}")
+        self._entries = dict(sorted(entries.items(), key=lambda item: item[1]["last_used"]))
+        for entry in self._entries.values():
+            self._add_ref(entry["digest"], entry["size"])
+
+    def flush(self):
+        """Writes the index to disk if anything changed since the last flush."""
+        with self._flush_lock:
+            with self._lock:
+                self._flushed_at = time.monotonic()
+                if not self._dirty:
+                    return
+                data = json.dumps({"version": INDEX_VERSION, "entries": self._entries}).encode("utf-8")
+                self._dirty = False
+            try:
+                atomic_write(self._index_path(), data)
+            except BaseException:
+                with self._lock:
+                    self._dirty = True
+                raise
+
+    def close(self):
+        self.flush()
+
+    def total_bytes(self):
+        with self._lock:
+            self._load_index()
+            return self._total_bytes
+
+    # Several keys can point at the same blob; its bytes are counted once
+    def _add_ref(self, digest, size):
+        count = self._refcounts.get(digest, 0)
+        if count == 0:
+            self._blob_sizes[digest] = size
+            self._total_bytes += size
+        self._refcounts[digest] = count + 1
+
+    def _drop_ref(self, digest):
+        """Drops one key's reference to a blob; returns True when that was the last one."""
+        count = self._refcounts[digest] - 1
+        if count:
+            self._refcounts[digest] = count
+            return False
+        del self._refcounts[digest]
+        self._total_bytes -= self._blob_sizes.pop(digest)
+        return True
+
+    # --- Reading and writing ---
+
+    def get_bytes(self, key):
+        """Returns the cached bytes for key, or None if missing, expired or corrupt."""
+        with self._lock:
+            self._load_index()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.get("expires") is not None and entry["expires"] < self.clock():
+                self._remove_key(key)
+                return None
+            digest = entry["digest"]
+
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                data = f.read()
+        except OSError:
+            self._remove_key_if(key, digest)
+            return None
+
+        # Content addressing doubles as an integrity check
+        if hashlib.sha256(data).hexdigest() != digest:
+            print(f"Poster cache entry {key} is corrupt, dropping it")
+            self._remove_key_if(key, digest)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["digest"] == digest:
+                entry["last_used"] = self.clock()
+                # Most recently used goes last
+                self._entries[key] = self._entries.pop(key)
+                self._dirty = True
+        return data
+
+    def put_bytes(self, key, data, ttl=None):
+        """
+        Stores data under key. A ttl in seconds makes the entry expire (used for
+        negative results). Returns False, storing nothing, if data alone is
+        bigger than the cache.
+        """
+        if len(data) > self.max_bytes:
+            print(f"Poster cache entry {key} ({len(data)} bytes) is bigger than the whole cache, not storing it")
+            return False
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        while True:
+            if not os.path.exists(path):
+                try:
+                    atomic_write(path, data)
+                except FileNotFoundError:
+                    continue # its directory was removed as empty meanwhile
+            with self._lock:
+                self._load_index()
+                # An eviction may have deleted the blob since; blobs with a key are never deleted
+                if os.path.exists(path):
+                    self._insert(key, digest, len(data), ttl)
+                    flush = time.monotonic() - self._flushed_at >= self.flush_interval
+                    break
+        if flush:
+            self.flush()
+        return True
+
+    def _insert(self, key, digest, size, ttl):
+        previous = self._entries.pop(key, None)
+        now = self.clock()
+        self._entries[key] = {
+            "digest": digest,
+            "size": size,
+            "last_used": now,
+            "expires": now + ttl if ttl is not None else None,
+        }
+        self._add_ref(digest, size)
+        self._dirty = True
+        if previous is not None and self._drop_ref(previous["digest"]):
+            self._delete_blob(previous["digest"])
+        self._evict(keep=key)
+
+    def get_json(self, key):
+        data = self.get_bytes(key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data.decode("utf-8"))
+        except ValueError:
+            self.discard(key)
+            return None
+
+    def put_json(self, key, value, ttl=None):
+        self.put_bytes(key, json.dumps(value, sort_keys=True).encode("utf-8"), ttl=ttl)
+
+    def discard(self, key):
+        with self._lock:
+            self._load_index()
+            self._remove_key(key)
+
+    # --- Eviction and integrity ---
+
+    def _remove_key_if(self, key, digest):
+        """Drops key if it still points at digest (it may have been stored again meanwhile)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["digest"] == digest:
+                self._remove_key(key)
+
+    def _remove_key(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._dirty = True
+        if self._drop_ref(entry["digest"]):
+            self._delete_blob(entry["digest"])
+
+    def _delete_blob(self, digest):
+        path = self._object_path(digest)
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        try:
+            # Fails, as it should, while other blobs are left in it
+            os.rmdir(os.path.dirname(path))
+        except OSError:
+            pass
+
+    def _evict(self, keep):
+        # Oldest first, never keep (the key just stored); a blob's bytes are freed once its last key is gone
+        while self._total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                break
+            self._remove_key(oldest)
+
+    def verify(self):
+        """
+        Re-hashes every cached blob and drops entries whose bytes are missing
+        or don't match their digest. Returns the list of keys that were dropped.
+        """
+        with self._lock:
+            self._load_index()
+            bad_keys = []
+            checked = {}
+            for key, entry in list(self._entries.items()):
+                digest = entry["digest"]
+                if digest not in checked:
+                    try:
+                        with open(self._object_path(digest), "rb") as f:
+                            checked[digest] = hashlib.sha256(f.read()).hexdigest() == digest
+                    except OSError:
+                        checked[digest] = False
+                if not checked[digest]:
+                    bad_keys.append(key)
+
+            for key in bad_keys:
+                self._remove_key(key)
+        self.flush()
+        return bad_keys
@@ -0,0 +1,120 @@
+# src/fonts.py
+"""
+Fonts that are opened on first use.
+
+pygame.font.SysFont() scans every installed font the first time it is
+called, which can take hundreds of milliseconds on hosts with many fonts.
+FontCache keeps the file each system font name resolved to in a small
+JSON file, so later starts open that file directly and skip the scan.
+Names that didn't resolve are remembered too (as pygame's default font);
+delete the file after installing new fonts.
+"""
+import json
+import os
+
+import pygame
+
+from src.disk_cache import atomic_write
+
+FONT_PATHS_VERSION = 1
+
+
+def _open_font(path, size, bold, italic):
+    # Same as the font pygame.font.SysFont() would build
+    font = pygame.font.Font(path, size)
+    if bold:
+        font.set_bold(True)
+    if italic:
+        font.set_italic(True)
+    return font
+
+
+class LazyFont:
+    """Stands in for a pygame Font and opens it the first time it is used."""
+
+    __slots__ = ("_cache", "_key", "_font")
+
+    def __init__(self, cache, key):
+        self._cache = cache
+        self._key = key
+        self._font = None
+
+    def resolve(self):
+        if self._font is None:
+            self._font = self._cache._load(*self._key)
+        return self._font
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __repr__(self):
+        name, size, bold, italic = self._key
+        state = "loaded" if self._font is not None else "not loaded"
+        return f"<LazyFont {name or 'default'} {size}{' bold' if bold else ''}{' italic' if italic else ''}, {state}>"
+
+
+class FontCache:
+    """
+    Hands out one LazyFont per (name, size, style), so fonts can be used as
+    cache keys. path is the JSON file of resolved system font files, or
+    None to resolve them every run.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._fonts = {}                # (name, size, bold, italic) -> LazyFont
+        self._resolved = None           # "name|bold|italic" -> [file or None, fake bold, fake italic]
+        self.scans = 0                  # SysFont lookups that weren't in the file
+
+    def font(self, size):
+        """pygame's default font."""
+        return self.sysfont(None, size)
+
+    def sysfont(self, name, size, bold=False, italic=False):
+        key = (name, size, bool(bold), bool(italic))
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = LazyFont(self, key)
+        return font
+
+    def _load(self, name, size, bold, italic):
+        if name is None:
+            return pygame.font.Font(None, size)
+        path, fake_bold, fake_italic = self._resolve(name, bold, italic)
+        return _open_font(path, size, fake_bold, fake_italic)
+
+    def _read_resolved(self):
+        self._resolved = {}
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == FONT_PATHS_VERSION:
+                self._resolved = data["fonts"]
+        except (OSError, ValueError, KeyError):
+            pass # no file yet, or an unreadable one: resolve again
+
+    def _resolve(self, name, bold, italic):
+        if self._resolved is None:
+            self._read_resolved()
+
+        key = f"{name}|{int(bold)}|{int(italic)}"
+        entry = self._resolved.get(key)
+        if entry is not None and (entry[0] is None or os.path.exists(entry[0])):
+            return entry
+
+        # Let SysFont do the search and keep what it would have opened
+        found = []
+        pygame.font.SysFont(name, 1, bold, italic, constructor=lambda *args: found.append(args))
+        path, _, fake_bold, fake_italic = found[0]
+        entry = self._resolved[key] = [path, fake_bold, fake_italic]
+        self.scans += 1
+
+        if self.path:
+            data = {"version": FONT_PATHS_VERSION, "fonts": self._resolved}
+            try:
+                atomic_write(self.path, json.dumps(data, indent=1).encode("utf-8"))
+            except OSError as e:
+                print(f"Font path cache not written: {e}")
+        return entry
@@ -1,34 +1,86 @@
 import pygame
+import bisect
+import functools
 import random
 import sys
-import json
+import time
 import os
 import requests
+from collections import OrderedDict, deque
 from io import BytesIO
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
-
-pygame.init()
+from src.core import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, GAME_WIDTH, PANEL_X, PANEL_WIDTH, PLAYER_SIZE, SIMULATION_DT,
+    TITLE_SCREEN, RUNNING, DONE, SPAWN, SELECT,
+    GameCore, lane_poster_size
+)
+from src.catalog import CATALOG_DB_PATH, open_catalog
+from src.choices import RANKING_FILENAME, ChoiceLog, EloRanking
+from src.dirty_rects import DirtyRectTracker
+from src.disk_cache import DiskCache
+from src.fonts import FontCache
+from src.http_client import HttpClient
+from src.layers import LayerCache
+from src.poster_assets import COMPILED_POSTER_DIR, CompiledPosters, make_thumbnail, thumbnail_surface
+from src.prefetch import PosterPrefetcher
+from src.profiler import FrameProfiler, NullProfiler
+from src.replay import (
+    START, LEFT, RIGHT, FINISH, RESET, SIZES, PANEL_SCROLL, RESULTS_SCROLL, RENDER_MODE, CHECKPOINT,
+    Replayer, SessionRecorder
+)
+from src.scheduler import DEFAULT_POOL_SIZE, make_pairs
+from src.surface_cache import SurfaceCache
+from src.text import TextRenderer
 
 # Suppress the warning caused by setting verify=False
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
 # --- API Configuration ---
 OMDB_API_KEY = "70e7e6d9" 
-OMDB_URL = "http://www.omdbapi.com"
-
+OMDB_URL = os.environ.get("OMDB_URL", "http://www.omdbapi.com") # override to point at a stub server
+
+# --- HTTP Client ---
+# One pooled keep-alive session per host; the game never waits on a request forever
+HTTP_CONNECT_TIMEOUT = 3.05
+HTTP_READ_TIMEOUT = 10
+HTTP_RETRIES = 2
+HTTP_FAILURE_THRESHOLD = 5 # consecutive failures before a host is skipped
+HTTP_RESET_TIMEOUT = 30 # seconds before a skipped host is tried again
+
+# SSL verification stays off (see the SSL bypass below), for OMDb and the image host alike
+http_client = HttpClient(
+    connect_timeout=HTTP_CONNECT_TIMEOUT,
+    read_timeout=HTTP_READ_TIMEOUT,
+    retries=HTTP_RETRIES,
+    failure_threshold=HTTP_FAILURE_THRESHOLD,
+    reset_timeout=HTTP_RESET_TIMEOUT,
+    verify=False
+)
 
-# --- Screen and layout ---
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-GAME_WIDTH = int(SCREEN_WIDTH * 0.65)
-PANEL_X = GAME_WIDTH
-PANEL_WIDTH = SCREEN_WIDTH - GAME_WIDTH
-LANE_COUNT = 2
-LANE_WIDTH = GAME_WIDTH // LANE_COUNT
 
 # --- Local Asset Path ---
-# Points to a folder named 'assets/posters' one directory up from 'src'
-POSTER_ASSET_DIR = os.path.join(os.path.dirname(__file__), "..", "assets", "posters")
+# Points to the 'assets/posters' folder inside 'src'
+POSTER_ASSET_DIR = os.path.join(os.path.dirname(__file__), "assets", "posters")
+
+# Pre-scaled posters written by `python -m src.poster_assets build`; used before POSTER_ASSET_DIR
+compiled_posters = CompiledPosters(COMPILED_POSTER_DIR)
+
+# --- Poster Disk Cache ---
+# OMDb responses and downloaded poster bytes are kept between runs.
+# Set POSTER_CACHE_DIR to move the cache somewhere else.
+POSTER_CACHE_DIR = os.environ.get(
+    "POSTER_CACHE_DIR", os.path.join(os.path.dirname(__file__), "..", ".cache", "posters")
+)
+POSTER_CACHE_MAX_BYTES = 200 * 1024 * 1024
+OMDB_NEGATIVE_TTL = 24 * 60 * 60 # re-ask OMDb about missing posters once a day
+
+poster_cache = DiskCache(POSTER_CACHE_DIR, POSTER_CACHE_MAX_BYTES)
+
+# --- Decoded Poster Surfaces ---
+# RAM budget for scaled poster surfaces kept across pairs and resets
+POSTER_SURFACE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+poster_surface_cache = SurfaceCache(POSTER_SURFACE_CACHE_MAX_BYTES)
 
 # --- Colors ---
 GREEN = (80, 150, 80)  # grassy background
@@ -44,23 +96,117 @@ SCROLL_TRACK_COLOR = (120, 120, 120)
 SCROLL_THUMB_COLOR = (190, 190, 190)
 RESULTS_BOX_BG = (40, 40, 40) # background for the movie list box
 RESET_BUTTON_COLOR = (50, 50, 150) # color for the reset button
-
-# --- Game States ---
-TITLE_SCREEN = 0
-RUNNING = 1
-DONE = 2
+POSTER_PLACEHOLDER_COLOR = (45, 45, 45) # shown while a poster is still loading
+PLAYER_COLOR = (255, 200, 50)
+
+# --- Poster Prefetching ---
+PREFETCH_LOOKAHEAD = 3 # number of upcoming pairs resolved in the background
+PREFETCH_WORKERS = 2
+
+# --- Movie Catalog ---
+# Built with `python -m src.catalog build`; without it the JSON is loaded into an in-memory catalog.
+# MOVIE_CATEGORIES="Comedy,Drama" limits the pairs to those categories.
+MOVIE_CATALOG_PATH = os.environ.get("MOVIE_CATALOG", CATALOG_DB_PATH)
+MOVIE_CATEGORIES = [name.strip() for name in os.environ["MOVIE_CATEGORIES"].split(",")] \
+    if os.environ.get("MOVIE_CATEGORIES") else None
+
+# --- Choice Log ---
+# Every pick is kept in CHOICE_LOG_DIR as a (winner, loser) preference, across
+# sessions; Tab on the results screen switches to the all-time ranking built from it.
+CHOICE_LOG_DIR = os.environ.get(
+    "CHOICE_LOG_DIR", os.path.join(os.path.dirname(__file__), "..", ".data", "choices")
+)
+RANKING_SIZE = 100 # titles listed in the all-time ranking
+TOGGLE_RANKING_KEY = pygame.K_TAB
+
+# --- Pair Scheduler ---
+# PAIR_SCHEDULER=sort ranks the catalog (or a pool of RANKING_POOL titles) with as
+# few picks as a merge sort needs (RANKING_TOP_K=10: only the best 10, by binary
+# insertion); PAIR_SCHEDULER=information asks for the most uncertain pair each time.
+# The default, random, shows the catalog in shuffled pairs.
+PAIR_SCHEDULER = os.environ.get("PAIR_SCHEDULER", "random")
+RANKING_POOL = int(os.environ["RANKING_POOL"]) if os.environ.get("RANKING_POOL") else DEFAULT_POOL_SIZE
+RANKING_TOP_K = int(os.environ.get("RANKING_TOP_K", "0"))
+
+# --- Lanes ---
+# LANES=4 puts more lanes on the road; posters shrink to fit them.
+# STRESS_SPAWN_INTERVAL=2 spawns a pair every 2 ticks whatever gets picked,
+# to profile hundreds of posters falling at once.
+LANE_COUNT = int(os.environ.get("LANES", "2"))
+STRESS_SPAWN_INTERVAL = int(os.environ.get("STRESS_SPAWN_INTERVAL", "0")) or None
+
+# --- Rendering ---
+# Dirty-rect mode only repaints what moved and pushes those rects to the display
+# instead of flipping all 800x600 pixels. F3 toggles it while playing.
+DIRTY_RECT_RENDERING = os.environ.get("DIRTY_RECTS", "0") == "1"
+TOGGLE_RENDER_MODE_KEY = pygame.K_F3
+
+# --- Frame profiling ---
+# PROFILE_FRAMES=1 times every phase of the loop and reports slow frames, along
+# with the prefetch, surface cache and dirty-rect stats;
+# PROFILE_TRACE=<file> also writes a Chrome trace there on exit. F2 shows the overlay.
+PROFILE_TRACE_PATH = os.environ.get("PROFILE_TRACE")
+PROFILE_FRAMES = os.environ.get("PROFILE_FRAMES", "0") == "1" or bool(PROFILE_TRACE_PATH)
+TOGGLE_PROFILER_OVERLAY_KEY = pygame.K_F2
+
+# --- Simulation timing ---
+# The core advances in fixed SIMULATION_DT ticks whatever the frame rate;
+# rendering draws posters interpolated between the last two ticks.
+RENDER_FPS = int(os.environ.get("RENDER_FPS", "60")) # 0 renders as fast as possible
+SIMULATION_SPEED = float(os.environ.get("SIMULATION_SPEED", "1")) # >1 fast-forwards, many ticks per frame
+MAX_FRAME_TIME = 0.25 # longer stalls (window drag, breakpoints) are not caught up
 
 # --- Game setup ---
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Pick Your Favorite Movie!")
-clock = pygame.time.Clock()
-font = pygame.font.Font(None, 36)
+# Created by init_display(), so importing this module never opens a window
+screen = None
+clock = None
+font = None
 
 # Dedicated fonts for game experience
-TITLE_FONT = pygame.font.SysFont('Consolas', 72, bold=True) # Pixel-art style font simulation
-INSTRUCTION_FONT = pygame.font.Font(None, 30)
-SUMMARY_TITLE_FONT = pygame.font.SysFont('Consolas', 48, bold=True) # Similar style for results
-RESET_SYMBOL_FONT = pygame.font.Font(None, 40) # Font for the arrow symbol
+TITLE_FONT = None
+INSTRUCTION_FONT = None
+SUMMARY_TITLE_FONT = None
+RESET_SYMBOL_FONT = None
+RESULTS_LIST_FONT = None
+RESULTS_HINT_FONT = None
+
+# Fonts open on first use; the files system font names resolved to are remembered
+# in FONT_CACHE_PATH so later starts skip pygame's font scan
+FONT_CACHE_PATH = os.environ.get(
+    "FONT_CACHE_PATH", os.path.join(os.path.dirname(__file__), "..", ".cache", "fonts.json")
+)
+fonts = FontCache(FONT_CACHE_PATH)
+
+# All in-game text is drawn and measured here, so wrapping and drawing use the same
+# metrics; text_renderer.measure() stands in for font.size()
+text_renderer = TextRenderer()
+
+def init_display():
+    """Starts the display and font subsystems and opens the window. Safe to call more than once."""
+    global screen, clock, font
+    global TITLE_FONT, INSTRUCTION_FONT, SUMMARY_TITLE_FONT, RESET_SYMBOL_FONT, RESULTS_LIST_FONT, RESULTS_HINT_FONT
+    if screen is not None:
+        return screen
+
+    # Only what the game uses; pygame.init() would also bring up audio and joysticks
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Pick Your Favorite Movie!")
+    clock = pygame.time.Clock()
+    font = fonts.font(36)
+
+    TITLE_FONT = fonts.sysfont('Consolas', 72, bold=True) # Pixel-art style font simulation
+    INSTRUCTION_FONT = fonts.font(30)
+    SUMMARY_TITLE_FONT = fonts.sysfont('Consolas', 48, bold=True) # Similar style for results
+    RESET_SYMBOL_FONT = fonts.font(40) # Font for the arrow symbol
+    RESULTS_LIST_FONT = fonts.font(36) # Font for the final movie list
+    RESULTS_HINT_FONT = fonts.font(22) # Key hint under the list
+    return screen
+
+# Title screen, lane background, panel chrome and results header are rendered once
+# per screen size and font set, then blitted every frame
+static_layers = LayerCache()
 
 def wrap_text_multi(text, font, max_width):
     """
@@ -73,7 +219,7 @@ def wrap_text_multi(text, font, max_width):
 
     for word in words:
         test_line = (current_line + " " + word).strip()
-        if font.size(test_line)[0] <= max_width:
+        if text_renderer.measure(font, test_line)[0] <= max_width:
             current_line = test_line
         else:
             lines.append(current_line)
@@ -84,94 +230,167 @@ def wrap_text_multi(text, font, max_width):
 
     return lines
 
+# Shared layout cache: titles never change, so each (text, font, width) is wrapped once
+TEXT_LAYOUT_CACHE_SIZE = 4096
+
+@functools.lru_cache(maxsize=TEXT_LAYOUT_CACHE_SIZE)
+def layout_text(text, font, max_width):
+    """Cached wrap_text_multi(); returns the lines as a tuple so callers can't mutate the shared entry."""
+    return tuple(wrap_text_multi(text, font, max_width))
+
 # --- HELPER FUNCTIONS ---
 
-def load_image_from_url(url, width, height_limit):
-    """Downloads an image from a URL and returns a scaled Pygame Surface."""
+def scale_poster_surface(image_surface, width, height_limit):
+    """Scales a poster to a fixed width, keeping its aspect ratio up to height_limit."""
+    # 1. Calculate new height based on fixed width (216) and aspect ratio
+    new_height = int(width * (image_surface.get_height() / image_surface.get_width()))
+    # 2. Apply the height limit (320)
+    final_height = min(new_height, height_limit)
+
+    # 3. Scale the image
+    return pygame.transform.scale(image_surface, (width, final_height))
+
+def omdb_cache_key(title):
+    return "omdb:" + title
+
+def image_cache_key(url):
+    return "image:" + url
+
+def thumbnail_cache_key(title):
+    return "thumb:" + title
+
+def local_poster_path(title):
+    """Path of the poster shipped in POSTER_ASSET_DIR for a title, or None."""
+    for ext in ['.jpg', '.png']:
+        local_path = os.path.join(POSTER_ASSET_DIR, title + ext)
+        if os.path.exists(local_path):
+            return local_path
+    return None
+
+def fetch_image_bytes(url):
+    """Returns the raw bytes of an image, from the disk cache when possible."""
+    cache_key = image_cache_key(url)
+    image_bytes = poster_cache.get_bytes(cache_key)
+    if image_bytes is not None:
+        return image_bytes
+
+    # verify=False is applied by http_client for the image host too
+    response = http_client.get(url)
+    response.raise_for_status() # Check for bad status codes
+
+    poster_cache.put_bytes(cache_key, response.content)
+    return response.content
+
+def fetch_omdb_metadata(title, api_key):
+    """
+    Returns the OMDb JSON response for a title, from the disk cache when possible.
+    "Not found" answers are cached too, but expire after OMDB_NEGATIVE_TTL.
+    """
+    cache_key = omdb_cache_key(title)
+    data = poster_cache.get_json(cache_key)
+    if data is not None:
+        return data
+
+    params = {
+        't': title,      # Search by exact title
+        'apikey': api_key,
+        'plot': 'short'
+    }
+
+    # SSL Bypass is kept (http_client uses verify=False) to resolve the certificate error
+    response = http_client.get(OMDB_URL, params=params)
+    data = response.json()
+
+    if data.get('Response') == 'True' and data.get('Poster') not in ('N/A', None):
+        poster_cache.put_json(cache_key, data)
+    elif data.get('Response') == 'True' or 'not found' in data.get('Error', '').lower():
+        # Only cache real "no poster" answers, not quota or API key errors
+        poster_cache.put_json(cache_key, data, ttl=OMDB_NEGATIVE_TTL)
+
+    return data
+
+def download_poster_surface(url, width, height_limit):
+    """Downloads an image from a URL and returns a scaled Pygame Surface, or None on failure."""
     try:
-        # --- CRITICAL CHANGE: Added verify=False here ---
-        response = requests.get(url, verify=False)
-        response.raise_for_status() # Check for bad status codes
-        
-        image_file = BytesIO(response.content)
+        image_file = BytesIO(fetch_image_bytes(url))
         image_surface = pygame.image.load(image_file).convert_alpha()
-
-        # NEW SCALING LOGIC
-        original_width = image_surface.get_width()
-        original_height = image_surface.get_height()
-        
-        # 1. Calculate new height based on fixed width (216) and aspect ratio
-        new_height = int(width * (original_height / original_width))
-        # 2. Apply the height limit (320)
-        final_height = min(new_height, height_limit)
-        
-        # 3. Scale the image
-        return pygame.transform.scale(image_surface, (width, final_height))
+        return scale_poster_surface(image_surface, width, height_limit)
     except requests.exceptions.RequestException as e:
         print(f"Error fetching image from URL {url}: {e}")
     except pygame.error as e:
         print(f"Error loading image into Pygame: {e}")
-    
-    # Return a default colored surface on failure
-    default_surface = pygame.Surface((width, height_limit))
-    default_surface.fill(GRAY)
-    return default_surface
+    return None
 
-def get_poster_image(title, api_key, poster_width=216, poster_height_limit=320):
+def load_poster_surface(title, api_key, poster_width, poster_height_limit):
     """
-    Attempts to load a poster image: 
+    Decodes a poster image: 
+    0. From compiled (pre-scaled) assets based on title.
     1. From local assets based on title.
     2. From OMDb API if local image is not found.
-    3. Returns a fallback surface if both fail.
+    Returns None if all fail.
     """
+
+    # ----------------------------------------------------
+    # 0. ATTEMPT COMPILED ASSET LOAD (no decode, no scaling)
+    # ----------------------------------------------------
+    image_surface = compiled_posters.load(title, poster_width, poster_height_limit)
+    if image_surface is not None:
+        return image_surface
     
     # ----------------------------------------------------
     # 1. ATTEMPT LOCAL FILE LOAD (PRIORITY)
     # ----------------------------------------------------
-    for ext in ['.jpg', '.png']:
-        local_path = os.path.join(POSTER_ASSET_DIR, title + ext)
-        if os.path.exists(local_path):
-            try:
-                print(f"Loading local poster for {title}...")
-                image_surface = pygame.image.load(local_path).convert_alpha()
-
-                # LOCAL SCALING LOGIC
-                new_height = int(poster_width * (image_surface.get_height() / image_surface.get_width()))
-                final_height = min(new_height, poster_height_limit)
-
-                return pygame.transform.scale(image_surface, (poster_width, final_height))
-            except pygame.error as e:
-                print(f"Error loading local image {local_path}: {e}. Trying API next.")
-                # Continue to API if local load fails
-                break
+    local_path = local_poster_path(title)
+    if local_path is not None:
+        try:
+            print(f"Loading local poster for {title}...")
+            image_surface = pygame.image.load(local_path).convert_alpha()
+            return scale_poster_surface(image_surface, poster_width, poster_height_limit)
+        except pygame.error as e:
+            # Continue to API if local load fails
+            print(f"Error loading local image {local_path}: {e}. Trying API next.")
 
     # ----------------------------------------------------
     # 2. ATTEMPT API LOAD (FALLBACK)
     # ----------------------------------------------------
     try:
-        params = {
-            't': title,      # Search by exact title
-            'apikey': api_key,
-            'plot': 'short'
-        }
-        
-        # SSL Bypass is kept here to resolve the certificate error
-        response = requests.get(OMDB_URL, params=params, verify=False) 
-        data = response.json()
+        data = fetch_omdb_metadata(title, api_key)
 
         if data.get('Response') == 'True' and data.get('Poster') not in ('N/A', None):
             poster_url = data['Poster']
             print(f"Fetched poster URL for {title}: {poster_url}")
             # Pass width and height_limit to loader
-            return load_image_from_url(poster_url, poster_width, poster_height_limit)
+            return download_poster_surface(poster_url, poster_width, poster_height_limit)
         else:
             print(f"API Failed: Poster not found for {title}. OMDb response: {data.get('Error', 'N/A')}")
 
     except Exception as e:
         print(f"API Failed: An error occurred during OMDb lookup for {title}: {e}")
 
+    return None
+
+def get_poster_image(title, api_key, poster_width=216, poster_height_limit=320):
+    """
+    Returns the poster for a title, scaled to poster_width (height capped at
+    poster_height_limit). Decoded posters are kept in poster_surface_cache, so
+    a title that was shown before costs a dictionary lookup.
+    Returns a fallback surface if the poster can't be loaded.
+    """
+    cache_key = (title, poster_width, poster_height_limit)
+    image_surface = poster_surface_cache.get(cache_key)
+    if image_surface is not None:
+        return image_surface
+
+    image_surface = load_poster_surface(title, api_key, poster_width, poster_height_limit)
+    if image_surface is not None:
+        poster_surface_cache.put(cache_key, image_surface)
+        # Next time the poster has to load, its thumbnail can stand in meanwhile
+        if poster_thumbnail(title) is None:
+            poster_cache.put_json(thumbnail_cache_key(title), make_thumbnail(image_surface))
+        return image_surface
+
     # ----------------------------------------------------
-    # 3. RETURN FALLBACK (if both failed)
+    # RETURN FALLBACK (if both failed)
     # ----------------------------------------------------
     # Fallback: return a randomly colored surface
     print(f"Using default fallback surface for {title}")
@@ -180,113 +399,282 @@ def get_poster_image(title, api_key, poster_width=216, poster_height_limit=320):
     default_surface.fill((random.randint(100, 200), random.randint(100, 200), random.randint(100, 200)))
     return default_surface
 
+def make_placeholder_surface(width=216, height=320):
+    """Plain surface shown in place of a poster that hasn't finished loading."""
+    placeholder = pygame.Surface((width, height))
+    placeholder.fill(POSTER_PLACEHOLDER_COLOR)
+    return placeholder
+
+@functools.lru_cache(maxsize=16)
+def placeholder_surface(width=216, height=320):
+    """One shared placeholder per size; it is only ever blitted, never drawn on."""
+    return make_placeholder_surface(width, height)
+
+def poster_thumbnail(title):
+    """The thumbnail of a poster that was compiled or decoded before, or None."""
+    return compiled_posters.thumbnail(title) or poster_cache.get_json(thumbnail_cache_key(title))
+
+def poster_preview(title, width=216, height_limit=320):
+    """
+    Shown straight away for a poster that hasn't loaded: its thumbnail scaled
+    up to size, so the poster keeps its shape when the real one is swapped
+    in. None for a title never seen before. It reads the disk cache, so the
+    prefetcher makes it on a worker; the frame loop only picks it up.
+    """
+    thumbnail = poster_thumbnail(title)
+    if thumbnail is None:
+        return None
+    return thumbnail_surface(thumbnail, width, height_limit).convert()
+
 # --- Classes ---
 
-class Player(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        self.image = pygame.Surface((60, 60))
-        self.image.fill((255, 200, 50))
-        self.rect = self.image.get_rect()
-        self.lane = 0
-        self.update_position()
-
-    def update_position(self):
-        lane_center = self.lane * LANE_WIDTH + LANE_WIDTH // 2
-        self.rect.center = (lane_center, SCREEN_HEIGHT - 80)
-
-    def move_left(self):
-        if self.lane > 0:
-            self.lane -= 1
-            self.update_position()
-
-    def move_right(self):
-        if self.lane < LANE_COUNT - 1:
-            self.lane += 1
-            self.update_position()
-
-
-class Poster(pygame.sprite.Sprite):
-    def __init__(self, lane, title, image_surface): 
-        super().__init__()
-        self.image = image_surface
-        self.rect = self.image.get_rect()
-        self.lane = lane
-        self.title = title
-        self.rect.centerx = lane * LANE_WIDTH + LANE_WIDTH // 2
-        
-        # CHANGED: Align the poster by its bottom edge, starting it at Y=0 (the top of the screen).
-        # Pygame automatically calculates rect.y = rect.bottom - rect.height.
-        self.rect.bottom = 0
-        
-        self.speed = 2
-        self.title_surface = font.render(self.title, True, WHITE)
+def make_player_surface():
+    player_image = pygame.Surface((PLAYER_SIZE, PLAYER_SIZE))
+    player_image.fill(PLAYER_COLOR)
+    return player_image
 
-    def update(self):
-        self.rect.y += self.speed
-        if self.rect.top > SCREEN_HEIGHT:
-            self.kill()
 
-    def draw(self, surface):
-        # --- Poster image ---
-        surface.blit(self.image, self.rect)
-    
-        # --- Title box constants & preparation ---
-        title_box_width = self.rect.width
-        title_box_x = self.rect.left
-        title_box_y = self.rect.bottom + 15
-        
-        # Wrapped text preparation
-        max_text_width = title_box_width - 10  # small padding
-        lines = wrap_text_multi(self.title, font, max_text_width)
-        
-        line_surfaces = []
-        total_text_height = 0
-        line_spacing = 2
-        vertical_padding = 10 
-        
-        # 1. Calculate total height and prepare surfaces (Dynamic Height)
-        for line in lines:
-            line_surface = font.render(line, True, WHITE)
-            line_surfaces.append(line_surface)
-            total_text_height += line_surface.get_height()
-            
-        # Add spacing between lines, and top/bottom padding
-        if line_surfaces:
-            total_text_height += (len(line_surfaces) - 1) * line_spacing
-            total_text_height += vertical_padding
-            
-        title_box_height = max(total_text_height, 20) # Min height
-    
-        # 2. Draw the title box
-        title_box_rect = pygame.Rect(
-            title_box_x,
-            title_box_y,
-            title_box_width,
-            title_box_height
+TITLE_BOX_GAP = 15           # space between a poster and its title box
+TITLE_BOX_LINE_SPACING = 2
+TITLE_BOX_VERTICAL_PADDING = 10
+TITLE_BOX_BG = (0, 0, 0, 80) # transparent black, helps reading
+
+def premultiplied_text(text_surface, color):
+    """
+    Premultiplied-alpha copy of a rendered line. The glyphs are first copied
+    onto a fresh surface of the text colour (only alpha varies across a
+    rendered line) because premul_alpha() on a Font.render() surface itself
+    comes out shifted.
+    """
+    clean = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
+    clean.fill((*color, 0))
+    clean.blit(text_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+    return clean.premul_alpha()
+
+@functools.lru_cache(maxsize=256)
+def render_title_box(title, box_width):
+    """
+    Composes a poster's title box once: a faint background with the wrapped
+    title centred on it. Shared between posters with the same title and width.
+    """
+    # Wrapped text preparation
+    max_text_width = box_width - 10  # small padding
+    line_surfaces = [text_renderer.render(font, line, WHITE) for line in layout_text(title, font, max_text_width)]
+
+    # 1. Calculate total height (Dynamic Height)
+    total_text_height = sum(line_surface.get_height() for line_surface in line_surfaces)
+
+    # Add spacing between lines, and top/bottom padding
+    if line_surfaces:
+        total_text_height += (len(line_surfaces) - 1) * TITLE_BOX_LINE_SPACING
+        total_text_height += TITLE_BOX_VERTICAL_PADDING
+
+    box_height = max(total_text_height, 20) # Min height
+
+    # 2. Draw the title box background
+    # The box is kept in premultiplied alpha so the text composited onto it
+    # blends with the screen exactly as if each line were blitted separately
+    box = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+    box.fill(TITLE_BOX_BG)
+    box = box.premul_alpha()
+
+    # 3. Draw Centered Text
+    y_offset = TITLE_BOX_VERTICAL_PADDING // 2 # Start with top padding (5px)
+    for line_surface in line_surfaces:
+        # Calculate X position for centering (Centered Text)
+        centered_x = (box_width - line_surface.get_width()) // 2
+        box.blit(premultiplied_text(line_surface, WHITE), (centered_x, y_offset),
+                 special_flags=pygame.BLEND_PREMULTIPLIED)
+        y_offset += line_surface.get_height() + TITLE_BOX_LINE_SPACING
+
+    return box
+
+
+class Poster:
+    """
+    Draws a core PosterState with its image and title box. Its rects are
+    moved in place and its blits are prepared when it's bound to a state,
+    so drawing a frame creates no objects. PosterLayer reuses them.
+    """
+
+    __slots__ = ("state", "serial", "image", "title", "title_box", "rect", "title_rect", "bounds_rect", "blits")
+
+    def __init__(self, state, image_surface):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.title_rect = pygame.Rect(0, 0, 0, 0)
+        self.bounds_rect = pygame.Rect(0, 0, 0, 0)
+        self.bind(state, image_surface)
+
+    def bind(self, state, image_surface):
+        self.state = state
+        self.serial = state.serial
+        self.image = image_surface
+        self.title = state.title
+        # The title never changes, so its box is composed once up front (and shared through the cache)
+        self.title_box = render_title_box(self.title, state.width)
+        self.rect.size = (state.width, state.height)
+        self.title_rect.size = self.title_box.get_size()
+        self.bounds_rect.size = (state.width, state.height + TITLE_BOX_GAP + self.title_rect.height)
+        self.blits = (
+            (self.image, self.rect),
+            (self.title_box, self.title_rect, None, pygame.BLEND_PREMULTIPLIED),
         )
-    
-        # Optional: faint background to help reading
-        overlay = pygame.Surface((title_box_rect.width, title_box_rect.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 80))  # transparent black
-        surface.blit(overlay, (title_box_x, title_box_y))
-    
-        # 3. Draw Centered Text
-        y_offset = title_box_y + (vertical_padding // 2) # Start with top padding (5px)
-        for line_surface in line_surfaces:
-            # Calculate X position for centering (Centered Text)
-            centered_x = title_box_x + (title_box_width - line_surface.get_width()) // 2
-            
-            surface.blit(line_surface, (centered_x, y_offset))
-            y_offset += line_surface.get_height() + line_spacing
+
+    def place(self, alpha=1.0):
+        """Moves the rects to alpha of the way from the previous tick's position to the current one."""
+        state = self.state
+        rect = self.rect
+        rect.x = state.x
+        rect.y = round(state.prev_y + (state.y - state.prev_y) * alpha)
+        # --- Pre-rendered title box, just below the poster ---
+        self.title_rect.x = rect.x
+        self.title_rect.y = rect.bottom + TITLE_BOX_GAP
+        self.bounds_rect.topleft = self.rect.topleft
+
+    def draw(self, surface, alpha=1.0):
+        self.place(alpha)
+        surface.blits(self.blits, doreturn=False)
+
+    def set_image(self, image_surface):
+        """
+        Swaps the image (a preview for the full poster). Collisions go by the
+        rect, so it keeps its size: an image of another shape (the poster of
+        one that fell as the plain placeholder) is scaled to fit and centred
+        on the placeholder color instead of stretched.
+        """
+        if image_surface.get_size() != self.rect.size:
+            width, height = self.rect.size
+            image_width, image_height = image_surface.get_size()
+            scale = min(width / image_width, height / image_height)
+            fitted = pygame.transform.smoothscale(image_surface, (round(image_width * scale), round(image_height * scale)))
+            image_surface = make_placeholder_surface(width, height)
+            image_surface.blit(fitted, fitted.get_rect(center=image_surface.get_rect().center))
+        self.image = image_surface
+        self.blits = ((self.image, self.rect), self.blits[1])
+
+
+class PosterLayer:
+    """
+    The Poster sprites of a GameCore's posters. Sprites of posters that are
+    gone go back to a pool for the next spawns, and nothing is looked at
+    again until the core's poster_generation changes. Sprites that started
+    out with a preview get their full image from refine() when it arrives.
+    """
+
+    def __init__(self):
+        self.sprites = []               # in the core's poster order
+        self.bounds = []                # each sprite's bounds_rect, where place() last put it
+        self.blits = []                 # every sprite's blits, for one Surface.blits() call
+        self._by_state = {}             # PosterState -> its Poster
+        self.loading = []               # (sprite, serial, title) still showing a preview
+        self._free = []
+        self._generation = None
+        self.created = 0
+        self.reused = 0
+
+    def sync(self, core, images, loading=None, release=None):
+        """
+        Matches the sprites to core.posters; images holds the surfaces of new
+        posters by title, and loading the titles among them that are previews.
+        release(title) is called for a title no sprite waits on any more
+        because the posters showing its preview are gone.
+        """
+        if core.poster_generation == self._generation:
+            return
+        self._generation = core.poster_generation
+
+        previous = self._by_state
+        by_state = {}
+        for state in core.posters:
+            sprite = previous.pop(state, None)
+            if sprite is not None and sprite.serial != state.serial:
+                # The core recycled the state for a new poster
+                self._free.append(sprite)
+                sprite = None
+            if sprite is None:
+                image = images.get(state.title) or placeholder_surface(state.width, state.height)
+                if self._free:
+                    sprite = self._free.pop()
+                    sprite.bind(state, image)
+                    self.reused += 1
+                else:
+                    sprite = Poster(state, image)
+                    self.created += 1
+                if loading and state.title in loading:
+                    self.loading.append((sprite, sprite.serial, state.title))
+            by_state[state] = sprite
+        self._free.extend(previous.values())
+        self._by_state = by_state
+
+        self.sprites = list(by_state.values())
+        self.bounds = [sprite.bounds_rect for sprite in self.sprites]
+        self.blits = [blit for sprite in self.sprites for blit in sprite.blits]
+        images.clear()
+        if loading:
+            loading.clear()
+        if self.loading:
+            # Forget previews of posters that are gone, and the loads no sprite waits on any more
+            waiting = [entry for entry in self.loading
+                       if by_state.get(entry[0].state) is entry[0] and entry[0].serial == entry[1]]
+            if release is not None and len(waiting) < len(self.loading):
+                titles = {entry[2] for entry in waiting}
+                for title in {entry[2] for entry in self.loading} - titles:
+                    release(title)
+            self.loading = waiting
+
+    def refine(self, collect):
+        """
+        Swaps the full image in for sprites still showing a preview, once
+        collect(title) hands it over (None until then). Returns how many changed.
+        """
+        if not self.loading:
+            return 0
+        arrived = {}
+        waiting = []
+        for entry in self.loading:
+            sprite = entry[0]
+            title = sprite.title
+            if title not in arrived:
+                arrived[title] = collect(title)
+            if arrived[title] is None:
+                waiting.append(entry)
+            else:
+                sprite.set_image(arrived[title])
+        swapped = len(self.loading) - len(waiting)
+        self.loading = waiting
+        if swapped:
+            self.blits = [blit for sprite in self.sprites for blit in sprite.blits]
+        return swapped
+
+    def clear(self):
+        self._free.extend(self._by_state.values())
+        self._by_state = {}
+        self.loading = []
+        self.sprites = []
+        self.bounds = []
+        self.blits = []
+        self._generation = None
+
+    def draw(self, surface, alpha=1.0):
+        for sprite in self.sprites:
+            sprite.place(alpha)
+        surface.blits(self.blits, doreturn=False)
+
+    def stats(self):
+        return {"sprites": len(self.sprites), "pooled": len(self._free), "created": self.created, "reused": self.reused}
 
 
 class SelectionPanel:
+    # The list is pre-rendered onto page surfaces this tall; only the pages
+    # under the viewport are kept, so long histories don't hold every pixel
+    LIST_PAGE_HEIGHT = 1024
+    MAX_CACHED_PAGES = 4
+
     def __init__(self, x, width):
         self.x = x
         self.width = width
         self.all_selected_titles = []       # full history
-        self.font = pygame.font.Font(None, 28)
+        self.font = fonts.font(28)
         self.done_button_rect = pygame.Rect(x + 20, SCREEN_HEIGHT - 60, width - 40, 40)
         self.is_done = False
 
@@ -307,30 +695,82 @@ class SelectionPanel:
             self.VIEWPORT_HEIGHT
         )
 
+        self.clear()
+
+    def clear(self):
+        """Forgets every selection (used when the game is reset)."""
+        self.all_selected_titles = []
+        self.entry_lines = []               # wrapped lines per entry
+        self.entry_tops = []                # y of each entry inside the list, cumulative
+        self.list_height = 0                # where the next entry starts
+        self.total_content_height = 0       # scroll range (8px gap per entry)
+        self.list_pages = OrderedDict()     # page index -> rendered Surface, least recent first
+        self.scroll_y = 0
+
     def add_title(self, title):
         self.all_selected_titles.append(title)
         # Note: No need to limit the list size here.
 
+        # Lay out only the new entry and extend the running heights
+        lines = layout_text(title, self.font, self.VIEWPORT_WIDTH)
+        lines_height = sum(text_renderer.measure(self.font, line)[1] + 4 for line in lines)
+        self.entry_lines.append(lines)
+        self.entry_tops.append(self.list_height)
+        self.list_height += lines_height + 4 # Spacing between entries
+        self.total_content_height += lines_height + 8 # 8px spacing between entries
+
+        # Draw it onto any cached page it lands on; other pages pick it up when built
+        first_page = self.entry_tops[-1] // self.LIST_PAGE_HEIGHT
+        last_page = (self.list_height - 1) // self.LIST_PAGE_HEIGHT
+        for page_index in range(first_page, last_page + 1):
+            if page_index in self.list_pages:
+                self._render_entry(self.list_pages[page_index], page_index, len(self.entry_lines) - 1)
+
+    def _render_entry(self, page, page_index, entry_index):
+        y_line = self.entry_tops[entry_index] - page_index * self.LIST_PAGE_HEIGHT
+        for line in self.entry_lines[entry_index]:
+            line_rect = text_renderer.draw(page, self.font, line, WHITE, (0, y_line))
+            y_line += line_rect.height + 4
+
+    def _list_page(self, page_index):
+        """Returns the rendered list page, building it from the entries that overlap it if needed."""
+        page = self.list_pages.get(page_index)
+        if page is not None:
+            self.list_pages.move_to_end(page_index)
+            return page
+
+        page = pygame.Surface((self.VIEWPORT_RECT.width, self.LIST_PAGE_HEIGHT)).convert()
+        page.fill(PANEL_BG)
+        page_top = page_index * self.LIST_PAGE_HEIGHT
+        # Entries are sorted by top; start with the last one beginning above this page
+        first = max(0, bisect.bisect_right(self.entry_tops, page_top) - 1)
+        for entry_index in range(first, len(self.entry_tops)):
+            if self.entry_tops[entry_index] >= page_top + self.LIST_PAGE_HEIGHT:
+                break
+            self._render_entry(page, page_index, entry_index)
+
+        self.list_pages[page_index] = page
+        if len(self.list_pages) > self.MAX_CACHED_PAGES:
+            self.list_pages.popitem(last=False)
+        return page
+
+    def render_chrome(self, size, font):
+        """Panel background and Done button, drawn once into the panel's static layer."""
+        chrome = pygame.Surface(size)
+        chrome.fill(PANEL_BG)
+        button_rect = self.done_button_rect.move(-self.x, 0)
+        pygame.draw.rect(chrome, BUTTON_COLOR, button_rect)
+        done_text = text_renderer.render(font, "Done!", BLACK)
+        chrome.blit(done_text, done_text.get_rect(center=button_rect.center))
+        return chrome
+
     def draw(self, screen):
-        # 1. Draw Panel Background
-        pygame.draw.rect(screen, PANEL_BG, (self.x, 0, self.width, SCREEN_HEIGHT))
-        
-        # 2. Draw Done Button
-        pygame.draw.rect(screen, BUTTON_COLOR, self.done_button_rect)
-        btn_text = self.font.render("Done!", True, BLACK)
-        text_rect = btn_text.get_rect(center=self.done_button_rect.center)
-        screen.blit(btn_text, text_rect)
+        # 1-2. Panel background and Done button
+        chrome = static_layers.get("panel_chrome", self.render_chrome, (self.width, SCREEN_HEIGHT), self.font)
+        screen.blit(chrome, (self.x, 0))
 
         # 3. Content Rendering (Scrolling Logic)
-        
-        # --- Calculate Total Content Height ---
-        total_content_height = 0
-        list_font = self.font
-        
-        for t in self.all_selected_titles:
-            lines = wrap_text_multi(t, list_font, self.VIEWPORT_WIDTH)
-            entry_height = sum(list_font.size(line)[1] + 4 for line in lines)
-            total_content_height += entry_height + 8 # 8px spacing between entries
+        total_content_height = self.total_content_height
 
         # --- Clamping scroll_y ---
         max_scroll_down = max(0, total_content_height - self.VIEWPORT_HEIGHT)
@@ -346,20 +786,14 @@ class SelectionPanel:
         clip_rect.height -= 2
         screen.set_clip(clip_rect)
 
-        current_y_render = self.VIEWPORT_Y_START + self.scroll_y
-        
-        # Draw the list, applying the scroll offset
-        for t in self.all_selected_titles:
-            lines = wrap_text_multi(t, list_font, self.VIEWPORT_WIDTH)
-            y_line = current_y_render
-            
-            # Render and draw lines
-            for line in lines:
-                text = list_font.render(line, True, WHITE)
-                screen.blit(text, (self.x + self.LIST_MARGIN, y_line))
-                y_line += text.get_height() + 4
-            
-            current_y_render = y_line + 4 # Spacing between entries
+        # Blit the pre-rendered pages under the viewport (one, or two at a page boundary)
+        if self.entry_tops:
+            visible_top = -self.scroll_y
+            first_page = visible_top // self.LIST_PAGE_HEIGHT
+            last_page = min(visible_top + self.VIEWPORT_HEIGHT, self.list_height - 1) // self.LIST_PAGE_HEIGHT
+            for page_index in range(first_page, last_page + 1):
+                page_y = self.VIEWPORT_Y_START + self.scroll_y + page_index * self.LIST_PAGE_HEIGHT
+                screen.blit(self._list_page(page_index), (self.VIEWPORT_RECT.x, page_y))
         
         # Reset clipping
         screen.set_clip(None)
@@ -396,25 +830,155 @@ class SelectionPanel:
             if self.done_button_rect.collidepoint(event.pos):
                 self.is_done = True
 
-def load_movie_categories():
-    json_path = os.path.join(os.path.dirname(__file__), "data", "movies_by_category.json")
-    with open(json_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+class ResultsList:
+    """
+    Scrollable list of every selected title on the results screen.
 
-def draw_title_screen(screen):
-    """Draws the main title screen with instructions, now with centered text."""
+    Entry heights are laid out once, as titles arrive, into a prefix-sum
+    array. Each frame the first visible entry is found by binary search on
+    that array and only the rows inside the viewport are drawn, with the
+    rendered lines coming from a small LRU. The cost of a frame depends on
+    the viewport, not on how many titles were picked.
+    """
+    MAX_CACHED_LINES = 256
+
+    def __init__(self, content_box_rect, font):
+        self.content_box_rect = content_box_rect
+        self.font = font
+
+        # Define Viewport
+        self.VIEWPORT_X_START = content_box_rect.left + 20
+        self.VIEWPORT_Y_START = content_box_rect.top + 20
+        self.VIEWPORT_WIDTH = content_box_rect.width - 40 # Account for list margins and scrollbar space
+        self.VIEWPORT_HEIGHT = content_box_rect.height - 40
+
+        self.rendered_lines = OrderedDict()  # line text -> Surface, least recent first
+        self.clear()
+
+    def clear(self):
+        self.entry_lines = []               # wrapped lines per entry
+        self.entry_tops = [0]               # prefix sums: entry i starts at entry_tops[i]
+        self.total_content_height = 0
+
+    def sync(self, titles):
+        """Lays out titles added since the last call. Call clear() when the selections are reset."""
+        if len(titles) < len(self.entry_lines):
+            self.clear()
+        for t in titles[len(self.entry_lines):]:
+            # Use VIEWPORT_WIDTH for wrapping, minus some internal padding
+            lines = layout_text(t, self.font, self.VIEWPORT_WIDTH - 20)
+            lines_height = sum(text_renderer.measure(self.font, line)[1] + 4 for line in lines)
+            self.entry_lines.append(lines)
+            self.entry_tops.append(self.entry_tops[-1] + lines_height + 8) # Spacing between entries
+            self.total_content_height += lines_height + 12
+
+    def _render_line(self, line):
+        text = self.rendered_lines.get(line)
+        if text is None:
+            text = text_renderer.render(self.font, line, WHITE)
+            self.rendered_lines[line] = text
+            if len(self.rendered_lines) > self.MAX_CACHED_LINES:
+                self.rendered_lines.popitem(last=False)
+        else:
+            self.rendered_lines.move_to_end(line)
+        return text
+
+    def draw(self, screen, scroll_y):
+        """Draws the visible rows and the scrollbar; returns scroll_y clamped to the list."""
+        total_content_height = self.total_content_height
+
+        # 2. Clamping scroll_y (limits scrolling)
+        max_scroll_down = max(0, total_content_height - self.VIEWPORT_HEIGHT)
+        scroll_y = max(min(scroll_y, 0), -max_scroll_down)
+        
+        # 3. Draw the movie list within the viewport
+        
+        # Set a clipping rectangle to confine the list to the box
+        clip_rect = pygame.Rect(
+            self.content_box_rect.left + 1, 
+            self.content_box_rect.top + 1, 
+            self.content_box_rect.width - 2, 
+            self.content_box_rect.height - 2
+        )
+        screen.set_clip(clip_rect)
+
+        # Only entries between the top and the bottom of the box are drawn.
+        # The box reaches 20px above the viewport, so start looking there.
+        visible_top = -scroll_y - (self.VIEWPORT_Y_START - clip_rect.top)
+        visible_bottom = -scroll_y + (clip_rect.bottom - self.VIEWPORT_Y_START)
+        first = max(0, bisect.bisect_right(self.entry_tops, visible_top) - 1)
+
+        for i in range(first, len(self.entry_lines)):
+            if self.entry_tops[i] >= visible_bottom:
+                break
+            y_line = self.VIEWPORT_Y_START + scroll_y + self.entry_tops[i]
+            
+            # Render and draw lines
+            for line in self.entry_lines[i]:
+                text = self._render_line(line)
+                screen.blit(text, (self.VIEWPORT_X_START, y_line))
+                y_line += text.get_height() + 4
+        
+        # Reset clipping
+        screen.set_clip(None)
+
+        # 4. Draw Scrollbar
+        if total_content_height > self.VIEWPORT_HEIGHT:
+            SCROLLBAR_WIDTH = 10
+            # Position scrollbar inside the right edge of the content box
+            SCROLLBAR_X = self.content_box_rect.right - SCROLLBAR_WIDTH - 10 
+            
+            # Calculate bar height and position relative to the CONTENT_BOX_RECT
+            scrollbar_height_ratio = self.VIEWPORT_HEIGHT / total_content_height
+            scrollbar_display_height = max(20, self.VIEWPORT_HEIGHT * scrollbar_height_ratio) # min height 20px
+            
+            # Calculate bar position: map scroll_y (negative) to a positive position
+            scroll_ratio = -scroll_y / max_scroll_down
+            bar_y_offset = (self.VIEWPORT_HEIGHT - scrollbar_display_height) * scroll_ratio
+            
+            scrollbar_rect = pygame.Rect(
+                SCROLLBAR_X,
+                self.VIEWPORT_Y_START + bar_y_offset,
+                SCROLLBAR_WIDTH,
+                scrollbar_display_height
+            )
+            
+            # Draw the scrollbar track (background)
+            pygame.draw.rect(screen, SCROLL_TRACK_COLOR, (SCROLLBAR_X, self.VIEWPORT_Y_START, SCROLLBAR_WIDTH, self.VIEWPORT_HEIGHT), border_radius=5)
+            # Draw the scrollbar thumb
+            pygame.draw.rect(screen, SCROLL_THUMB_COLOR, scrollbar_rect, border_radius=5)
+
+        return scroll_y
+
+def results_content_rect():
+    """The framed box holding the list on the results screen, just below its title."""
+    summary_title_rect = pygame.Rect((0, 0), text_renderer.measure(SUMMARY_TITLE_FONT, "YOUR FILMOGRAPHY"))
+    summary_title_rect.center = (SCREEN_WIDTH // 2, 70)
+
+    CONTENT_BOX_MARGIN = 50
+    return pygame.Rect(
+        CONTENT_BOX_MARGIN, 
+        summary_title_rect.bottom + 20, 
+        SCREEN_WIDTH - CONTENT_BOX_MARGIN * 2, 
+        SCREEN_HEIGHT - summary_title_rect.bottom - 40
+    )
+
+def render_title_screen(size, title_font, instruction_font):
+    """Renders the main title screen with instructions, now with centered text."""
+    screen_width, screen_height = size
+    screen = pygame.Surface(size)
     screen.fill(BLACK) # Black screen for dramatic intro
 
     # 1. Draw Title - Centered
-    title_text = TITLE_FONT.render("MOVIE MANIA RUNNER", True, RED)
-    title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
+    title_text = text_renderer.render(title_font, "MOVIE MANIA RUNNER", RED)
+    title_rect = title_text.get_rect(center=(screen_width // 2, screen_height // 4))
     screen.blit(title_text, title_rect)
 
     # 2. Instruction Box Setup - Centered
     box_width = 500
     box_height = 250
     box_rect = pygame.Rect(0, 0, box_width, box_height)
-    box_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)
+    box_rect.center = (screen_width // 2, screen_height // 2 + 50)
 
     # Draw the instruction box background and border
     pygame.draw.rect(screen, PANEL_BG, box_rect, border_radius=10)
@@ -439,7 +1003,7 @@ def draw_title_screen(screen):
         if "PRESS SPACEBAR" in line:
             color = RED
         
-        text_surface = INSTRUCTION_FONT.render(line, True, color)
+        text_surface = text_renderer.render(instruction_font, line, color)
         
         # Calculate X position for centering the text within the instruction box
         centered_x = box_rect.left + (box_rect.width - text_surface.get_width()) // 2
@@ -447,58 +1011,168 @@ def draw_title_screen(screen):
         screen.blit(text_surface, (centered_x, y_offset))
         y_offset += text_surface.get_height() + 5
 
+    return screen
+
+def draw_title_screen(screen):
+    """Draws the main title screen from its static layer."""
+    layer = static_layers.get("title_screen", render_title_screen, screen.get_size(), TITLE_FONT, INSTRUCTION_FONT)
+    screen.blit(layer, (0, 0))
+
+def render_running_background(size, game_width):
+    """Grass with the pavement game area; the panel draws over the right side."""
+    background = pygame.Surface(size)
+    background.fill(GREEN)
+    pygame.draw.rect(background, GRAY, (0, 0, game_width, size[1]))
+    return background
+
+def render_results_screen(size, summary_title_font, reset_symbol_font, reset_button_rect, content_box_rect,
+                          hint_font=None, hint=None):
+    """Everything on the results screen except the list itself: header, reset button, the list box and its hint."""
+    screen_width, _ = size
+    screen = pygame.Surface(size)
+    screen.fill(BLACK) # Use black background for final screen
+
+    # 1. Draw Title (Similar style to Intro Screen)
+    summary_title_text = text_renderer.render(summary_title_font, "YOUR FILMOGRAPHY", RED)
+    summary_title_rect = summary_title_text.get_rect(center=(screen_width // 2, 70))
+    screen.blit(summary_title_text, summary_title_rect)
+
+    # 1b. Draw Reset Button
+    pygame.draw.rect(screen, RESET_BUTTON_COLOR, reset_button_rect, border_radius=5)
+    # Draw the left-pointing arrow (<< or a filled triangle)
+    arrow_text = text_renderer.render(reset_symbol_font, "<<", WHITE) # Using double-arrow as symbol
+    arrow_rect = arrow_text.get_rect(center=pygame.Rect(reset_button_rect).center)
+    screen.blit(arrow_text, arrow_rect)
+
+    # 2. Draw the background for the movie list box
+    pygame.draw.rect(screen, RESULTS_BOX_BG, content_box_rect, border_radius=10)
+    pygame.draw.rect(screen, WHITE, content_box_rect, 2, border_radius=10)
+
+    # 3. Key hint in the margin below the box
+    if hint:
+        hint_text = text_renderer.render(hint_font, hint, WHITE)
+        box_bottom = pygame.Rect(content_box_rect).bottom
+        screen.blit(hint_text, hint_text.get_rect(center=(screen_width // 2, (box_bottom + size[1]) // 2)))
+
+    return screen
+
 # --- Game Loop ---
 
-def reset_game(player, all_sprites, posters, panel, movie_pairs, movie_categories):
-    """Resets all game state variables and returns new/reset objects."""
-    
-    # 1. Reset Display Groups
-    all_sprites.empty()
-    posters.empty()
-    
-    # 2. Re-initialize Player
-    player = Player()
-    all_sprites.add(player)
+def session_pairs(catalog, seed):
+    """The pair order of a session, from the configured scheduler."""
+    return make_pairs(catalog, MOVIE_CATEGORIES, seed, PAIR_SCHEDULER, RANKING_POOL, RANKING_TOP_K)
 
-    # 3. Reset Selection Panel
-    panel.all_selected_titles = []
-    panel.is_done = False
-    panel.scroll_y = 0 # Reset scroll position
+
+def reset_game(core, panel, catalog, prefetcher, seed=None):
+    """Sends the core back to the title screen with a freshly shuffled pair order (from seed, if given)."""
     
-    # 4. Re-shuffle Movie Pairs
-    all_movies = []
-    for category, movies in movie_categories.items():
-        all_movies.extend(movies)
-        
-    random.shuffle(all_movies)
-    movie_pairs = list(zip(all_movies[0::2], all_movies[1::2]))
+    # 0. Drop posters still being fetched for the old pair order
+    if PROFILE_FRAMES:
+        print(f"Prefetch stats: {prefetcher.stats()}")
+        print(f"Poster surface cache stats: {poster_surface_cache.stats()}")
+    prefetcher.cancel()
+
+    # 1. Reset Selection Panel
+    panel.clear() # Drops the history, its rendered list and the scroll position
+    panel.is_done = False
     
-    # 5. Return necessary variables for the main loop
-    return player, all_sprites, posters, panel, movie_pairs, 0, False, TITLE_SCREEN, 0
+    # 2. Re-shuffle Movie Pairs
+    movie_pairs = session_pairs(catalog, seed)
+    core.reset(movie_pairs)
+    prefetcher.schedule(movie_pairs, 0)
 
 
-def main():
-    player = Player()
-    all_sprites = pygame.sprite.Group(player)
-    posters = pygame.sprite.Group()
+def main(startup=None, record_path=None, replay_log=None):
+    """
+    Runs the game. startup, a StartupTimer, gets the start-up steps and is
+    reported after the first frame. record_path logs the session's input
+    there; replay_log (a SessionLog) plays a recorded session back instead
+    of reading the keyboard and mouse, and quits when it runs out.
+    """
+    screen = init_display()
+    if startup:
+        startup.mark("display")
     panel = SelectionPanel(PANEL_X, PANEL_WIDTH)
-
-    movie_categories = load_movie_categories()
-
-    # Flatten all movies into a single list
-    all_movies = []
-    for category, movies in movie_categories.items():
-        all_movies.extend(movies)
-
-    # Shuffle movies and make pairs
-    random.shuffle(all_movies)
-    movie_pairs = list(zip(all_movies[0::2], all_movies[1::2]))  # pair every 2 items
-
-    current_pair_index = 0
-    pair_active = False
+    player_image = make_player_surface()
+
+    # Pairs are drawn from the catalog as they are needed, never as one full list
+    catalog = open_catalog(MOVIE_CATALOG_PATH)
+
+    # Recording and replaying: every random choice follows from the session seed,
+    # and each pair order from a seed that goes into the log
+    replayer = Replayer(replay_log) if replay_log else None
+    recorder = None
+    if replayer:
+        random.seed(replay_log.seed)
+        first = replayer.due(0)
+        if not first or first[0].kind != RESET:
+            raise ValueError("A session log starts with the seed of its pair order")
+        pair_seed = first[0].value
+    else:
+        if record_path:
+            session_seed = random.getrandbits(64)
+            random.seed(session_seed)
+            recorder = SessionRecorder(record_path, session_seed, catalog.count(MOVIE_CATEGORIES), MOVIE_CATEGORIES,
+                                       LANE_COUNT, STRESS_SPAWN_INTERVAL,
+                                       {"mode": PAIR_SCHEDULER, "pool": RANKING_POOL, "top_k": RANKING_TOP_K})
+        pair_seed = random.getrandbits(64)
+    record = recorder.record if recorder else (lambda kind, tick, value=None: None)
+    record(RESET, 0, pair_seed)
+
+    movie_pairs = session_pairs(catalog, pair_seed)
+    if startup:
+        startup.mark("catalog")
+
+    # Picks are kept across sessions (a replay has already been logged once)
+    choice_log = None if replayer else ChoiceLog(CHOICE_LOG_DIR)
+    ranking = EloRanking(os.path.join(CHOICE_LOG_DIR, RANKING_FILENAME))
+    ranking_lines = None # the results screen shows the all-time ranking instead of the session when set
+
+    # Posters shrink to fit the lanes; LANE_COUNT may have been set after import (a replay sets it from the log)
+    poster_width, poster_height_limit = lane_poster_size(LANE_COUNT)
+
+    # Start resolving the first posters while the title screen is up
+    prefetcher = PosterPrefetcher(
+        lambda title: get_poster_image(title, OMDB_API_KEY, poster_width, poster_height_limit),
+        lookahead=PREFETCH_LOOKAHEAD,
+        workers=PREFETCH_WORKERS,
+        previewer=lambda title: poster_preview(title, poster_width, poster_height_limit)
+    )
+    prefetcher.schedule(movie_pairs, 0)
+    if startup:
+        startup.mark("prefetch")
+
+    # Per-phase frame timings (a no-op unless PROFILE_FRAMES is set)
+    profiler = FrameProfiler() if PROFILE_FRAMES else NullProfiler()
+    profiler_font = fonts.font(20) if PROFILE_FRAMES else None
+
+    # The core asks for a poster's size when it spawns; the image is kept for drawing it
+    poster_images = {} # title -> Surface, until its Poster is created
+    poster_previews = set() # titles in poster_images showing a preview while the poster loads
+    replay_sizes = deque() # recorded poster sizes, in spawn order
+    def poster_size(title):
+        with profiler.phase("poster_load"):
+            # Pick up prefetched posters; never wait on the network or the disk here. A
+            # poster that isn't ready falls with its preview (or the plain placeholder)
+            # and is swapped when it loads.
+            image = prefetcher.get(title, keep_loading=True)
+            if image is None:
+                image = prefetcher.preview(title) or placeholder_surface(poster_width, poster_height_limit)
+                poster_previews.add(title)
+            if replayer:
+                # Collisions depend on the size, so a replay uses the recorded one
+                size = replay_sizes.popleft()
+                if image.get_size() != size:
+                    image = placeholder_surface(*size)
+            # Spawning happens inside a tick; the record has to be there before it
+            record(SIZES, core.ticks - 1, (image.get_size(),))
+            poster_images[title] = image
+            return image.get_size()
+
+    core = GameCore(movie_pairs, poster_size, LANE_COUNT, STRESS_SPAWN_INTERVAL)
+    poster_layer = PosterLayer()
 
     running = True
-    game_state = TITLE_SCREEN # Start in the new TITLE_SCREEN state
     
     # Scrolling variables for the final screen (kept separate from panel scroll_y)
     scroll_y = 0
@@ -506,25 +1180,146 @@ def main():
 
     # Reset button rect (40x40 square, placed near the title)
     RESET_BUTTON_RECT = pygame.Rect(SCREEN_WIDTH - 70, 45, 40, 40)
+
+    # Final movie list: laid out as titles come in, only visible rows are drawn
+    results_list = ResultsList(results_content_rect(), RESULTS_LIST_FONT)
+
+    # Rendering mode and what dirty-rect mode needs to repaint the next frame
+    dirty_mode = DIRTY_RECT_RENDERING
+    dirty = DirtyRectTracker((SCREEN_WIDTH, SCREEN_HEIGHT))
+    drawn_bounds = [] # where sprites were drawn last frame
+    drawn_from = None # the poster layer's bounds list drawn_bounds was built from
+    player_rect = pygame.Rect(core.player_rect)
+    player_blits = ((player_image, player_rect),)
+    panel_drawn_state = None # (selection count, scroll) the panel was last drawn with
+    last_drawn_state = None
+
+    # Fixed-timestep bookkeeping: simulated time owed to the game, and when the last frame ended
+    accumulator = 0.0
+    frame_time = SIMULATION_DT
+    last_frame_at = time.perf_counter()
+
+    def shut_down():
+        if profiler.enabled:
+            print(f"{'Dirty-rect' if dirty_mode else 'Full-screen'} rendering: {dirty.stats()}")
+            print(profiler.report())
+            if PROFILE_TRACE_PATH:
+                profiler.write_trace(PROFILE_TRACE_PATH)
+        if recorder:
+            recorder.checkpoint(core.ticks, core.selections)
+            recorder.close()
+        if replayer:
+            print(f"Replayed {replayer.sessions} sessions, {len(replayer.mismatches)} differed from the recording")
+        if choice_log is not None:
+            choice_log.close()
+            ranking.update(choice_log)
+            ranking.save()
+        prefetcher.shutdown()
+        poster_cache.flush()
+        http_client.close()
+        pygame.quit()
+        sys.exit()
+
+    def toggle_render_mode():
+        # Switch between full-screen and dirty-rect rendering, reporting the mode we leave when profiling
+        nonlocal dirty_mode
+        if profiler.enabled:
+            print(f"{'Dirty-rect' if dirty_mode else 'Full-screen'} rendering: {dirty.stats()}")
+        dirty_mode = not dirty_mode
+        dirty.reset_stats()
+        dirty.invalidate_all()
+
+    def restart(seed):
+        # The reset button: back to the title screen with a new pair order
+        nonlocal movie_pairs, scroll_y, ranking_lines
+        with profiler.phase("reset"):
+            reset_game(core, panel, catalog, prefetcher, seed)
+        movie_pairs = core.movie_pairs
+        poster_layer.clear()
+        poster_previews.clear()
+        replay_sizes.clear()
+        results_list.clear()
+        ranking_lines = None
+        scroll_y = 0
+
+    def toggle_ranking():
+        # Results screen: switch the list between this session's picks and the all-time ranking
+        nonlocal ranking_lines, scroll_y
+        if ranking_lines is None:
+            if choice_log is not None:
+                ranking.update(choice_log) # only the picks since it was last updated
+            elif ranking.ratings is None:
+                ranking.load()
+            ranking_lines = [f"{rank}. {title} ({rating:.0f})"
+                             for rank, (title, rating, _) in enumerate(ranking.top(RANKING_SIZE), 1)]
+            if not ranking_lines:
+                ranking_lines = ["No picks logged yet"]
+        else:
+            ranking_lines = None
+        results_list.clear()
+        scroll_y = 0
+
+    def apply_replay(records):
+        nonlocal scroll_y
+        for replayed in records:
+            kind = replayed.kind
+            if kind == START:
+                core.start()
+            elif kind == LEFT:
+                core.move_left()
+            elif kind == RIGHT:
+                core.move_right()
+            elif kind == FINISH:
+                core.finish()
+            elif kind == SIZES:
+                replay_sizes.extend(replayed.value)
+            elif kind == PANEL_SCROLL:
+                panel.scroll_y = replayed.value
+            elif kind == RESULTS_SCROLL:
+                scroll_y = replayed.value
+            elif kind == RENDER_MODE:
+                toggle_render_mode()
+            elif kind == CHECKPOINT:
+                replayer.check(replayed, core.selections)
+            elif kind == RESET:
+                restart(replayed.value)
     
     while running:
+        profiler.begin_frame()
         
         # EVENT HANDLING
-        for event in pygame.event.get():
+        with profiler.phase("events"):
+            events = pygame.event.get()
+            if replayer:
+                # The log plays instead of the player; only quitting and the overlay stay live
+                events = [event for event in events if event.type == pygame.QUIT or
+                          (event.type == pygame.KEYDOWN and event.key == TOGGLE_PROFILER_OVERLAY_KEY)]
+
+        for event in events:
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                shut_down()
+
+            if event.type == pygame.KEYDOWN and event.key == TOGGLE_RENDER_MODE_KEY:
+                record(RENDER_MODE, core.ticks)
+                toggle_render_mode()
 
-            if game_state == TITLE_SCREEN:
+            if event.type == pygame.KEYDOWN and event.key == TOGGLE_PROFILER_OVERLAY_KEY and profiler.enabled:
+                profiler.show_overlay = not profiler.show_overlay
+                dirty.invalidate_all()
+
+            if core.state == TITLE_SCREEN:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                    game_state = RUNNING
+                    record(START, core.ticks)
+                    core.start()
             
-            elif game_state == RUNNING:
+            elif core.state == RUNNING:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_LEFT:
-                        player.move_left()
+                        record(LEFT, core.ticks)
+                        core.move_left()
                     elif event.key == pygame.K_RIGHT:
-                        player.move_right()
+                        record(RIGHT, core.ticks)
+                        core.move_right()
 
                 panel.handle_event(event)
 
@@ -532,190 +1327,166 @@ def main():
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 4: # Scroll Up
                         panel.scroll_y += panel.scroll_speed
+                        record(PANEL_SCROLL, core.ticks, panel.scroll_y)
                     elif event.button == 5: # Scroll Down
                         panel.scroll_y -= panel.scroll_speed
+                        record(PANEL_SCROLL, core.ticks, panel.scroll_y)
             
             # Scrolling and Button Input handling when game is done
-            elif game_state == DONE:
+            elif core.state == DONE:
+                if event.type == pygame.KEYDOWN and event.key == TOGGLE_RANKING_KEY:
+                    toggle_ranking()
+
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     # Check for Reset Button click
                     if RESET_BUTTON_RECT.collidepoint(event.pos):
-                        (player, all_sprites, posters, panel, movie_pairs, 
-                         current_pair_index, pair_active, game_state, scroll_y) = \
-                            reset_game(player, all_sprites, posters, panel, movie_pairs, movie_categories)
+                        seed = random.getrandbits(64)
+                        if recorder:
+                            recorder.checkpoint(core.ticks, core.selections)
+                        record(RESET, core.ticks, seed)
+                        restart(seed)
                         continue # Skip rest of the loop to immediately draw title screen
 
                     # Mouse wheel scroll handling (for the final results box)
                     # Mouse wheel scroll up = button 4 (scroll list down, increase scroll_y)
                     if event.button == 4:
                         scroll_y += scroll_speed
+                        record(RESULTS_SCROLL, core.ticks, scroll_y)
                     # Mouse wheel scroll down = button 5 (scroll list up, decrease scroll_y)
                     elif event.button == 5:
                         scroll_y -= scroll_speed
+                        record(RESULTS_SCROLL, core.ticks, scroll_y)
+
+        # Replayed input that isn't tied to a tick: title and results screens
+        if replayer and core.state != RUNNING:
+            apply_replay(replayer.due(core.ticks))
 
         
         # STATE MACHINE DRAWING AND UPDATING
-        if game_state == TITLE_SCREEN:
-            draw_title_screen(screen)
+        frame_state = core.state
+
+        if core.state == TITLE_SCREEN:
+            with profiler.phase("draw_title"):
+                draw_title_screen(screen)
         
-        elif game_state == RUNNING:
+        elif core.state == RUNNING:
+            # The overlay isn't erased by dirty rects, so the frame is redrawn while it's up
+            full_redraw = (not dirty_mode or dirty.needs_full_redraw or last_drawn_state != RUNNING
+                           or profiler.show_overlay)
             
             # Backgrounds
-            screen.fill(GREEN)
-            pygame.draw.rect(screen, GRAY, (0, 0, GAME_WIDTH, SCREEN_HEIGHT))
-
-            # Game Logic
-            if not pair_active and current_pair_index < len(movie_pairs):
-                pair_active = True
-                left_movie, right_movie = movie_pairs[current_pair_index]
-                
-                # Fetch and load poster images, prioritizing local assets (OMDb call here)
-                left_image = get_poster_image(left_movie, OMDB_API_KEY)
-                right_image = get_poster_image(right_movie, OMDB_API_KEY)
-                
-                left_poster = Poster(0, left_movie, left_image)
-                right_poster = Poster(1, right_movie, right_image)
-                
-                posters.add(left_poster, right_poster)
-                all_sprites.add(left_poster, right_poster)
-
-            all_sprites.update()
-
-            # Collision detection
-            for poster in posters:
-                if player.rect.colliderect(poster.rect):
-                    panel.add_title(poster.title)
-                    for other in list(posters):
-                        other.kill()
-                    pair_active = False
-                    current_pair_index += 1
-                    break
+            with profiler.phase("background"):
+                running_background = static_layers.get(
+                    "running_background", render_running_background, screen.get_size(), GAME_WIDTH
+                )
+                if full_redraw:
+                    screen.blit(running_background, (0, 0))
+                else:
+                    # Dirty-rect mode: only paint the backdrop back over last frame's sprites
+                    for rect in drawn_bounds:
+                        screen.blit(running_background, rect, rect)
+                        dirty.invalidate(rect)
+
+            # Game Logic: as many fixed ticks as the time since the last frame pays for
+            with profiler.phase("simulate"):
+                accumulator += frame_time * SIMULATION_SPEED
+                while accumulator >= SIMULATION_DT and core.state == RUNNING:
+                    if replayer:
+                        # Recorded input goes in just before the tick it preceded
+                        apply_replay(replayer.due(core.ticks))
+                        if core.state != RUNNING:
+                            break
+                    for event in core.tick(SIMULATION_DT):
+                        if event[0] == SPAWN:
+                            # Keep the look-ahead window moving with the game
+                            prefetcher.schedule(movie_pairs, event[1] + 1)
+                        elif event[0] == SELECT:
+                            panel.add_title(event[1])
+                            # An adaptive scheduler knows the next pair now
+                            prefetcher.schedule(movie_pairs, event[2] + 1)
+                            if choice_log is not None:
+                                for title in movie_pairs[event[2]]:
+                                    if title != event[1]:
+                                        choice_log.record(event[1], title)
+                    accumulator -= SIMULATION_DT
+
+            # Posters spawned this frame get their sprite; the ones that are gone lose it
+            with profiler.phase("sprites"):
+                poster_layer.sync(core, poster_images, poster_previews, prefetcher.discard)
+                poster_layer.refine(prefetcher.collect)
+
+            # Leftover time, as a fraction of a tick, to draw the posters ahead by
+            alpha = min(accumulator / SIMULATION_DT, 1.0)
 
             # Draw everything
-            for poster in posters:
-                poster.draw(screen)
-
-            all_sprites.draw(screen)
-            panel.draw(screen)
-
-            # Check done condition
-            if panel.is_done or current_pair_index >= len(movie_pairs):
-                game_state = DONE
-
+            with profiler.phase("draw_sprites"):
+                poster_layer.draw(screen, alpha)
+
+                player_rect.update(core.player_rect)
+                screen.blits(player_blits, doreturn=False)
+
+            # The same rects move every frame; the list only changes after a spawn or a pick
+            if drawn_from is not poster_layer.bounds:
+                drawn_from = poster_layer.bounds
+                drawn_bounds = drawn_from + [player_rect]
+            for rect in drawn_bounds:
+                dirty.invalidate(rect)
+
+            # The panel only changes when a title is added or it is scrolled
+            with profiler.phase("draw_panel"):
+                if full_redraw or panel_drawn_state != (len(panel.all_selected_titles), panel.scroll_y):
+                    panel.draw(screen)
+                    panel_drawn_state = (len(panel.all_selected_titles), panel.scroll_y)
+                    dirty.invalidate((panel.x, 0, panel.width, SCREEN_HEIGHT))
+
+            # Check done condition (running out of pairs is handled by the core)
+            if panel.is_done:
+                record(FINISH, core.ticks)
+                core.finish()
         
-        elif game_state == DONE:
-            
-            screen.fill(BLACK) # Use black background for final screen
-
-            # 1. Draw Title (Similar style to Intro Screen)
-            summary_title_text = SUMMARY_TITLE_FONT.render("YOUR FILMOGRAPHY", True, RED)
-            summary_title_rect = summary_title_text.get_rect(center=(SCREEN_WIDTH // 2, 70))
-            screen.blit(summary_title_text, summary_title_rect)
-
-            # 1b. Draw Reset Button
-            pygame.draw.rect(screen, RESET_BUTTON_COLOR, RESET_BUTTON_RECT, border_radius=5)
-            # Draw the left-pointing arrow (<< or a filled triangle)
-            arrow_text = RESET_SYMBOL_FONT.render("<<", True, WHITE) # Using double-arrow as symbol
-            arrow_rect = arrow_text.get_rect(center=RESET_BUTTON_RECT.center)
-            screen.blit(arrow_text, arrow_rect)
-
-
-            # 2. Define Content Box and Viewport
-            CONTENT_BOX_MARGIN = 50
-            CONTENT_BOX_WIDTH = SCREEN_WIDTH - CONTENT_BOX_MARGIN * 2
-            CONTENT_BOX_HEIGHT = SCREEN_HEIGHT - summary_title_rect.bottom - 40
-            
-            CONTENT_BOX_RECT = pygame.Rect(
-                CONTENT_BOX_MARGIN, 
-                summary_title_rect.bottom + 20, 
-                CONTENT_BOX_WIDTH, 
-                CONTENT_BOX_HEIGHT
-            )
-            
-            # Draw the background for the movie list box
-            pygame.draw.rect(screen, RESULTS_BOX_BG, CONTENT_BOX_RECT, border_radius=10)
-            pygame.draw.rect(screen, WHITE, CONTENT_BOX_RECT, 2, border_radius=10)
-
-            # Define Viewport and Calculate Total Content Height
-            VIEWPORT_X_START = CONTENT_BOX_RECT.left + 20
-            VIEWPORT_Y_START = CONTENT_BOX_RECT.top + 20
-            VIEWPORT_WIDTH = CONTENT_BOX_RECT.width - 40 # Account for list margins and scrollbar space
-            VIEWPORT_HEIGHT = CONTENT_BOX_RECT.height - 40
-            
-            # The font for the list items
-            list_font = pygame.font.Font(None, 36)
-
-            # 1. Calculate the total height of the content
-            total_content_height = 0
-            for t in panel.all_selected_titles:
-                # Use VIEWPORT_WIDTH for wrapping, minus some internal padding
-                lines = wrap_text_multi(t, list_font, VIEWPORT_WIDTH - 20) 
-                
-                entry_height = sum(list_font.size(line)[1] + 4 for line in lines)
-                
-                total_content_height += entry_height + 12 
-            
-            # 2. Clamping scroll_y (limits scrolling)
-            max_scroll_down = max(0, total_content_height - VIEWPORT_HEIGHT)
-            scroll_y = max(min(scroll_y, 0), -max_scroll_down)
-            
-            # 3. Draw the movie list within the viewport
-            
-            # Set a clipping rectangle to confine the list to the box
-            clip_rect = pygame.Rect(
-                CONTENT_BOX_RECT.left + 1, 
-                CONTENT_BOX_RECT.top + 1, 
-                CONTENT_BOX_RECT.width - 2, 
-                CONTENT_BOX_RECT.height - 2
-            )
-            screen.set_clip(clip_rect)
-
-            current_y_render = VIEWPORT_Y_START + scroll_y
-            
-            # Draw the list, applying the scroll offset
-            for t in panel.all_selected_titles:
-                lines = wrap_text_multi(t, list_font, VIEWPORT_WIDTH - 20)
-                y_line = current_y_render
-                
-                # Render and draw lines
-                for line in lines:
-                    text = list_font.render(line, True, WHITE)
-                    screen.blit(text, (VIEWPORT_X_START, y_line))
-                    y_line += text.get_height() + 4
-                
-                current_y_render = y_line + 8 # Spacing between entries
-            
-            # Reset clipping
-            screen.set_clip(None)
-
-            # 4. Draw Scrollbar
-            if total_content_height > VIEWPORT_HEIGHT:
-                SCROLLBAR_WIDTH = 10
-                # Position scrollbar inside the right edge of the content box
-                SCROLLBAR_X = CONTENT_BOX_RECT.right - SCROLLBAR_WIDTH - 10 
-                
-                # Calculate bar height and position relative to the CONTENT_BOX_RECT
-                scrollbar_height_ratio = VIEWPORT_HEIGHT / total_content_height
-                scrollbar_display_height = max(20, VIEWPORT_HEIGHT * scrollbar_height_ratio) # min height 20px
-                
-                # Calculate bar position: map scroll_y (negative) to a positive position
-                scroll_ratio = -scroll_y / max_scroll_down
-                bar_y_offset = (VIEWPORT_HEIGHT - scrollbar_display_height) * scroll_ratio
-                
-                scrollbar_rect = pygame.Rect(
-                    SCROLLBAR_X,
-                    VIEWPORT_Y_START + bar_y_offset,
-                    SCROLLBAR_WIDTH,
-                    scrollbar_display_height
+        elif core.state == DONE:
+
+            # 1-2. Header, reset button and the list box, rendered once
+            with profiler.phase("draw_results"):
+                results_screen = static_layers.get(
+                    "results_screen", render_results_screen, screen.get_size(),
+                    SUMMARY_TITLE_FONT, RESET_SYMBOL_FONT,
+                    tuple(RESET_BUTTON_RECT), tuple(results_list.content_box_rect),
+                    RESULTS_HINT_FONT, None if replayer else
+                    "Tab: this session" if ranking_lines is not None else "Tab: all-time ranking"
                 )
-                
-                # Draw the scrollbar track (background)
-                pygame.draw.rect(screen, SCROLL_TRACK_COLOR, (SCROLLBAR_X, VIEWPORT_Y_START, SCROLLBAR_WIDTH, VIEWPORT_HEIGHT), border_radius=5)
-                # Draw the scrollbar thumb
-                pygame.draw.rect(screen, SCROLL_THUMB_COLOR, scrollbar_rect, border_radius=5)
-            
-        pygame.display.flip()
-        clock.tick(60)
+                screen.blit(results_screen, (0, 0))
+
+                # 3. Draw the visible part of the movie list and its scrollbar
+                results_list.sync(core.selections if ranking_lines is None else ranking_lines)
+                scroll_y = results_list.draw(screen, scroll_y)
+
+        if profiler.show_overlay:
+            with profiler.phase("overlay"):
+                profiler.draw_overlay(screen, profiler_font)
+
+        # The title and results screens are always pushed in full
+        if not dirty_mode or frame_state != RUNNING:
+            dirty.invalidate_all()
+        with profiler.phase("present"):
+            dirty.present()
+        if startup:
+            startup.mark("first frame")
+            print(startup.report())
+            print(f"  system font lookups: {fonts.scans} (the rest came from {FONT_CACHE_PATH})")
+            startup = None
+        last_drawn_state = frame_state
+
+        with profiler.phase("wait"):
+            clock.tick(RENDER_FPS)
+        profiler.end_frame()
+        now = time.perf_counter()
+        frame_time = min(now - last_frame_at, MAX_FRAME_TIME)
+        last_frame_at = now
+        if core.state != RUNNING:
+            accumulator = 0.0 # time on the title and results screens isn't simulated
+        if replayer and replayer.finished:
+            shut_down()
 
 
 if __name__ == "__main__":
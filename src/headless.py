@@ -0,0 +1,230 @@
+# src/headless.py
+"""
+Runs GameCore sessions without pygame, driven by bots.
+
+    python -m src.headless --sessions 5000 --bot random --seed 1
+
+By default each session jumps from one decision to the next with
+GameCore.skip_ticks(); --step runs every tick instead, exactly like the
+rendered game does.
+
+    python -m src.headless --stress 2 --lanes 8 --ticks 3000
+
+is the stress mode: a pair spawns every 2 ticks whatever the player does,
+so hundreds of posters are falling at once, and the tick cost is reported
+against how many were in flight.
+
+    python -m src.headless --scheduler sort --pool 64 --bot alphabetical
+
+lets a pair scheduler (src.scheduler) rank a pool of titles; with the
+alphabetical bot the result is checked against the bot's own order.
+"""
+import argparse
+import json
+import random
+import time
+
+from src.core import (LANE_COUNT, RUNNING, SELECT, SPAWN, GameCore, lane_poster_size, load_movie_categories,
+                      make_movie_pairs, spread_lanes)
+from src.scheduler import DEFAULT_POOL_SIZE, SCHEDULERS, make_scheduler
+
+
+class RandomBot:
+    """Picks a title at random."""
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    def choose(self, titles):
+        return self.rng.randrange(len(titles))
+
+
+class PreferenceBot:
+    """Always picks the title it ranks highest; key defaults to alphabetical order."""
+
+    def __init__(self, key=None):
+        self.key = key or (lambda title: title.casefold())
+
+    def choose(self, titles):
+        return min(range(len(titles)), key=lambda lane: self.key(titles[lane]))
+
+
+class ScriptedBot:
+    """Plays back a fixed list of choices (0: left title, 1: right), one per pair, then stays put."""
+
+    def __init__(self, choices):
+        self.choices = list(choices)
+        self.position = 0
+
+    def choose(self, titles):
+        if self.position >= len(self.choices):
+            return None
+        choice = self.choices[self.position]
+        self.position += 1
+        return choice
+
+
+BOTS = {
+    "random": lambda rng: RandomBot(rng),
+    "alphabetical": lambda rng: PreferenceBot(),
+    "left": lambda rng: ScriptedBot([]),
+}
+
+
+def run_session(movie_pairs, bot, max_picks=None, step=False, max_ticks=10_000_000, lane_count=LANE_COUNT):
+    """
+    Plays one session from the title screen to DONE and returns the finished GameCore.
+    The bot chooses a title whenever a pair spawns; max_picks presses Done early.
+    """
+    core = GameCore(movie_pairs, lane_count=lane_count)
+    core.start()
+
+    while core.state == RUNNING and core.ticks < max_ticks:
+        for event in core.tick():
+            if event[0] == SPAWN:
+                choice = bot.choose(event[2])
+                if choice is not None:
+                    lane = spread_lanes(len(event[2]), core.lane_count)[choice]
+                    while core.player_lane > lane:
+                        core.move_left()
+                    while core.player_lane < lane:
+                        core.move_right()
+            elif event[0] == SELECT and max_picks is not None and len(core.selections) >= max_picks:
+                core.finish()
+
+        if not step:
+            core.skip_ticks(max_ticks - core.ticks)
+
+    return core
+
+
+def pair_agreement(ranking, expected):
+    """Fraction of the ranked title pairs ordered the same way in expected (a top-k ranking covers k titles)."""
+    position = {title: i for i, title in enumerate(ranking)}
+    order = [position[title] for title in expected if title in position]
+    pairs = len(order) * (len(order) - 1) // 2
+    agreeing = sum(order[i] < order[j] for i in range(len(order)) for j in range(i + 1, len(order)))
+    return agreeing / pairs if pairs else 1.0
+
+
+def run_sessions(movie_categories, bot_name, sessions, seed=None, max_picks=None, step=False, lane_count=LANE_COUNT,
+                 scheduler="random", pool_size=DEFAULT_POOL_SIZE, top_k=0):
+    """Runs many sessions, each with its own shuffle. Returns a summary dict."""
+    rng = random.Random(seed)
+    picks = 0
+    ticks = 0
+    ranked = 0 # sessions whose scheduler ranking came out in the bot's own order
+    agreement = 0.0 # fraction of title pairs it put in the bot's order, summed over sessions
+
+    started = time.perf_counter()
+    for _ in range(sessions):
+        movie_pairs = make_scheduler(scheduler, make_movie_pairs(movie_categories, rng), pool_size, top_k,
+                                     rng.getrandbits(64))
+        bot = BOTS[bot_name](rng)
+        core = run_session(movie_pairs, bot, max_picks=max_picks, step=step, lane_count=lane_count)
+        picks += len(core.selections)
+        ticks += core.ticks
+        if scheduler != "random" and isinstance(bot, PreferenceBot):
+            expected = sorted(movie_pairs.titles, key=bot.key)
+            ranking = movie_pairs.ranking()
+            ranked += ranking[:top_k or None] == expected[:top_k or None]
+            agreement += pair_agreement(ranking, expected)
+    elapsed = time.perf_counter() - started
+
+    summary = {
+        "sessions": sessions,
+        "seconds": round(elapsed, 3),
+        "sessions_per_second": round(sessions / elapsed) if elapsed else None,
+        "avg_picks": round(picks / sessions, 2) if sessions else 0,
+        "avg_ticks": round(ticks / sessions) if sessions else 0,
+    }
+    if scheduler != "random" and bot_name == "alphabetical":
+        summary["ranked_exactly"] = round(ranked / sessions, 3) if sessions else 0
+        summary["pair_agreement"] = round(agreement / sessions, 3) if sessions else 0
+    return summary
+
+
+def stress_poster_size(lane_count):
+    """Posters scaled down to fit a lane, keeping the default 216:320 shape."""
+    size = lane_poster_size(lane_count)
+    return lambda title: size
+
+
+def run_stress(movie_categories, spawn_interval, ticks, lane_count=LANE_COUNT, seed=None):
+    """
+    Runs one stress session for ticks ticks, with a pair spawning every
+    spawn_interval ticks and the player wandering between lanes. Returns a
+    summary of the tick cost, grouped by how many posters were in flight.
+    """
+    rng = random.Random(seed)
+    movie_pairs = make_movie_pairs(movie_categories, rng)
+    # Enough pairs to keep spawning for the whole run; titles repeat
+    needed = ticks // spawn_interval + 1
+    movie_pairs = [movie_pairs[i % len(movie_pairs)] for i in range(needed)]
+
+    core = GameCore(movie_pairs, stress_poster_size(lane_count), lane_count, spawn_interval)
+    core.start()
+    buckets = {} # posters in flight, rounded down to 100 -> [ticks, seconds, posters tested for collisions]
+    tick = core.tick
+    clock = time.perf_counter
+
+    started = clock()
+    while core.state == RUNNING and core.ticks < ticks:
+        if rng.random() < 0.05:
+            core.move_left() if rng.random() < 0.5 else core.move_right()
+        in_flight = len(core.posters)
+        before = clock()
+        tick()
+        elapsed = clock() - before
+        bucket = buckets.setdefault(in_flight // 100 * 100, [0, 0.0, 0])
+        bucket[0] += 1
+        bucket[1] += elapsed
+        bucket[2] += len(core.lanes[core.player_lane])
+    total = clock() - started
+
+    return {
+        "lanes": lane_count,
+        "spawn_interval": spawn_interval,
+        "ticks": core.ticks,
+        "seconds": round(total, 3),
+        "picks": len(core.selections),
+        "by_posters_in_flight": {
+            f"{low}-{low + 99}": {
+                "ticks": count,
+                "us_per_tick": round(seconds / count * 1e6, 1),
+                "collision_tests_per_tick": round(tested / count, 1),
+            }
+            for low, (count, seconds, tested) in sorted(buckets.items())
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run game sessions headless with bot players.")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--bot", choices=sorted(BOTS), default="random")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-picks", type=int, default=None, help="press Done after this many picks")
+    parser.add_argument("--step", action="store_true", help="run every tick instead of skipping ahead")
+    parser.add_argument("--lanes", type=int, default=LANE_COUNT, help="lanes on the road")
+    parser.add_argument("--stress", type=int, metavar="TICKS",
+                        help="stress mode: spawn a pair every TICKS ticks and report the tick cost")
+    parser.add_argument("--ticks", type=int, default=3000, help="length of the stress run")
+    parser.add_argument("--scheduler", choices=SCHEDULERS, default="random", help="how the next pair is chosen")
+    parser.add_argument("--pool", type=int, default=DEFAULT_POOL_SIZE, help="titles an adaptive scheduler ranks (default: all of them)")
+    parser.add_argument("--top-k", type=int, default=0, help="sort scheduler: rank only the best K")
+    args = parser.parse_args(argv)
+
+    if args.stress:
+        summary = run_stress(load_movie_categories(), args.stress, args.ticks, args.lanes, seed=args.seed)
+        print(json.dumps(summary, indent=2))
+        return
+
+    summary = run_sessions(load_movie_categories(), args.bot, args.sessions,
+                           seed=args.seed, max_picks=args.max_picks, step=args.step, lane_count=args.lanes,
+                           scheduler=args.scheduler, pool_size=args.pool, top_k=args.top_k)
+    print(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# src/http_client.py
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Status codes worth another try: the server is overloaded or briefly broken
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+# Failures worth another try; any other RequestException counts against the host but isn't retried
+RETRYABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.HTTPError,
+    requests.exceptions.ChunkedEncodingError, # the answer was cut off
+)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of making a request while a host's circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a host that keeps failing.
+
+    After failure_threshold consecutive failures the breaker opens and every
+    call fails fast. Once reset_timeout seconds have passed a single trial
+    call is let through (half-open); success closes the breaker again,
+    failure re-opens it for another reset_timeout.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+            self._trial_in_flight = False
+
+    def release(self):
+        """Ends a call that neither succeeded nor failed (it raised before reaching the host), freeing the trial slot."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into one; every caller gets the same result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}                # key -> _Call in progress
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class HttpClient:
+    """
+    Shared HTTP layer for OMDb and poster downloads.
+
+    Keeps one pooled keep-alive Session per host, applies connect and read
+    timeouts to every request, retries connection errors and 429/5xx answers
+    with jittered exponential backoff, and puts a CircuitBreaker in front of
+    each host. Identical concurrent GETs share a single request.
+    """
+
+    def __init__(self, connect_timeout=3.05, read_timeout=10.0, retries=2,
+                 backoff=0.25, backoff_max=2.0, failure_threshold=5,
+                 reset_timeout=30.0, pool_size=4, verify=True, sleep=time.sleep, clock=time.monotonic):
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.pool_size = pool_size
+        self.verify = verify
+        self.sleep = sleep              # backoff waits
+        self.clock = clock              # the circuit breakers' time
+        self._sessions = {}             # (scheme, netloc) -> Session
+        self._breakers = {}             # (scheme, netloc) -> CircuitBreaker
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+        # Own RNG so backoff jitter never disturbs the game's random sequence
+        self._random = random.Random()
+
+    def _host_state(self, url):
+        parts = urlsplit(url)
+        host = (parts.scheme, parts.netloc)
+        with self._lock:
+            if host not in self._sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+                session.mount(f"{parts.scheme}://", adapter)
+                self._sessions[host] = session
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout, self.clock)
+            return self._sessions[host], self._breakers[host]
+
+    def breaker_for(self, url):
+        return self._host_state(url)[1]
+
+    def get(self, url, params=None):
+        """GETs url and returns the Response. Raises a RequestException subclass on failure."""
+        key = (url, tuple(sorted((params or {}).items())))
+        return self._flights.do(key, lambda: self._get_with_retries(url, params))
+
+    def _get_with_retries(self, url, params):
+        session, breaker = self._host_state(url)
+
+        for attempt in range(self.retries + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {urlsplit(url).netloc}, not calling it")
+
+            try:
+                response = session.get(url, params=params, timeout=self.timeout, verify=self.verify)
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
+            except RETRYABLE_ERRORS:
+                breaker.record_failure()
+                if attempt == self.retries:
+                    raise
+                # Full jitter: sleep anywhere up to the exponential backoff cap
+                delay = min(self.backoff_max, self.backoff * (2 ** attempt))
+                self.sleep(self._random.uniform(0, delay))
+                continue
+            except requests.exceptions.RequestException:
+                # Redirect loops, undecodable bodies and the like: no use retrying
+                breaker.record_failure()
+                raise
+            except BaseException:
+                # Never leave a half-open breaker waiting on a trial that is gone
+                breaker.release()
+                raise
+
+            # Any other answer (including 404) means the host itself is healthy
+            breaker.record_success()
+            return response
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._breakers.clear()
@@ -0,0 +1,44 @@
+# src/layers.py
+import pygame
+
+
+class LayerCache:
+    """
+    Static screen compositions rendered once into display-format surfaces.
+
+    Each layer is built by a function taking the layer's inputs (screen
+    size, fonts, rects...) and returning a Surface. The result is converted
+    to the display format and kept until the layer is asked for with
+    different inputs, so screens that don't change cost a single blit per
+    frame instead of re-rendering their text and shapes.
+    """
+
+    def __init__(self):
+        self._layers = {}               # name -> (inputs, Surface)
+        self.builds = 0
+
+    def get(self, name, build, *inputs):
+        layer = self._layers.get(name)
+        if layer is not None and layer[0] == inputs:
+            return layer[1]
+
+        surface = build(*inputs)
+        # Match the display's pixel format so blits are plain copies
+        if surface.get_flags() & pygame.SRCALPHA:
+            surface = surface.convert_alpha()
+        else:
+            surface = surface.convert()
+        self._layers[name] = (inputs, surface)
+        self.builds += 1
+        return surface
+
+    def clear(self):
+        """Drops every layer, e.g. after the display mode changed."""
+        self._layers.clear()
+
+    def stats(self):
+        return {
+            "layers": len(self._layers),
+            "builds": self.builds,
+            "bytes": sum(surface.get_pitch() * surface.get_height() for _, surface in self._layers.values()),
+        }
@@ -0,0 +1,349 @@
+# src/poster_assets.py
+"""
+Offline poster compiler and the runtime loader for its output.
+
+    python -m src.poster_assets build [--from-cache] [--atlas]
+    python -m src.poster_assets verify
+
+`build` walks the movie catalog and the poster asset directory, scales
+every poster to the in-game size once, and writes the raw pixels in the
+byte order SDL uses for 32-bit display surfaces. Loading one is a file
+read plus pygame.image.frombuffer: no PNG/JPEG decode and no rescale.
+manifest.json records each poster's file, dimensions and sha256, and a
+thumbnail of a few pixels that the game shows while the poster loads.
+With --atlas the posters are packed into a few large pages that the game
+memory-maps and hands out as subsurfaces (see src/poster_atlas.py).
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+
+import pygame
+
+from src.disk_cache import atomic_write
+from src.poster_atlas import ATLAS_PAGE_SIZE, PosterAtlas, poster_checksum, write_atlas
+
+SRC_DIR = os.path.dirname(__file__)
+POSTER_ASSET_DIR = os.path.join(SRC_DIR, "assets", "posters")
+COMPILED_POSTER_DIR = os.path.join(SRC_DIR, "assets", "compiled")
+CATALOG_PATH = os.path.join(SRC_DIR, "data", "movies_by_category.json")
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# In-game poster size (see get_poster_image)
+POSTER_WIDTH = 216
+POSTER_HEIGHT_LIMIT = 320
+
+# Byte order of a little-endian ARGB8888 surface, the usual display format
+PIXEL_FORMAT = "BGRA"
+BYTES_PER_PIXEL = 4
+
+SOURCE_EXTENSIONS = (".jpg", ".png")
+
+THUMBNAIL_SIZE = (6, 9) # pixels kept per poster for its preview, about a poster's 2:3
+
+
+def poster_filename(title):
+    """File-system safe, collision-free file name for a title (titles may contain ':' or '’')."""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", title).strip("_")[:48] or "poster"
+    digest = hashlib.sha1(title.encode("utf-8")).hexdigest()[:10]
+    return f"{slug}-{digest}.{PIXEL_FORMAT.lower()}"
+
+
+def scaled_size(source_size, width, height_limit):
+    """Same sizing rule as the game: fixed width, aspect-correct height capped at height_limit."""
+    source_width, source_height = source_size
+    return width, min(int(width * (source_height / source_width)), height_limit)
+
+
+def make_thumbnail(surface):
+    """A poster's thumbnail as JSON data: the poster's size and THUMBNAIL_SIZE pixels of base64 RGB."""
+    tiny = pygame.transform.smoothscale(surface, THUMBNAIL_SIZE)
+    return {
+        "width": surface.get_width(),
+        "height": surface.get_height(),
+        "size": list(THUMBNAIL_SIZE),
+        "pixels": base64.b64encode(pygame.image.tobytes(tiny, "RGB")).decode("ascii"),
+    }
+
+
+def thumbnail_surface(thumbnail, width, height_limit):
+    """Scales a thumbnail up to the poster's in-game size: a blurred stand-in until the poster has loaded."""
+    tiny = pygame.image.frombytes(base64.b64decode(thumbnail["pixels"]), tuple(thumbnail["size"]), "RGB")
+    size = scaled_size((thumbnail["width"], thumbnail["height"]), width, height_limit)
+    return pygame.transform.smoothscale(tiny, size)
+
+
+# --- Building ---
+
+def load_catalog_titles(catalog_path=CATALOG_PATH):
+    with open(catalog_path, "r", encoding="utf-8") as f:
+        categories = json.load(f)
+    return [title for movies in categories.values() for title in movies]
+
+
+def find_source_images(asset_dir, titles):
+    """
+    Maps titles to source images. Catalog titles are matched the way the game
+    looks them up (title + extension); any other image in the asset directory
+    is compiled under its file name so lookups by that name keep working.
+    """
+    sources = {}
+    if os.path.isdir(asset_dir):
+        for filename in sorted(os.listdir(asset_dir)):
+            stem, ext = os.path.splitext(filename)
+            if ext.lower() in SOURCE_EXTENSIONS:
+                sources.setdefault(stem, os.path.join(asset_dir, filename))
+
+    return {title: sources[title] for title in titles if title in sources} | {
+        stem: path for stem, path in sources.items() if stem not in titles
+    }
+
+
+def compile_surface(source, width, height_limit):
+    """
+    Decodes an image file (path or file object) and returns (surface, has_alpha)
+    with the surface scaled to poster size.
+    """
+    image = pygame.image.load(source)
+    has_alpha = bool(image.get_flags() & pygame.SRCALPHA)
+    if has_alpha:
+        # Posters saved with an alpha channel are usually fully opaque anyway
+        alpha = pygame.image.tobytes(image, "RGBA")[3::4]
+        has_alpha = alpha.count(b"\xff") != len(alpha)
+
+    # smoothscale needs 24/32-bit input, and smoothing an alpha channel that is
+    # all 255 still leaves it slightly below 255; flatten opaque images first
+    if not has_alpha or image.get_bitsize() not in (24, 32):
+        normalised = pygame.Surface(image.get_size(), 0, 32)
+        normalised.blit(image, (0, 0))
+        image = normalised
+    return pygame.transform.smoothscale(image, scaled_size(image.get_size(), width, height_limit)), has_alpha
+
+
+def build(asset_dir=POSTER_ASSET_DIR, output_dir=COMPILED_POSTER_DIR, catalog_path=CATALOG_PATH,
+          width=POSTER_WIDTH, height_limit=POSTER_HEIGHT_LIMIT, cache=None, atlas_page_size=None):
+    """
+    Compiles every poster found for the catalog and writes the manifest.
+    With a DiskCache, catalog titles without a local asset are compiled from
+    poster bytes already downloaded from OMDb (no network calls are made).
+    With atlas_page_size, posters are packed into memory-mappable atlas pages
+    instead of one file each. Returns the manifest dict.
+    """
+    from io import BytesIO
+
+    titles = load_catalog_titles(catalog_path)
+    sources = find_source_images(asset_dir, titles)
+
+    source_names = {title: os.path.basename(path) for title, path in sources.items()}
+
+    if cache is not None:
+        for title in titles:
+            if title in sources:
+                continue
+            metadata = cache.get_json("omdb:" + title)
+            if metadata and metadata.get("Poster") not in ("N/A", None):
+                image_bytes = cache.get_bytes("image:" + metadata["Poster"])
+                if image_bytes is not None:
+                    sources[title] = BytesIO(image_bytes)
+                    source_names[title] = metadata["Poster"]
+
+    os.makedirs(output_dir, exist_ok=True)
+    posters = {}
+    compiled_pixels = {}
+    for title, source in sources.items():
+        try:
+            surface, has_alpha = compile_surface(source, width, height_limit)
+        except pygame.error as e:
+            print(f"Skipping {title}: {e}")
+            continue
+
+        pixels = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        compiled_pixels[title] = (pixels, surface.get_width(), surface.get_height())
+        posters[title] = {
+            "width": surface.get_width(),
+            "height": surface.get_height(),
+            "has_alpha": has_alpha,
+            "sha256": hashlib.sha256(pixels).hexdigest(),
+            "source": source_names[title],
+            "thumbnail": make_thumbnail(surface),
+        }
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "poster_width": width,
+        "poster_height_limit": height_limit,
+        "pixel_format": PIXEL_FORMAT,
+        "posters": posters,
+    }
+
+    if atlas_page_size is not None:
+        page_files, placements = write_atlas(compiled_pixels, output_dir, atlas_page_size)
+        manifest["atlas"] = {
+            "page_width": atlas_page_size[0],
+            "page_height": atlas_page_size[1],
+            "pages": page_files,
+        }
+        for title, (page, x, y) in placements.items():
+            posters[title].update(page=page, x=x, y=y)
+        written = set(page_files)
+        print(f"Packed {len(posters)} posters into {len(page_files)} atlas pages")
+    else:
+        for title, (pixels, _, _) in compiled_pixels.items():
+            posters[title]["file"] = poster_filename(title)
+            atomic_write(os.path.join(output_dir, posters[title]["file"]), pixels)
+            print(f"Compiled {title} -> {posters[title]['file']} ({posters[title]['width']}x{posters[title]['height']})")
+        written = {entry["file"] for entry in posters.values()}
+
+    atomic_write(os.path.join(output_dir, MANIFEST_FILENAME),
+                 json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    # Drop files from earlier builds that no poster points at anymore
+    for filename in os.listdir(output_dir):
+        if filename.endswith("." + PIXEL_FORMAT.lower()) and filename not in written:
+            os.remove(os.path.join(output_dir, filename))
+
+    missing = [title for title in titles if title not in posters]
+    print(f"Compiled {len(posters)} posters into {output_dir}; {len(missing)} catalog titles have no source image")
+    return manifest
+
+
+def verify(output_dir=COMPILED_POSTER_DIR):
+    """Re-hashes every compiled poster against the manifest. Returns the titles that don't match."""
+    with open(os.path.join(output_dir, MANIFEST_FILENAME), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    atlas = manifest.get("atlas")
+    pages = {}
+    bad = []
+    for title, entry in manifest["posters"].items():
+        try:
+            if atlas is not None:
+                if entry["page"] not in pages:
+                    with open(os.path.join(output_dir, atlas["pages"][entry["page"]]), "rb") as f:
+                        pages[entry["page"]] = f.read()
+                checksum = poster_checksum(pages[entry["page"]], atlas["page_width"], entry)
+            else:
+                with open(os.path.join(output_dir, entry["file"]), "rb") as f:
+                    checksum = hashlib.sha256(f.read()).hexdigest()
+            ok = checksum == entry["sha256"]
+        except (OSError, IndexError):
+            ok = False
+        if not ok:
+            bad.append(title)
+    return bad
+
+
+# --- Runtime loading ---
+
+class CompiledPosters:
+    """Looks up pre-scaled posters produced by build(); the manifest is read on first use."""
+
+    def __init__(self, compiled_dir=COMPILED_POSTER_DIR):
+        self.compiled_dir = compiled_dir
+        self._manifest = None
+        self._atlas = None
+        self._lock = threading.Lock()   # prefetch workers may ask first
+
+    def manifest(self):
+        with self._lock:
+            if self._manifest is None:
+                try:
+                    with open(os.path.join(self.compiled_dir, MANIFEST_FILENAME), "r", encoding="utf-8") as f:
+                        manifest = json.load(f)
+                    if manifest.get("version") != MANIFEST_VERSION or manifest.get("pixel_format") != PIXEL_FORMAT:
+                        manifest = {}
+                except (OSError, ValueError):
+                    manifest = {}
+                self._manifest = manifest
+                if "atlas" in manifest:
+                    self._atlas = PosterAtlas(self.compiled_dir, manifest["atlas"], PIXEL_FORMAT)
+            return self._manifest
+
+    def entry(self, title, width, height_limit):
+        """Manifest entry for title if it was compiled at this poster size, else None."""
+        manifest = self.manifest()
+        if manifest.get("poster_width") != width or manifest.get("poster_height_limit") != height_limit:
+            return None
+        return manifest["posters"].get(title)
+
+    def thumbnail(self, title):
+        """The thumbnail build() stored for title (usable at any poster size), or None."""
+        entry = self.manifest().get("posters", {}).get(title)
+        return entry.get("thumbnail") if entry else None
+
+    def load(self, title, width=POSTER_WIDTH, height_limit=POSTER_HEIGHT_LIMIT):
+        """Returns the compiled poster Surface for title, or None if there isn't a usable one."""
+        entry = self.entry(title, width, height_limit)
+        if entry is None:
+            return None
+        if self._atlas is not None:
+            return self._atlas.load(entry)
+
+        size = (entry["width"], entry["height"])
+        try:
+            with open(os.path.join(self.compiled_dir, entry["file"]), "rb") as f:
+                pixels = bytearray(f.read())
+        except OSError:
+            return None
+        if len(pixels) != size[0] * size[1] * BYTES_PER_PIXEL:
+            print(f"Compiled poster for {title} has the wrong size, ignoring it")
+            return None
+
+        surface = pygame.image.frombuffer(pixels, size, PIXEL_FORMAT)
+        # Match the display format so blits are straight copies
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if entry["has_alpha"] else surface.convert()
+        return surface
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-scale poster assets for fast loading.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="compile posters and write the manifest")
+    build_parser.add_argument("--assets", default=POSTER_ASSET_DIR, help="source poster directory")
+    build_parser.add_argument("--output", default=COMPILED_POSTER_DIR, help="compiled poster directory")
+    build_parser.add_argument("--catalog", default=CATALOG_PATH, help="movies_by_category.json to walk")
+    build_parser.add_argument("--width", type=int, default=POSTER_WIDTH)
+    build_parser.add_argument("--height-limit", type=int, default=POSTER_HEIGHT_LIMIT)
+    build_parser.add_argument("--from-cache", metavar="DIR", nargs="?", const="",
+                              help="also compile posters already in the poster disk cache "
+                                   "(defaults to POSTER_CACHE_DIR or .cache/posters)")
+    build_parser.add_argument("--atlas", action="store_true",
+                              help="pack posters into memory-mapped atlas pages instead of one file each")
+    build_parser.add_argument("--page-size", type=int, default=ATLAS_PAGE_SIZE[0],
+                              help="atlas page width and height in pixels")
+
+    verify_parser = subparsers.add_parser("verify", help="check compiled posters against the manifest")
+    verify_parser.add_argument("--output", default=COMPILED_POSTER_DIR, help="compiled poster directory")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "verify":
+        bad = verify(args.output)
+        for title in bad:
+            print(f"Checksum mismatch: {title}")
+        print("All compiled posters intact" if not bad else f"{len(bad)} compiled posters are damaged")
+        return 1 if bad else 0
+
+    cache = None
+    if args.from_cache is not None:
+        from src.disk_cache import DiskCache
+        cache_dir = args.from_cache or os.environ.get(
+            "POSTER_CACHE_DIR", os.path.join(SRC_DIR, "..", ".cache", "posters")
+        )
+        cache = DiskCache(cache_dir)
+
+    atlas_page_size = (args.page_size, args.page_size) if args.atlas else None
+    build(args.assets, args.output, args.catalog, args.width, args.height_limit, cache, atlas_page_size)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
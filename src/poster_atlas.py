@@ -0,0 +1,145 @@
+# src/poster_atlas.py
+import hashlib
+import mmap
+import os
+import threading
+
+import pygame
+
+from src.disk_cache import atomic_write
+
+# 2048x2048 BGRA pages are 16 MB and hold 54 full-size (216x320) posters
+ATLAS_PAGE_SIZE = (2048, 2048)
+BYTES_PER_PIXEL = 4
+
+
+def atlas_page_filename(index):
+    return f"atlas-{index:03d}.bgra"
+
+
+def pack_shelves(sizes, page_size=ATLAS_PAGE_SIZE):
+    """
+    Shelf-packs rectangles into as few pages as possible.
+    sizes maps key -> (width, height); returns key -> (page, x, y).
+    """
+    page_width, page_height = page_size
+    placements = {}
+    page = 0
+    shelf_x = shelf_y = shelf_height = 0
+
+    # Tallest first keeps shelves tight
+    for key, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0])):
+        if width > page_width or height > page_height:
+            raise ValueError(f"{key} ({width}x{height}) does not fit on a {page_width}x{page_height} atlas page")
+
+        if shelf_x + width > page_width:
+            # Start a new shelf below the current one
+            shelf_x = 0
+            shelf_y += shelf_height
+            shelf_height = 0
+        if shelf_y + height > page_height:
+            page += 1
+            shelf_x = shelf_y = shelf_height = 0
+
+        placements[key] = (page, shelf_x, shelf_y)
+        shelf_x += width
+        shelf_height = max(shelf_height, height)
+
+    return placements
+
+
+def write_atlas(posters, output_dir, page_size=ATLAS_PAGE_SIZE):
+    """
+    Packs compiled posters into raw pixel pages.
+    posters maps title -> (pixels, width, height) with 4 bytes per pixel.
+    Returns (page file names, title -> (page, x, y)).
+    """
+    placements = pack_shelves({title: (w, h) for title, (_, w, h) in posters.items()}, page_size)
+    page_count = max((page for page, _, _ in placements.values()), default=-1) + 1
+    page_width, page_height = page_size
+    stride = page_width * BYTES_PER_PIXEL
+
+    pages = [bytearray(stride * page_height) for _ in range(page_count)]
+    for title, (page, x, y) in placements.items():
+        pixels, width, height = posters[title]
+        row_bytes = width * BYTES_PER_PIXEL
+        for row in range(height):
+            start = (y + row) * stride + x * BYTES_PER_PIXEL
+            pages[page][start:start + row_bytes] = pixels[row * row_bytes:(row + 1) * row_bytes]
+
+    filenames = []
+    for index, page in enumerate(pages):
+        filename = atlas_page_filename(index)
+        atomic_write(os.path.join(output_dir, filename), bytes(page))
+        filenames.append(filename)
+    return filenames, placements
+
+
+def read_atlas_pixels(page_bytes, page_width, x, y, width, height):
+    """Copies one poster's rows back out of a page (used to verify checksums)."""
+    stride = page_width * BYTES_PER_PIXEL
+    row_bytes = width * BYTES_PER_PIXEL
+    return b"".join(
+        page_bytes[(y + row) * stride + x * BYTES_PER_PIXEL:(y + row) * stride + x * BYTES_PER_PIXEL + row_bytes]
+        for row in range(height)
+    )
+
+
+def poster_checksum(page_bytes, page_width, entry):
+    pixels = read_atlas_pixels(page_bytes, page_width, entry["x"], entry["y"], entry["width"], entry["height"])
+    return hashlib.sha256(pixels).hexdigest()
+
+
+class PosterAtlas:
+    """
+    Memory-mapped atlas pages with posters handed out as subsurfaces.
+
+    Each page file is mapped copy-on-write and wrapped by
+    pygame.image.frombuffer, so poster surfaces are views straight into
+    the mapping: nothing is decoded or copied, pages nobody looks at are
+    never read from disk, and every game process on the host shares the
+    same cached pages.
+    """
+
+    def __init__(self, compiled_dir, atlas_manifest, pixel_format):
+        self.compiled_dir = compiled_dir
+        self.page_files = atlas_manifest["pages"]
+        self.page_size = (atlas_manifest["page_width"], atlas_manifest["page_height"])
+        self.pixel_format = pixel_format
+        self._pages = {}                # index -> (mmap, Surface)
+        self._lock = threading.Lock()   # prefetch workers map pages concurrently
+
+    def _page_surface(self, index):
+        with self._lock:
+            if index not in self._pages:
+                path = os.path.join(self.compiled_dir, self.page_files[index])
+                with open(path, "rb") as f:
+                    expected = self.page_size[0] * self.page_size[1] * BYTES_PER_PIXEL
+                    if os.fstat(f.fileno()).st_size != expected:
+                        raise ValueError(f"Atlas page {self.page_files[index]} has the wrong size")
+                    # ACCESS_COPY: shared with the page cache until written, and a
+                    # stray write can't fault or change the file
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                surface = pygame.image.frombuffer(mapping, self.page_size, self.pixel_format)
+                self._pages[index] = (mapping, surface)
+            return self._pages[index][1]
+
+    def load(self, entry):
+        """Returns a subsurface view of the poster described by a manifest entry, or None."""
+        try:
+            page = self._page_surface(entry["page"])
+        except (OSError, ValueError, IndexError) as e:
+            print(f"Error mapping poster atlas: {e}")
+            return None
+
+        surface = page.subsurface((entry["x"], entry["y"], entry["width"], entry["height"]))
+        if not entry["has_alpha"]:
+            # Opaque posters: plain copies instead of per-pixel blending
+            surface.set_alpha(None)
+        return surface
+
+    def close(self):
+        # Poster subsurfaces still export the mappings, so just drop our references;
+        # each mapping is released once the last surface using it is gone
+        with self._lock:
+            self._pages.clear()
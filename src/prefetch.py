@@ -0,0 +1,168 @@
+# src/prefetch.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PosterPrefetcher:
+    """
+    Resolves poster surfaces on a small worker pool ahead of the frame loop.
+
+    The game calls schedule() with the pair list and the index of the pair
+    about to fall; the next `lookahead` pairs are queued for loading. get()
+    never blocks: it hands back a finished surface, or None when the poster
+    is not ready yet so the caller can show a preview instead and collect()
+    the full poster when it arrives.
+
+    With a previewer, every queued title also gets its preview made on a
+    worker of its own (disk only, so it isn't held up behind downloads);
+    preview() hands it over, again without blocking.
+    """
+
+    def __init__(self, loader, lookahead=3, workers=2, previewer=None):
+        self.loader = loader            # callable(title) -> Surface
+        self.previewer = previewer      # callable(title) -> Surface or None, if any
+        self.lookahead = lookahead
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="poster-prefetch")
+        self._preview_executor = None
+        if previewer is not None:
+            self._preview_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="poster-preview")
+        self._lock = threading.Lock()
+        self._pending = {}              # title -> Future still loading
+        self._ready = {}                # title -> finished Surface
+        self._previews = {}             # title -> preview Surface, None while it is made or if there is none
+        self._wanted = set()            # titles of the pairs the last schedule() looked at
+        self._generation = 0            # bumped by cancel() to drop stale results
+        self.hits = 0
+        self.misses = 0
+
+    def schedule(self, movie_pairs, start_index):
+        """
+        Queues every title in the next `lookahead` pairs that isn't already
+        loading. An adaptive scheduler lists the pairs of every outcome that
+        could come first (upcoming()), so both branches get loaded.
+        """
+        upcoming = getattr(movie_pairs, "upcoming", None)
+        if upcoming is not None:
+            pairs = upcoming(start_index, self.lookahead)
+        else:
+            pairs = movie_pairs[start_index:start_index + self.lookahead]
+        with self._lock:
+            self._wanted = {title for pair in pairs for title in pair}
+            # Spawning takes the previews it uses before this; the rest are for pairs no longer coming
+            self._previews = {title: self._previews[title] for title in self._wanted if title in self._previews}
+        for pair in pairs:
+            for title in pair:
+                self._submit(title)
+
+    def _submit(self, title):
+        with self._lock:
+            if self._preview_executor is not None and title not in self._previews and title not in self._ready:
+                self._previews[title] = None
+                self._preview_executor.submit(self._make_preview, title, self._generation)
+            if title in self._pending or title in self._ready:
+                return
+            self._pending[title] = self._executor.submit(self._load, title, self._generation)
+
+    def _make_preview(self, title, generation):
+        try:
+            surface = self.previewer(title)
+        except Exception as e:
+            print(f"Preview failed for {title}: {e}")
+            surface = None
+
+        with self._lock:
+            # Only if it's still wanted: not reset, taken or dropped meanwhile
+            if surface is not None and generation == self._generation and title in self._previews:
+                self._previews[title] = surface
+
+    def _load(self, title, generation):
+        try:
+            surface = self.loader(title)
+        except Exception as e:
+            print(f"Prefetch failed for {title}: {e}")
+            surface = None
+
+        with self._lock:
+            # A reset happened while this poster was loading: throw it away
+            if generation != self._generation:
+                return
+            # The game already gave up on this title and used a placeholder
+            if self._pending.pop(title, None) is None:
+                return
+            if surface is not None:
+                self._ready[title] = surface
+
+    def get(self, title, keep_loading=False):
+        """
+        Returns the prefetched surface for title, or None if it isn't ready yet.
+        On a miss the load is dropped, unless keep_loading: then it goes on
+        (or starts) so collect() can pick the surface up on a later frame.
+        """
+        with self._lock:
+            surface = self._ready.pop(title, None)
+            if surface is not None:
+                self.hits += 1
+                self._previews.pop(title, None)
+                return surface
+
+            self.misses += 1
+            if keep_loading:
+                if title not in self._pending:
+                    self._pending[title] = self._executor.submit(self._load, title, self._generation)
+                return None
+            # The caller is going ahead with a placeholder, so stop waiting on this one
+            future = self._pending.pop(title, None)
+            if future is not None:
+                future.cancel()
+            return None
+
+    def preview(self, title):
+        """The preview made for title, or None if there is none (yet). Never blocks."""
+        with self._lock:
+            return self._previews.pop(title, None)
+
+    def collect(self, title):
+        """The surface of a title get() missed with keep_loading, once it has loaded; None until then."""
+        with self._lock:
+            return self._ready.pop(title, None)
+
+    def discard(self, title):
+        """
+        Gives up on a title get() missed with keep_loading, whose poster went
+        before it loaded: drops the load, or the surface it left unclaimed.
+        Titles an upcoming pair needs again are kept.
+        """
+        with self._lock:
+            if title in self._wanted:
+                return
+            future = self._pending.pop(title, None)
+            if future is not None:
+                future.cancel()
+            self._ready.pop(title, None)
+
+    def cancel(self):
+        """Drops all queued and finished work; loads already running are discarded when they finish."""
+        with self._lock:
+            self._generation += 1
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._ready.clear()
+            self._previews.clear()
+            self._wanted = set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "queue_depth": len(self._pending),
+                "ready": len(self._ready),
+                "previews": sum(surface is not None for surface in self._previews.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._preview_executor is not None:
+            self._preview_executor.shutdown(wait=False, cancel_futures=True)
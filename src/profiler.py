@@ -0,0 +1,242 @@
+# src/profiler.py
+import json
+import os
+import time
+from collections import deque
+
+from src.disk_cache import atomic_write
+
+FRAME_BUDGET_MS = 1000 / 60
+IDLE_PHASES = ("wait",) # time spent sleeping for the frame cap doesn't count against the budget
+
+
+def percentile(sorted_values, pct):
+    """Linear interpolation between the closest ranks."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class _Phase:
+    """Context manager timing one phase; nested phases are subtracted from their parent's own time."""
+
+    __slots__ = ("profiler", "name", "started", "child_time")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.child_time = 0.0
+        self.profiler._stack.append(self)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        ended = time.perf_counter()
+        profiler = self.profiler
+        profiler._stack.pop()
+        duration = ended - self.started
+        if profiler._stack:
+            profiler._stack[-1].child_time += duration
+        profiler._record(self.name, self.started, duration, duration - self.child_time)
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+
+class NullProfiler:
+    """Stands in when profiling is off, so the game loop needs no special cases."""
+
+    enabled = False
+    show_overlay = False
+
+    def begin_frame(self):
+        pass
+
+    def phase(self, name):
+        return _NULL_PHASE
+
+    def end_frame(self):
+        pass
+
+
+class FrameProfiler:
+    """
+    Times each phase of the game loop.
+
+    Wrap the work in `with profiler.phase("name"):` between begin_frame()
+    and end_frame(). Every phase keeps a rolling window of its own time
+    (nested phases are not counted twice) for p50/p95/p99. A frame whose
+    non-idle time goes over budget_ms is reported with the phase that
+    took longest. Phases are also kept as Chrome trace events, for
+    chrome://tracing or Perfetto.
+    """
+
+    enabled = True
+
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, window=600, max_trace_events=200_000):
+        self.budget_ms = budget_ms
+        self.window = window
+        self.history = {}               # phase -> deque of ms per frame
+        self.slow_frames = deque(maxlen=100) # (frame, total ms, phase, phase ms)
+        self.trace_events = deque(maxlen=max_trace_events)
+        self.frame = 0
+        self.show_overlay = False
+        self._stack = []
+        self._frame_phases = {}         # phase -> own seconds this frame
+        self._frame_started = 0.0
+        self._origin = time.perf_counter()
+        self._overlay = None            # (frame it was rendered on, Surface)
+
+    # --- Recording ---
+
+    def begin_frame(self):
+        self._frame_phases = {}
+        self._frame_started = time.perf_counter()
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def _record(self, name, started, duration, own_time):
+        self._frame_phases[name] = self._frame_phases.get(name, 0.0) + own_time
+        self.trace_events.append({
+            "name": name, "cat": "phase", "ph": "X", "pid": 1, "tid": 1,
+            "ts": round((started - self._origin) * 1e6, 1), "dur": round(duration * 1e6, 1),
+        })
+
+    def end_frame(self):
+        ended = time.perf_counter()
+        busy_ms = 0.0
+        for name, seconds in self._frame_phases.items():
+            ms = seconds * 1000
+            if name not in self.history:
+                self.history[name] = deque(maxlen=self.window)
+            self.history[name].append(ms)
+            if name not in IDLE_PHASES:
+                busy_ms += ms
+
+        if "frame" not in self.history:
+            self.history["frame"] = deque(maxlen=self.window)
+        self.history["frame"].append(busy_ms)
+        self.trace_events.append({
+            "name": f"frame {self.frame}", "cat": "frame", "ph": "X", "pid": 1, "tid": 0,
+            "ts": round((self._frame_started - self._origin) * 1e6, 1),
+            "dur": round((ended - self._frame_started) * 1e6, 1),
+        })
+
+        if busy_ms > self.budget_ms:
+            busy_phases = [(seconds, name) for name, seconds in self._frame_phases.items() if name not in IDLE_PHASES]
+            seconds, culprit = max(busy_phases) if busy_phases else (0.0, "?")
+            self.slow_frames.append((self.frame, busy_ms, culprit, seconds * 1000))
+            print(f"Slow frame {self.frame}: {busy_ms:.1f} ms (budget {self.budget_ms:.1f} ms), "
+                  f"mostly {culprit} ({seconds * 1000:.1f} ms)")
+        self.frame += 1
+
+    # --- Reporting ---
+
+    def percentiles(self):
+        """phase -> {"p50", "p95", "p99", "max"} in ms over the rolling window."""
+        stats = {}
+        for name, values in self.history.items():
+            ordered = sorted(values)
+            stats[name] = {
+                "p50": round(percentile(ordered, 50), 3),
+                "p95": round(percentile(ordered, 95), 3),
+                "p99": round(percentile(ordered, 99), 3),
+                "max": round(ordered[-1], 3) if ordered else 0.0,
+            }
+        return stats
+
+    def report(self):
+        lines = [f"Frame profile over the last {len(self.history.get('frame', ()))} frames "
+                 f"({len(self.slow_frames)} recent frames over {self.budget_ms:.1f} ms):"]
+        for name, stats in sorted(self.percentiles().items(), key=lambda item: -item[1]["p95"]):
+            lines.append(f"  {name:14} p50 {stats['p50']:7.3f}  p95 {stats['p95']:7.3f}  "
+                         f"p99 {stats['p99']:7.3f}  max {stats['max']:7.3f} ms")
+        return "\n".join(lines)
+
+    def write_trace(self, path):
+        """Writes the recorded phases as Chrome trace-event JSON."""
+        trace = {"traceEvents": list(self.trace_events), "displayTimeUnit": "ms"}
+        atomic_write(path, json.dumps(trace).encode("utf-8"))
+        print(f"Frame trace written to {path} ({len(self.trace_events)} events)")
+
+    def draw_overlay(self, surface, font, refresh_frames=30):
+        """Draws the percentiles in the top-left corner; returns the rect it covered."""
+        import pygame
+
+        if self._overlay is None or self.frame - self._overlay[0] >= refresh_frames:
+            lines = [f"{'phase':12}{'p50':>8}{'p95':>8}{'p99':>8}"]
+            for name, stats in sorted(self.percentiles().items(), key=lambda item: -item[1]["p95"]):
+                lines.append(f"{name[:12]:12}{stats['p50']:8.2f}{stats['p95']:8.2f}{stats['p99']:8.2f}")
+            lines.append(f"slow frames: {len(self.slow_frames)}")
+
+            rendered = [font.render(line, True, (255, 255, 255)) for line in lines]
+            width = max(text.get_width() for text in rendered) + 12
+            height = sum(text.get_height() for text in rendered) + 12
+            overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 170))
+            y = 6
+            for text in rendered:
+                overlay.blit(text, (6, y))
+                y += text.get_height()
+            self._overlay = (self.frame, overlay)
+
+        return surface.blit(self._overlay[1], (4, 4))
+
+
+def seconds_since_process_start():
+    """How long this process has been running, from /proc; None where that isn't available."""
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # Fields after the command name; starttime is field 22 of the full line
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class StartupTimer:
+    """
+    Splits the time from process start to the first presented frame into
+    named steps. started is a perf_counter() value taken as early as
+    possible; the interpreter's own start-up before it is read from /proc
+    where the OS offers it.
+    """
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        before = seconds_since_process_start()
+        if before is not None:
+            before -= time.perf_counter() - self.started
+        self.marks = [("interpreter", max(0.0, before))] if before is not None else []
+        self._last = self.started
+
+    def mark(self, name):
+        """Ends the step called name."""
+        now = time.perf_counter()
+        self.marks.append((name, now - self._last))
+        self._last = now
+
+    def report(self):
+        total = sum(seconds for _, seconds in self.marks)
+        lines = [f"Startup: {total * 1000:.1f} ms to the first frame"]
+        for name, seconds in self.marks:
+            lines.append(f"  {name:14} {seconds * 1000:8.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,288 @@
+# src/replay.py
+"""
+Recording game sessions and playing them back.
+
+    python main.py --record session.mmr       # play; every input is logged
+    python main.py --replay session.mmr       # watch it again, rendered
+    python -m src.replay session.mmr          # re-run it headless at full speed
+
+A log is a short header (seed, catalog, categories) followed by one record
+per input, stamped with the simulation tick it was applied before. Ticks
+are stored as varint deltas, so a record is usually two or three bytes.
+Besides the player's keys and clicks the log keeps the size of every
+spawned poster, since that depends on what the network delivered in time
+and decides when a poster reaches the player. Each session ends with a
+checkpoint of its selections, which a replay checks itself against.
+"""
+import argparse
+import json
+import struct
+import time
+import zlib
+from collections import deque, namedtuple
+
+from src.catalog import CATALOG_DB_PATH, open_catalog
+from src.core import LANE_COUNT, RUNNING, SIMULATION_HZ, GameCore
+from src.scheduler import make_pairs
+
+MAGIC = b"MMRS"
+LOG_VERSION = 1
+
+# --- Record types ---
+START = 0           # space on the title screen
+LEFT = 1
+RIGHT = 2
+FINISH = 3          # the Done button
+RESET = 4           # reset button; value: seed of the new pair order
+SIZES = 5           # value: (width, height) of each poster of the pair about to spawn
+PANEL_SCROLL = 6    # value: panel scroll offset
+RESULTS_SCROLL = 7  # value: results list scroll offset
+RENDER_MODE = 8     # F3; rendering only
+CHECKPOINT = 9      # value: (selection count, crc32 of the selections)
+
+Record = namedtuple("Record", "tick kind value")
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+def _unzigzag(value):
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+def selections_checksum(selections):
+    return len(selections), zlib.crc32("\n".join(selections).encode("utf-8"))
+
+
+class SessionRecorder:
+    """Appends input records to a log file as they happen."""
+
+    def __init__(self, path, seed, catalog_movies, categories=None, lanes=LANE_COUNT, spawn_interval=None,
+                 scheduler=None):
+        self.path = path
+        self._file = open(path, "wb")
+        metadata = json.dumps({
+            "catalog_movies": catalog_movies,
+            "categories": categories,
+            "lanes": lanes,
+            "spawn_interval": spawn_interval,
+            "scheduler": scheduler,
+            "simulation_hz": SIMULATION_HZ,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }).encode("utf-8")
+        self._file.write(MAGIC + struct.pack("<BQH", LOG_VERSION, seed, len(metadata)) + metadata)
+        self._tick = 0                  # tick of the previous record in this session
+        self.records = 0
+
+    def record(self, kind, tick, value=None):
+        out = bytearray((kind,))
+        _write_varint(out, tick - self._tick)
+        if kind == RESET:
+            out += struct.pack("<Q", value)
+        elif kind == SIZES:
+            out.append(len(value))
+            for width, height in value:
+                _write_varint(out, width)
+                _write_varint(out, height)
+        elif kind in (PANEL_SCROLL, RESULTS_SCROLL):
+            _write_varint(out, _zigzag(value))
+        elif kind == CHECKPOINT:
+            out += struct.pack("<II", *value)
+        self._file.write(out)
+        # A reset starts a new session, whose ticks count from zero again
+        self._tick = 0 if kind == RESET else tick
+        self.records += 1
+
+    def checkpoint(self, tick, selections):
+        self.record(CHECKPOINT, tick, selections_checksum(selections))
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+            print(f"Session recorded to {self.path} ({self.records} records)")
+
+
+class SessionLog:
+    """A recorded log, read into memory."""
+
+    def __init__(self, seed, metadata, records):
+        self.seed = seed
+        self.metadata = metadata
+        self.records = records
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:4] != MAGIC:
+            raise ValueError(f"{path} is not a session log")
+        version, seed, metadata_length = struct.unpack_from("<BQH", data, 4)
+        if version != LOG_VERSION:
+            raise ValueError(f"{path} is a version {version} session log, expected {LOG_VERSION}")
+        pos = 4 + struct.calcsize("<BQH")
+        metadata = json.loads(data[pos:pos + metadata_length].decode("utf-8"))
+        pos += metadata_length
+
+        records = []
+        tick = 0
+        while pos < len(data):
+            kind = data[pos]
+            delta, pos = _read_varint(data, pos + 1)
+            tick += delta
+            value = None
+            if kind == RESET:
+                (value,), pos = struct.unpack_from("<Q", data, pos), pos + 8
+            elif kind == SIZES:
+                count = data[pos]
+                pos += 1
+                sizes = []
+                for _ in range(count):
+                    width, pos = _read_varint(data, pos)
+                    height, pos = _read_varint(data, pos)
+                    sizes.append((width, height))
+                value = tuple(sizes)
+            elif kind in (PANEL_SCROLL, RESULTS_SCROLL):
+                raw, pos = _read_varint(data, pos)
+                value = _unzigzag(raw)
+            elif kind == CHECKPOINT:
+                value, pos = struct.unpack_from("<II", data, pos), pos + 8
+            records.append(Record(tick, kind, value))
+            if kind == RESET:
+                tick = 0
+        return cls(seed, metadata, records)
+
+
+class ReplayDivergedError(Exception):
+    """The game got ahead of the log: it no longer behaves the way it did when recorded."""
+
+
+class Replayer:
+    """Hands out the records of a log as the replayed game reaches their ticks."""
+
+    def __init__(self, log):
+        self.log = log
+        self.position = 0
+        self.mismatches = []            # (session, recorded checksum, replayed checksum)
+        self.sessions = 0
+
+    @property
+    def finished(self):
+        return self.position >= len(self.log.records)
+
+    def next_tick(self):
+        return None if self.finished else self.log.records[self.position].tick
+
+    def due(self, ticks):
+        """The records to apply now that the game has run `ticks` ticks of its session."""
+        records = self.log.records
+        if not self.finished and records[self.position].tick < ticks:
+            raise ReplayDivergedError(
+                f"record {self.position} was due at tick {records[self.position].tick}, the game is at {ticks}"
+            )
+        due = []
+        while not self.finished and records[self.position].tick == ticks:
+            record = records[self.position]
+            self.position += 1
+            due.append(record)
+            if record.kind == RESET:
+                break # the records after it belong to the next session, from tick 0
+        return due
+
+    def check(self, record, selections):
+        """Compares a CHECKPOINT record with the selections the replay made."""
+        self.sessions += 1
+        replayed = selections_checksum(selections)
+        if tuple(record.value) != replayed:
+            self.mismatches.append((self.sessions, tuple(record.value), replayed))
+
+
+def replay_headless(log, catalog, categories=None):
+    """Re-runs a log on GameCore alone, as fast as it goes. Returns the Replayer."""
+    replayer = Replayer(log)
+    sizes = deque()
+
+    def poster_size(title):
+        if not sizes:
+            raise ReplayDivergedError(f"{title} spawned at tick {core.ticks} without a recorded size")
+        return sizes.popleft()
+
+    core = GameCore([], poster_size, log.metadata.get("lanes", LANE_COUNT), log.metadata.get("spawn_interval"))
+    scheduler = log.metadata.get("scheduler") or {"mode": "random"}
+
+    while True:
+        for record in replayer.due(core.ticks):
+            kind = record.kind
+            if kind == RESET:
+                sizes.clear()
+                core.reset(make_pairs(catalog, categories, record.value, scheduler["mode"],
+                                      scheduler.get("pool"), scheduler.get("top_k", 0)))
+            elif kind == START:
+                core.start()
+            elif kind == LEFT:
+                core.move_left()
+            elif kind == RIGHT:
+                core.move_right()
+            elif kind == FINISH:
+                core.finish()
+            elif kind == SIZES:
+                sizes.extend(record.value)
+            elif kind == CHECKPOINT:
+                replayer.check(record, core.selections)
+
+        if replayer.finished:
+            break
+        if core.state == RUNNING:
+            # Nothing but movement happens until the next record or collision
+            core.skip_ticks(replayer.next_tick() - core.ticks)
+            if core.ticks < replayer.next_tick():
+                core.tick()
+        elif replayer.next_tick() != core.ticks:
+            raise ReplayDivergedError(f"the session ended at tick {core.ticks}, the log goes on to {replayer.next_tick()}")
+
+    return replayer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded session headless, as fast as possible.")
+    parser.add_argument("log", help="session log written by main.py --record")
+    parser.add_argument("--catalog", default=CATALOG_DB_PATH)
+    parser.add_argument("--repeat", type=int, default=1, help="replay it this many times, for timing")
+    args = parser.parse_args(argv)
+
+    log = SessionLog.load(args.log)
+    catalog = open_catalog(args.catalog)
+    categories = log.metadata.get("categories")
+    if catalog.count(categories) != log.metadata.get("catalog_movies"):
+        print(f"Warning: the catalog has {catalog.count(categories)} movies, "
+              f"the log was recorded with {log.metadata.get('catalog_movies')}; pairs will differ")
+
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        replayer = replay_headless(log, catalog, categories)
+    elapsed = time.perf_counter() - started
+
+    print(f"Replayed {len(log.records)} records, {replayer.sessions} sessions, "
+          f"{args.repeat}x in {elapsed:.3f}s ({elapsed / args.repeat * 1000:.2f} ms per replay)")
+    for session, recorded, replayed in replayer.mismatches:
+        print(f"  session {session}: recorded {recorded[0]} picks (crc {recorded[1]:08x}), "
+              f"replayed {replayed[0]} (crc {replayed[1]:08x})")
+    return 1 if replayer.mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
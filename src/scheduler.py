@@ -0,0 +1,306 @@
+# src/scheduler.py
+"""
+What pair comes next.
+
+    random       the catalog shuffled into disjoint pairs (catalog.PairSequence)
+    sort         a merge sort of a pool of titles, one pick per comparison: a full
+                 ranking in about n log2 n picks. With a top_k, binary insertion
+                 into the best k instead, about n log2 k picks.
+    information  the pair whose outcome says the most about the ranking so far,
+                 for a fixed number of picks
+
+The adaptive schedulers decide each pair from the picks before it. GameCore
+reports every outcome to them (choose()) before it asks for the next pair,
+so they stand in for a sequence of pairs; len() counts the pairs decided so
+far. upcoming() also lists the pairs each possible outcome would lead to, so
+the prefetcher can load the posters of both branches before the pick.
+
+The pool is the whole catalog unless a pool size is given. The sort keeps
+where it is as a small persistent state (the runs merged so far and the
+merge under way), so a pick moves it on in O(1) amortized and upcoming()
+branches by sharing it rather than copying it.
+"""
+import abc
+import math
+import random
+
+from src.choices import ELO_INITIAL, ELO_K
+
+SCHEDULERS = ("random", "sort", "information")
+DEFAULT_POOL_SIZE = None # titles ranked by the adaptive schedulers; None for every title in the pair order
+
+
+def pool_titles(pairs, size=None):
+    """The first size distinct titles of a pair sequence (already in random order), or all of them."""
+    pool = {}
+    for pair in pairs:
+        for title in pair:
+            pool.setdefault(title, None)
+        if size is not None and len(pool) >= size:
+            break
+    return list(pool)[:size]
+
+
+class PairScheduler(abc.ABC):
+    """
+    Base of the adaptive schedulers. Subclasses work out the next pair from
+    an outcome state: next_pair(state) returns a pair or None when done, and
+    with_outcome(state, pair, winner) returns the state after that pick.
+    States are never changed in place, so upcoming() can branch on them.
+    """
+
+    def __init__(self, titles, state):
+        self.titles = list(titles)
+        self._state = state
+        self._pairs = []                # every pair handed out, the last one waiting for its pick
+        self._decide()
+
+    def _decide(self):
+        pair = self.next_pair(self._state)
+        if pair is not None:
+            self._pairs.append(pair)
+
+    def __len__(self):
+        return len(self._pairs)
+
+    def __getitem__(self, index):
+        return self._pairs[index]
+
+    def choose(self, index, winner):
+        """The pick for pair index: winner is one of its titles, or None if the pair went by unpicked."""
+        if index != len(self._pairs) - 1:
+            return # not the pair being waited on
+        if winner is not None:
+            self._state = self.with_outcome(self._state, self._pairs[index], winner)
+        # With no pick, the same comparison comes back
+        self._decide()
+
+    def upcoming(self, start, count):
+        """
+        Every pair that could be shown at indexes start to start + count - 1:
+        the ones already decided, then the next pair of each possible outcome.
+        Each pair looked ahead doubles the outcomes followed, so keep count
+        small (the prefetch lookahead is 3).
+        """
+        pairs = list(self._pairs[start:start + count])
+        known = len(self._pairs)
+        if not pairs and start > known:
+            return pairs
+        # The last handed-out pair is still open; branch on it
+        states = [self._state]
+        if self._pairs:
+            last = self._pairs[-1]
+            states = [self.with_outcome(self._state, last, winner) for winner in last]
+        for _ in range(max(0, start + count - max(known, start))):
+            next_states = []
+            for state in states:
+                pair = self.next_pair(state)
+                if pair is None:
+                    continue
+                if pair not in pairs:
+                    pairs.append(pair)
+                next_states.extend(self.with_outcome(state, pair, winner) for winner in pair)
+            states = next_states
+        return pairs
+
+    @abc.abstractmethod
+    def ranking(self):
+        """The titles best first, as far as the picks so far tell."""
+
+    @abc.abstractmethod
+    def next_pair(self, state):
+        """The pair to ask about next in state, or None when there is nothing left to ask."""
+
+    @abc.abstractmethod
+    def with_outcome(self, state, pair, winner):
+        """A new state: state plus winner picked from pair."""
+
+
+class SortScheduler(PairScheduler):
+    """
+    Sorts the pool by the player's picks, one comparison per pick. No two
+    titles are compared twice.
+
+    A full ranking is a bottom-up merge sort. Its state is a tuple
+    (next title to take, stack of sorted runs, merge under way): the stack
+    is a linked list of (run, rest) cells and the merge is (left, right, i,
+    j, merged so far as a linked list, newest first), all shared between
+    states, so a pick builds a single new cell. Runs are merged as soon as
+    the top two have the same length, which keeps the merges balanced.
+
+    With a top_k it is binary insertion into the best k instead: the state
+    is (next title, best k so far, low, high), low and high None while the
+    title is still to be compared with the k-th.
+    """
+
+    def __init__(self, titles, top_k=0):
+        self.top_k = top_k
+        titles = list(titles)
+        self.wins = {title: 0 for title in titles}
+        if top_k:
+            state = self._insert_from((0, (), None, None), titles)
+        else:
+            state = self._merge_from((0, None, None), titles)
+        super().__init__(titles, state)
+
+    def choose(self, index, winner):
+        if winner is not None and index == len(self._pairs) - 1:
+            self.wins[winner] += 1
+        super().choose(index, winner)
+
+    def next_pair(self, state):
+        if self.top_k:
+            taken, top, low, high = state
+            if taken >= len(self.titles):
+                return None
+            # A full top k: the k-th first, which turns away anything below it
+            return self.titles[taken], top[-1 if low is None else (low + high) // 2]
+        merge = state[2]
+        if merge is None:
+            return None
+        left, right, i, j, _ = merge
+        return left[i], right[j]
+
+    def with_outcome(self, state, pair, winner):
+        if self.top_k:
+            taken, top, low, high = state
+            won = winner == pair[0]
+            if low is None:
+                if not won:
+                    return self._insert_from((taken + 1, top, None, None), self.titles)
+                low, high = 0, len(top) - 1
+            elif won:
+                high = (low + high) // 2
+            else:
+                low = (low + high) // 2 + 1
+            return self._insert_from((taken, top, low, high), self.titles)
+
+        taken, stack, (left, right, i, j, merged) = state
+        if winner == left[i]:
+            merge = (left, right, i + 1, j, (left[i], merged))
+        else:
+            merge = (left, right, i, j + 1, (right[j], merged))
+        return self._merge_from((taken, stack, merge), self.titles)
+
+    @staticmethod
+    def _merge_from(state, titles):
+        """Runs the merge sort on from state up to its next comparison, or to the end."""
+        taken, stack, merge = state
+        while True:
+            if merge is not None:
+                left, right, i, j, merged = merge
+                if i < len(left) and j < len(right):
+                    return taken, stack, merge
+                run = []
+                while merged is not None:
+                    run.append(merged[0])
+                    merged = merged[1]
+                run.reverse()
+                stack = (tuple(run) + left[i:] + right[j:], stack)
+                merge = None
+            elif stack is not None and stack[1] is not None and (
+                    len(stack[0]) == len(stack[1][0]) or taken >= len(titles)):
+                # The run below holds earlier titles: it goes on the left
+                merge = (stack[1][0], stack[0], 0, 0, None)
+                stack = stack[1][1]
+            elif taken < len(titles):
+                stack = ((titles[taken],), stack)
+                taken += 1
+            else:
+                return taken, stack, merge
+
+    def _insert_from(self, state, titles):
+        """Runs the insertion on from state up to its next comparison, or to the end."""
+        taken, top, low, high = state
+        while taken < len(titles):
+            if low is None:
+                if len(top) == self.top_k:
+                    break
+                low, high = 0, len(top)
+            if low < high:
+                break
+            top = (top[:low] + (titles[taken],) + top[low:])[:self.top_k]
+            taken, low, high = taken + 1, None, None
+        return taken, top, low, high
+
+    def ranking(self):
+        if self.next_pair(self._state) is None:
+            if self.top_k:
+                return list(self._state[1])
+            stack = self._state[1]
+            return list(stack[0]) if stack is not None else []
+        # Not sorted yet: by picks won so far
+        return sorted(self.titles, key=lambda title: -self.wins[title])
+
+
+class InformationGainScheduler(PairScheduler):
+    """
+    Keeps an Elo rating and a comparison count per title and asks for the
+    pair with the most uncertain outcome: the chance of either title
+    winning, p(1 - p), weighted by how little both have been compared.
+    Candidates are titles next to each other in the current order, so a
+    pick costs O(n log n). Stops after `budget` picks (n log2 n by default).
+    """
+
+    def __init__(self, titles, budget=None, seed=None):
+        self.budget = budget if budget is not None else math.ceil(len(titles) * math.log2(max(len(titles), 2)))
+        rng = random.Random(seed)
+        titles = list(titles)
+        # Ties in the first round are broken in a random order
+        self.tiebreak = {title: rng.random() for title in titles}
+        state = ({title: ELO_INITIAL for title in titles}, {title: 0 for title in titles}, 0)
+        super().__init__(titles, state)
+
+    def _order(self, ratings):
+        return sorted(self.titles, key=lambda title: (-ratings[title], self.tiebreak[title]))
+
+    def next_pair(self, state):
+        ratings, counts, picks = state
+        if picks >= self.budget or len(self.titles) < 2:
+            return None
+        order = self._order(ratings)
+        best = None
+        best_score = -1.0
+        for step in (1, 2):
+            for i in range(len(order) - step):
+                a, b = order[i], order[i + step]
+                p = 1.0 / (1.0 + 10 ** ((ratings[b] - ratings[a]) / 400))
+                score = p * (1.0 - p) * (1.0 / (1 + counts[a]) + 1.0 / (1 + counts[b]))
+                if score > best_score:
+                    best, best_score = (a, b), score
+        return best
+
+    def with_outcome(self, state, pair, winner):
+        ratings, counts, picks = state
+        ratings = dict(ratings)
+        counts = dict(counts)
+        loser = pair[1] if winner == pair[0] else pair[0]
+        expected = 1.0 / (1.0 + 10 ** ((ratings[loser] - ratings[winner]) / 400))
+        change = ELO_K * (1.0 - expected)
+        ratings[winner] += change
+        ratings[loser] -= change
+        counts[winner] += 1
+        counts[loser] += 1
+        return ratings, counts, picks + 1
+
+    def ranking(self):
+        return self._order(self._state[0])
+
+
+def make_scheduler(mode, pairs, pool_size=DEFAULT_POOL_SIZE, top_k=0, seed=None):
+    """Wraps a shuffled pair order: returned as is in random mode, else a scheduler over its first pool_size titles."""
+    if mode == "random":
+        return pairs
+    if mode not in SCHEDULERS:
+        raise ValueError(f"Unknown pair scheduler {mode!r}; expected one of {', '.join(SCHEDULERS)}")
+    pool = pool_titles(pairs, pool_size)
+    if mode == "sort":
+        return SortScheduler(pool, top_k)
+    return InformationGainScheduler(pool, seed=seed)
+
+
+def make_pairs(catalog, categories=None, seed=None, mode="random", pool_size=DEFAULT_POOL_SIZE, top_k=0):
+    """The pairs of a session from the catalog, shuffled by seed."""
+    if seed is None:
+        seed = random.getrandbits(64)
+    return make_scheduler(mode, catalog.random_pairs(categories, seed), pool_size, top_k, seed)
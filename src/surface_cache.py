@@ -0,0 +1,72 @@
+# src/surface_cache.py
+import threading
+from collections import OrderedDict
+
+
+def surface_nbytes(surface):
+    """Bytes of pixel memory behind a surface (row pitch includes any padding)."""
+    # Subsurfaces (e.g. posters in a memory-mapped atlas) own no pixels of their own
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceCache:
+    """
+    Process-wide LRU of decoded, scaled poster surfaces.
+
+    Keys are (title, poster_width, poster_height_limit). Size is accounted
+    from each surface's pitch x height, and the least recently used surfaces
+    are dropped once the total goes over max_bytes.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._surfaces = OrderedDict()  # key -> Surface, oldest first
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            surface = self._surfaces.get(key)
+            if surface is None:
+                self.misses += 1
+                return None
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+    def put(self, key, surface):
+        size = surface_nbytes(surface)
+        with self._lock:
+            # Never keep something that on its own blows the budget
+            if size > self.max_bytes:
+                return
+            previous = self._surfaces.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= surface_nbytes(previous)
+            self._surfaces[key] = surface
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._surfaces.popitem(last=False)
+                self.current_bytes -= surface_nbytes(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._surfaces.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._surfaces),
+                "bytes": self.current_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
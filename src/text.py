@@ -0,0 +1,76 @@
+# src/text.py
+"""
+One place to draw and measure in-game text.
+
+Lines are drawn with Font.render() and measured with Font.size(), the same
+metrics, so a line wrapped to fit a width by measure() is exactly that
+wide on screen. Drawn lines and measured sizes are kept in small LRUs, so
+a line drawn again (a list page rebuilt while scrolling back) is a single
+blit.
+"""
+from collections import OrderedDict
+
+import pygame
+
+RENDER_CACHE_SIZE = 512 # drawn lines kept, across fonts and colours
+MEASURE_CACHE_SIZE = 4096 # measured strings kept, across fonts
+
+
+class TextRenderer:
+    """
+    Draws and measures text for any number of fonts and colours. Fonts are
+    used as dictionary keys, so pass the same font object each time (the
+    FontCache's LazyFonts are).
+    """
+
+    def __init__(self, antialias=True):
+        self.antialias = antialias
+        self._rendered = OrderedDict()  # (font, color, text) -> Surface, least recent first
+        self._sizes = OrderedDict()     # (font, text) -> (width, height), least recent first
+
+    def measure(self, font, text):
+        """(width, height) of text; the replacement for font.size()."""
+        key = (font, text)
+        size = self._sizes.get(key)
+        if size is not None:
+            self._sizes.move_to_end(key)
+            return size
+        size = self._sizes[key] = font.size(text)
+        if len(self._sizes) > MEASURE_CACHE_SIZE:
+            self._sizes.popitem(last=False)
+        return size
+
+    def _cached_render(self, font, text, color):
+        key = (font, tuple(color), text)
+        surface = self._rendered.get(key)
+        if surface is not None:
+            self._rendered.move_to_end(key)
+            return surface
+        surface = self._rendered[key] = font.render(text, self.antialias, color)
+        if len(self._rendered) > RENDER_CACHE_SIZE:
+            self._rendered.popitem(last=False)
+        return surface
+
+    def draw(self, surface, font, text, color, pos):
+        """Draws text with its top-left at pos; returns the rect the line occupies."""
+        rendered = self._cached_render(font, text, color)
+        surface.blit(rendered, pos)
+        return pygame.Rect(pos, rendered.get_size())
+
+    def render(self, font, text, color):
+        """
+        A new surface with text on it, which the caller may change: what
+        font.render(text, True, color) returns, except that an empty line
+        is one transparent pixel wide rather than zero (premul_alpha() and
+        friends don't take empty surfaces).
+        """
+        surface = font.render(text, self.antialias, color)
+        if surface.get_width() == 0:
+            surface = pygame.Surface((1, surface.get_height()), pygame.SRCALPHA)
+        return surface
+
+    def stats(self):
+        return {
+            "rendered": len(self._rendered),
+            "measured": len(self._sizes),
+        }
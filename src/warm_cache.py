@@ -0,0 +1,244 @@
+# src/warm_cache.py
+"""
+Resolves and caches the poster of every title in the catalog ahead of time.
+
+    python -m src.warm_cache [--concurrency 8] [--rate 5] [--report FILE]
+
+OMDb lookups and image downloads go through the game's own fetch functions,
+so everything lands in the poster cache get_poster_image() reads. Titles
+already answered by that cache (or shipped as local posters) are skipped
+without a request, so an interrupted run picks up where it stopped; the
+cache index is flushed as it goes. A run stops early when OMDb reports its
+request limit, leaving the rest for the next run.
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src import game
+from src.catalog import CATALOG_DB_PATH, open_catalog
+from src.disk_cache import DiskCache, atomic_write
+from src.http_client import HttpClient
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RATE = 5.0 # OMDb lookups per second
+FLUSH_EVERY = 100 # titles between cache index flushes
+PROGRESS_INTERVAL = 2.0 # seconds between progress lines
+
+# --- Outcomes ---
+LOCAL = "local"       # shipped in POSTER_ASSET_DIR, nothing to fetch
+CACHED = "cached"     # already in the poster cache
+FETCHED = "fetched"   # looked up and/or downloaded now
+MISSING = "missing"   # OMDb has no poster for it
+FAILED = "failed"     # an error; retried by the next run
+
+
+class QuotaExhausted(Exception):
+    """OMDb refused a lookup because the API key ran out of requests."""
+
+
+class RateLimiter:
+    """Token bucket: rate acquisitions per second on average, up to burst at once. 0 means no limit."""
+
+    def __init__(self, rate, burst=1, clock=time.monotonic):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.clock = clock
+        self.tokens = float(self.burst)
+        self.updated = clock()
+
+    async def acquire(self):
+        if not self.rate:
+            return
+        while True:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class CacheWarmer:
+    """Runs the lookups for a stream of titles on a thread pool, concurrency at a time."""
+
+    def __init__(self, api_key=game.OMDB_API_KEY, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE, burst=1):
+        self.api_key = api_key
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate, burst)
+        self.counts = {outcome: 0 for outcome in (LOCAL, CACHED, FETCHED, MISSING, FAILED)}
+        self.missing = []               # titles without a poster
+        self.failed = {}                # title -> error
+        self.omdb_requests = 0
+        self.stopped_by = None          # why the run ended early, if it did
+        self._executor = None
+
+    async def _call(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def warm_title(self, title):
+        """Resolves one title's poster into the cache and returns its outcome."""
+        if game.local_poster_path(title) is not None:
+            return LOCAL
+
+        fetched = False
+        data = await self._call(game.poster_cache.get_json, game.omdb_cache_key(title))
+        if data is None:
+            await self.limiter.acquire()
+            self.omdb_requests += 1
+            data = await self._call(game.fetch_omdb_metadata, title, self.api_key)
+            fetched = True
+
+        poster_url = data.get('Poster')
+        if data.get('Response') != 'True' or poster_url in ('N/A', None):
+            error = data.get('Error', '')
+            if data.get('Response') == 'True' or 'not found' in error.lower():
+                return MISSING
+            if 'limit' in error.lower():
+                raise QuotaExhausted(error)
+            raise RuntimeError(error or "OMDb answered without a poster")
+
+        if await self._call(game.poster_cache.get_bytes, game.image_cache_key(poster_url)) is None:
+            await self._call(game.fetch_image_bytes, poster_url)
+            fetched = True
+        return FETCHED if fetched else CACHED
+
+    async def _worker(self, queue, progress):
+        while True:
+            title = await queue.get()
+            if title is None:
+                return
+            if self.stopped_by is not None:
+                continue # drain the queue without working
+
+            try:
+                outcome = await self.warm_title(title)
+            except QuotaExhausted as e:
+                self.stopped_by = f"OMDb quota: {e}"
+                outcome = FAILED
+                self.failed[title] = str(e)
+            except Exception as e:
+                outcome = FAILED
+                self.failed[title] = f"{type(e).__name__}: {e}"
+            if outcome == MISSING:
+                self.missing.append(title)
+            self.counts[outcome] += 1
+            await progress()
+
+    async def run(self, titles, total=None):
+        """Warms every title of the iterable; returns the summary()."""
+        started = time.perf_counter()
+        queue = asyncio.Queue(maxsize=self.concurrency * 4)
+        done = 0
+        last_report = started
+
+        async def progress():
+            nonlocal done, last_report
+            done += 1
+            if done % FLUSH_EVERY == 0:
+                await self._call(game.poster_cache.flush)
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                print(self.progress_line(done, total, now - started))
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            self._executor = executor
+            workers = [asyncio.create_task(self._worker(queue, progress)) for _ in range(self.concurrency)]
+            try:
+                for title in titles:
+                    if self.stopped_by is not None:
+                        break
+                    await queue.put(title)
+            finally:
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers)
+                game.poster_cache.flush()
+
+        elapsed = time.perf_counter() - started
+        print(self.progress_line(done, total, elapsed))
+        return self.summary(elapsed)
+
+    def progress_line(self, done, total, elapsed):
+        of_total = f"/{total}" if total else ""
+        return (f"Warmed {done}{of_total} titles in {elapsed:.1f}s: "
+                + ", ".join(f"{count} {outcome}" for outcome, count in self.counts.items())
+                + f" ({self.omdb_requests / max(elapsed, 1e-9):.1f} OMDb lookups/s)")
+
+    def summary(self, elapsed=None):
+        return {
+            "counts": dict(self.counts),
+            "omdb_requests": self.omdb_requests,
+            "seconds": round(elapsed, 2) if elapsed is not None else None,
+            "stopped_by": self.stopped_by,
+            "missing": sorted(self.missing),
+            "failed": dict(sorted(self.failed.items())),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch and cache the poster of every movie in the catalog.")
+    parser.add_argument("--catalog", default=CATALOG_DB_PATH, help="catalog database (falls back to the JSON file)")
+    parser.add_argument("--categories", help="comma-separated categories to warm (default: all)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="titles resolved at once")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="OMDb lookups per second, to stay within the key's quota (0: no limit)")
+    parser.add_argument("--burst", type=int, default=1, help="lookups allowed back to back before --rate applies")
+    parser.add_argument("--api-key", default=game.OMDB_API_KEY)
+    parser.add_argument("--omdb-url", default=game.OMDB_URL, help="OMDb endpoint, e.g. a local stub server")
+    parser.add_argument("--cache-dir", default=game.POSTER_CACHE_DIR, help="poster cache to fill")
+    parser.add_argument("--report", help="write the summary, with every missing and failed title, to this JSON file")
+    args = parser.parse_args(argv)
+
+    game.OMDB_URL = args.omdb_url
+    if os.path.abspath(args.cache_dir) != os.path.abspath(game.POSTER_CACHE_DIR):
+        game.poster_cache = DiskCache(args.cache_dir, game.POSTER_CACHE_MAX_BYTES)
+    # One pooled connection per worker, instead of the game's small pool
+    game.http_client = HttpClient(
+        connect_timeout=game.HTTP_CONNECT_TIMEOUT,
+        read_timeout=game.HTTP_READ_TIMEOUT,
+        retries=game.HTTP_RETRIES,
+        failure_threshold=game.HTTP_FAILURE_THRESHOLD,
+        reset_timeout=game.HTTP_RESET_TIMEOUT,
+        pool_size=args.concurrency,
+        verify=False
+    )
+
+    catalog = open_catalog(args.catalog)
+    categories = [name.strip() for name in args.categories.split(",")] if args.categories else None
+    warmer = CacheWarmer(args.api_key, args.concurrency, args.rate, args.burst)
+    try:
+        summary = asyncio.run(warmer.run(catalog.iter_titles(categories), catalog.count(categories)))
+    except KeyboardInterrupt:
+        # Finished titles are already in the cache; the next run resumes after them
+        game.poster_cache.flush()
+        print("Interrupted; run again to resume.")
+        return 1
+    finally:
+        catalog.close()
+        game.http_client.close()
+
+    if summary["stopped_by"]:
+        print(f"Stopped early ({summary['stopped_by']}); run again later to resume.")
+    for title in summary["missing"]:
+        print(f"  missing: {title}")
+    for title, error in summary["failed"].items():
+        print(f"  failed:  {title}: {error}")
+
+    stored = game.poster_cache.total_bytes()
+    if stored >= game.poster_cache.max_bytes * 0.9:
+        print(f"Poster cache holds {stored / 1e6:.0f} MB of its {game.poster_cache.max_bytes / 1e6:.0f} MB limit; "
+              "older posters are being evicted, raise POSTER_CACHE_MAX_BYTES to keep them all.")
+    if args.report:
+        atomic_write(os.path.abspath(args.report), json.dumps(summary, indent=2).encode("utf-8"))
+        print(f"Report written to {args.report}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,35 @@
+# tests/conftest.py
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pytest
+
+from benchmarks.run import stub_poster_png
+from benchmarks.stub_server import StubOmdbServer
+
+
+@pytest.fixture
+def stub_server():
+    """The local OMDb and poster host stand-in, serving a 300x450 PNG for every title."""
+    with StubOmdbServer(stub_poster_png()) as server:
+        yield server
+
+
+@pytest.fixture
+def game(tmp_path, stub_server, monkeypatch):
+    """src.game on a dummy display, with its own poster cache and OMDb pointed at the stub server."""
+    from src import game
+    from src.disk_cache import DiskCache
+    from src.http_client import HttpClient
+    from src.poster_assets import CompiledPosters
+
+    game.init_display()
+    monkeypatch.setattr(game, "OMDB_URL", stub_server.url)
+    monkeypatch.setattr(game, "POSTER_CACHE_DIR", str(tmp_path / "posters"))
+    monkeypatch.setattr(game, "poster_cache", DiskCache(str(tmp_path / "posters")))
+    monkeypatch.setattr(game, "compiled_posters", CompiledPosters(str(tmp_path / "compiled")))
+    monkeypatch.setattr(game, "http_client", HttpClient(retries=0))
+    game.poster_surface_cache.clear()
+    yield game
+    game.poster_surface_cache.clear()
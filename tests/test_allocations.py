@@ -0,0 +1,125 @@
+# tests/test_allocations.py
+"""
+The running screen's poster path stops allocating once warm.
+
+GameCore.tick(), PosterLayer.sync() and PosterLayer.draw() run once per
+frame, as in the frame loop, under tracemalloc. After a warm-up (pools
+filled, title boxes composed), for each frame without a spawn or a pick:
+
+  - what it allocates and frees again (the traced peak above both where it
+    started and where it ended) stays within STEADY_FRAME_BUDGET. That is
+    left to ints: CPython creates every int above 256 afresh (the tick
+    counter, rounded poster positions, collision sums). Measured, it is
+    152 bytes with two lanes and in stress mode alike, for seeds 1 to 5;
+    the budget adds one 32-byte int block. A list or dict built in passing
+    (56 bytes and up) goes over.
+  - what it keeps is left to the growth check: a poster whose top crosses
+    256 holds on to its int, so a single frame may end a little higher.
+
+Spawns and picks must take their PosterStates and Posters from the pools,
+and the traced total must not grow from the first half of the run to the
+second, as it would if something were kept per spawn.
+"""
+import random
+import sys
+import tracemalloc
+from array import array
+
+import pytest
+
+DISTINCT_PAIRS = 8 # pairs the session cycles through, so the warm-up composes every title box
+STEADY_FRAME_BUDGET = 192 # bytes a frame without spawns or picks may allocate and free again
+GROWTH_BUDGET = 4096 # bytes the traced total may grow from the first half of the run to the second
+POOL_MISS_BUDGET = 0.01 # fraction of spawned posters allowed a newly created PosterState or Poster
+
+
+def make_frame(lane_count, spawn_interval, frames, seed=1):
+    """Sets up a session and returns (core, layer, frame), frame() running one tick and one draw."""
+    import pygame
+
+    from src import game
+    from src.core import SPAWN, GameCore, load_movie_categories, make_movie_pairs, spread_lanes
+    from src.headless import stress_poster_size
+
+    game.init_display()
+    screen = pygame.display.get_surface()
+    rng = random.Random(seed)
+
+    movie_pairs = make_movie_pairs(load_movie_categories(), rng)[:DISTINCT_PAIRS]
+    movie_pairs = [movie_pairs[i % len(movie_pairs)] for i in range(frames)]
+    sizes = stress_poster_size(lane_count)
+    images = {}
+
+    def poster_size(title):
+        width, height = sizes(title)
+        images[title] = game.placeholder_surface(width, height)
+        return width, height
+
+    core = GameCore(movie_pairs, poster_size, lane_count, spawn_interval)
+    core.start()
+    layer = game.PosterLayer()
+    player_image = game.make_player_surface()
+    player_rect = pygame.Rect(core.player_rect)
+    player_blits = ((player_image, player_rect),)
+
+    def frame():
+        for event in core.tick():
+            if event[0] == SPAWN:
+                lane = spread_lanes(len(event[2]), lane_count)[rng.randrange(len(event[2]))]
+                while core.player_lane > lane:
+                    core.move_left()
+                while core.player_lane < lane:
+                    core.move_right()
+        layer.sync(core, images)
+        layer.draw(screen, 0.5)
+        player_rect.update(core.player_rect)
+        screen.blits(player_blits, doreturn=False)
+
+    return core, layer, frame
+
+
+@pytest.mark.parametrize("lane_count, spawn_interval, warmup, frames", [
+    (2, None, 1500, 1500),
+    (8, 2, 500, 300), # hundreds of posters in flight
+], ids=["two-lanes", "stress"])
+def test_steady_frames_allocate_nothing(lane_count, spawn_interval, warmup, frames):
+    core, layer, frame = make_frame(lane_count, spawn_interval, warmup + frames)
+    # Traced from the start, so the ints the posters hold are too: one made
+    # before would look like growth once it's replaced, as its freeing isn't seen
+    tracemalloc.start()
+    try:
+        for _ in range(warmup):
+            frame()
+
+        states_before = len(core.posters) + len(core._free_posters)
+        created_before = layer.created
+        serial_before = core._serial
+        selections_size_before = sys.getsizeof(core.selections)
+        # Preallocated, so recording the measurements doesn't show up in them
+        transients = array("q", bytes(8 * frames))
+        traced = array("q", bytes(8 * frames))
+        changed = bytearray(frames)
+
+        for i in range(frames):
+            generation = core.poster_generation
+            start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            frame()
+            traced[i], peak = tracemalloc.get_traced_memory()
+            transients[i] = peak - max(start, traced[i])
+            changed[i] = core.poster_generation != generation
+    finally:
+        tracemalloc.stop()
+
+    steady = [transients[i] for i in range(frames) if not changed[i]]
+    assert steady
+    assert max(steady) <= STEADY_FRAME_BUDGET, f"a steady frame allocated and freed {max(steady)} bytes"
+
+    spawned = core._serial - serial_before
+    allowed = spawned * POOL_MISS_BUDGET
+    assert len(core.posters) + len(core._free_posters) - states_before <= allowed
+    assert layer.created - created_before <= allowed
+
+    half = frames // 2
+    growth = max(traced[half:]) - max(traced[:half]) - (sys.getsizeof(core.selections) - selections_size_before)
+    assert growth <= GROWTH_BUDGET
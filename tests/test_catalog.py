@@ -0,0 +1,100 @@
+# tests/test_catalog.py
+import json
+
+import pytest
+
+from src.catalog import Catalog, RandomPermutation, build_catalog, open_catalog
+
+CATEGORIES = {
+    "Action": [f"Action {i}" for i in range(40)],
+    "Comedy": [f"Comedy {i}" for i in range(25)],
+    "Horror": [f"Horror {i}" for i in range(7)],
+}
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    json_path = tmp_path / "movies_by_category.json"
+    json_path.write_text(json.dumps(CATEGORIES), encoding="utf-8")
+    db_path = tmp_path / "movies.sqlite3"
+    build_catalog(str(json_path), str(db_path))
+    catalog = open_catalog(str(db_path), str(json_path))
+    yield catalog
+    catalog.close()
+
+
+def titles_of(pairs):
+    return [title for pair in pairs for title in pair]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 7, 64, 1000, 4097])
+def test_permutation_is_a_bijection(n):
+    permutation = RandomPermutation(n, seed=5)
+    assert sorted(permutation[i] for i in range(n)) == list(range(n))
+
+
+def test_the_catalog_lists_its_categories(catalog):
+    assert isinstance(catalog, Catalog)
+    assert catalog.categories() == [("Action", 40), ("Comedy", 25), ("Horror", 7)]
+    assert catalog.count() == 72
+    assert list(catalog.iter_titles(["Horror"], batch_size=3)) == CATEGORIES["Horror"]
+
+
+def test_a_seed_pairs_every_title_once(catalog):
+    pairs = catalog.random_pairs(seed=42)
+
+    titles = titles_of(pairs)
+
+    assert len(pairs) == 36
+    assert sorted(titles) == sorted(title for movies in CATEGORIES.values() for title in movies)
+
+
+def test_the_same_seed_gives_the_same_order(catalog):
+    first = list(catalog.random_pairs(seed=42))
+
+    assert list(catalog.random_pairs(seed=42)) == first
+    assert list(catalog.random_pairs(seed=43)) != first
+    # Reading pages out of order (and again after they were evicted) changes nothing
+    pairs = catalog.random_pairs(seed=42)
+    pairs.PAIRS_PER_PAGE = 4
+    pairs.MAX_CACHED_PAGES = 2
+    assert [pairs[i] for i in reversed(range(len(pairs)))] == first[::-1]
+    assert pairs[-1] == first[-1]
+    assert pairs[3:6] == first[3:6]
+
+
+def test_categories_filter_the_pairs(catalog):
+    pairs = catalog.random_pairs(["Comedy", "Horror"], seed=1)
+    titles = titles_of(pairs)
+
+    # 32 titles, so every one of them once
+    assert len(pairs) == 16
+    assert sorted(titles) == sorted(CATEGORIES["Comedy"] + CATEGORIES["Horror"])
+
+
+def test_an_odd_count_leaves_one_title_out(catalog):
+    titles = titles_of(catalog.random_pairs(["Horror"], seed=3))
+
+    assert len(titles) == len(set(titles)) == 6
+    assert set(titles) < set(CATEGORIES["Horror"])
+
+
+def test_unknown_categories_are_rejected(catalog):
+    with pytest.raises(KeyError, match="Drama"):
+        catalog.random_pairs(["Drama"])
+
+
+def test_pair_index_out_of_range(catalog):
+    pairs = catalog.random_pairs(seed=1)
+    with pytest.raises(IndexError):
+        pairs[len(pairs)]
+
+
+def test_without_a_database_the_json_is_used(tmp_path):
+    json_path = tmp_path / "movies_by_category.json"
+    json_path.write_text(json.dumps(CATEGORIES), encoding="utf-8")
+
+    catalog = open_catalog(str(tmp_path / "missing.sqlite3"), str(json_path))
+
+    assert catalog.count() == 72
+    assert sorted(titles_of(catalog.random_pairs(seed=9))) == sorted(catalog.iter_titles())
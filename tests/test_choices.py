@@ -0,0 +1,176 @@
+# tests/test_choices.py
+import os
+import random
+
+import pytest
+
+from src import choices
+from src.choices import ChoiceLog, EloRanking, bradley_terry
+
+
+def pick_all(log, picks):
+    for winner, loser in picks:
+        log.record(winner, loser)
+    log.close()
+
+
+def strength_order(count):
+    return [f"Movie {i:02}" for i in range(count)]
+
+
+def simulated_picks(titles, count, seed=1):
+    """Picks where the earlier title in titles wins with Bradley-Terry odds (strengths 1.5 ** -rank)."""
+    rng = random.Random(seed)
+    strengths = {title: 1.5 ** -rank for rank, title in enumerate(titles)}
+    picks = []
+    for _ in range(count):
+        a, b = rng.sample(titles, 2)
+        if rng.random() < strengths[a] / (strengths[a] + strengths[b]):
+            picks.append((a, b))
+        else:
+            picks.append((b, a))
+    return picks
+
+
+def test_picks_survive_a_reopen(tmp_path):
+    log = ChoiceLog(str(tmp_path))
+    pick_all(log, [("Alien", "Heat"), ("Heat", "Up"), ("Up", "Alien")])
+
+    reopened = ChoiceLog(str(tmp_path))
+
+    assert len(reopened) == 3
+    assert reopened.titles() == ["Alien", "Heat", "Up"]
+    assert [record[:2] for record in reopened.read_records()] == [(0, 1), (1, 2), (2, 0)]
+    assert reopened.since(1) == [("Heat", "Up"), ("Up", "Alien")]
+
+
+def test_flush_writes_everything_recorded(tmp_path):
+    log = ChoiceLog(str(tmp_path))
+    log.record("Alien", "Heat", timestamp=1.0)
+
+    log.flush()
+
+    assert ChoiceLog(str(tmp_path)).read_records() == [(0, 1, 1.0)]
+    log.close()
+
+
+def test_a_half_written_record_is_dropped(tmp_path):
+    pick_all(ChoiceLog(str(tmp_path)), [("Alien", "Heat")])
+    with open(tmp_path / choices.CHOICES_FILENAME, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    with open(tmp_path / choices.TITLES_FILENAME, "a", encoding="utf-8") as f:
+        f.write('"Half a tit')
+
+    log = ChoiceLog(str(tmp_path))
+    pick_all(log, [("Up", "Alien")])
+
+    assert ChoiceLog(str(tmp_path)).titles() == ["Alien", "Heat", "Up"]
+    assert [record[:2] for record in log.read_records()] == [(0, 1), (2, 0)]
+
+
+def test_logs_sharing_a_directory_number_titles_alike(tmp_path):
+    # Two game processes, each with its own ChoiceLog open on the same directory
+    first = ChoiceLog(str(tmp_path))
+    second = ChoiceLog(str(tmp_path))
+    first.record("Alien", "Heat")
+    first.flush()
+    second.record("Up", "Alien")
+    second.flush()
+    first.record("Heat", "Up")
+    first.close()
+    second.close()
+
+    log = ChoiceLog(str(tmp_path))
+    titles = log.titles()
+    picks = [(titles[winner], titles[loser]) for winner, loser, _ in log.read_records()]
+
+    assert titles == ["Alien", "Heat", "Up"]
+    assert picks == [("Alien", "Heat"), ("Up", "Alien"), ("Heat", "Up")]
+
+
+def test_elo_caught_up_session_by_session_matches_a_full_recompute(tmp_path):
+    picks = simulated_picks(strength_order(12), 300)
+    path = str(tmp_path / choices.RANKING_FILENAME)
+
+    # Three sessions, each reopening the log and the saved ranking
+    for session in range(3):
+        log = ChoiceLog(str(tmp_path))
+        ranking = EloRanking(path)
+        ranking.update(log)
+        pick_all(log, picks[session * 100:(session + 1) * 100])
+        ranking.update(log)
+        ranking.save()
+
+    full = EloRanking(str(tmp_path / "scratch.json"))
+    full.ratings = {}
+    for winner, loser in picks:
+        full.apply(winner, loser)
+
+    saved = EloRanking(path)
+    saved.update(ChoiceLog(str(tmp_path)))
+    assert saved.offset == 300
+    assert saved.ratings.keys() == full.ratings.keys()
+    for title, (rating, comparisons) in full.ratings.items():
+        assert saved.ratings[title][0] == pytest.approx(rating)
+        assert saved.ratings[title][1] == comparisons
+
+
+def test_the_ranking_is_read_without_rescanning_the_log(tmp_path, monkeypatch):
+    log = ChoiceLog(str(tmp_path))
+    pick_all(log, simulated_picks(strength_order(8), 200))
+    path = str(tmp_path / choices.RANKING_FILENAME)
+    ranking = EloRanking(path)
+    ranking.update(ChoiceLog(str(tmp_path)))
+    ranking.save()
+
+    def no_rescan(*args, **kwargs):
+        raise AssertionError("the log was read again")
+
+    monkeypatch.setattr(ChoiceLog, "read_records", no_rescan)
+    monkeypatch.setattr(ChoiceLog, "titles", no_rescan)
+    loaded = EloRanking(path)
+    loaded.update(ChoiceLog(str(tmp_path)))
+
+    assert [title for title, _, _ in loaded.top(3)] == [title for title, _, _ in ranking.top(3)]
+
+
+def bradley_terry_paths():
+    paths = [pytest.param(False, id="python")]
+    numpy_missing = choices._numpy() is None
+    paths.append(pytest.param(True, id="numpy", marks=pytest.mark.skipif(numpy_missing, reason="NumPy not installed")))
+    return paths
+
+
+@pytest.mark.parametrize("use_numpy", bradley_terry_paths())
+def test_bradley_terry_recovers_the_strength_order(tmp_path, monkeypatch, use_numpy):
+    titles = strength_order(8)
+    pick_all(ChoiceLog(str(tmp_path)), simulated_picks(titles, 4000))
+    if not use_numpy:
+        monkeypatch.setattr(choices, "_numpy", lambda: None)
+
+    strengths = bradley_terry(ChoiceLog(str(tmp_path)))
+
+    assert sorted(strengths, key=strengths.get, reverse=True) == titles
+    # Normalized to a geometric mean of 1
+    product = 1.0
+    for strength in strengths.values():
+        product *= strength
+    assert product == pytest.approx(1.0)
+
+
+def test_bradley_terry_paths_agree(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    pick_all(ChoiceLog(str(tmp_path)), simulated_picks(strength_order(10), 500))
+
+    vectorized = bradley_terry(ChoiceLog(str(tmp_path)))
+    monkeypatch.setattr(choices, "_numpy", lambda: None)
+    python = bradley_terry(ChoiceLog(str(tmp_path)))
+
+    assert vectorized.keys() == python.keys()
+    for title, strength in python.items():
+        assert vectorized[title] == pytest.approx(strength, rel=1e-6)
+
+
+def test_bradley_terry_of_an_empty_log(tmp_path):
+    assert bradley_terry(ChoiceLog(str(tmp_path))) == {}
+    assert not os.path.exists(tmp_path / choices.CHOICES_FILENAME)
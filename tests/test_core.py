@@ -0,0 +1,126 @@
+# tests/test_core.py
+import json
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from src.core import (GAME_WIDTH, RUNNING, SPAWN, GameCore, lane_poster_size, lane_width, load_movie_categories,
+                      make_movie_pairs)
+from src.headless import BOTS, run_session
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Builds the core the way main() does, from src.game's settings
+GAME_CORE_SCRIPT = '''
+import json
+from src import game
+from src.core import SPAWN, GameCore, lane_poster_size
+
+pairs = [(f"Left {i}", f"Right {i}") for i in range(40)]
+size = lane_poster_size(game.LANE_COUNT)
+core = GameCore(pairs, lambda title: size, game.LANE_COUNT, game.STRESS_SPAWN_INTERVAL)
+core.start()
+spawns = []
+for _ in range(30):
+    for event in core.tick():
+        if event[0] == SPAWN:
+            spawns.append([core.ticks, sorted(poster.lane for poster in core.posters if poster.pair_index == event[1])])
+print(json.dumps({"lane_count": core.lane_count, "lanes": len(core.lanes), "spawns": spawns}))
+'''
+
+
+def pairs(count):
+    return [(f"Left {i}", f"Right {i}") for i in range(count)]
+
+
+def test_lanes_and_stress_interval_from_the_environment(tmp_path):
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYTHONPATH=REPO_DIR, LANES="4", STRESS_SPAWN_INTERVAL="3",
+               CHOICE_LOG_DIR=str(tmp_path / "choices"), POSTER_CACHE_DIR=str(tmp_path / "posters"))
+    result = subprocess.run([sys.executable, "-c", GAME_CORE_SCRIPT], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stdout + result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["lane_count"] == report["lanes"] == 4
+    # A pair every 3 ticks from the first, whatever the player does
+    assert [tick for tick, _ in report["spawns"]] == list(range(1, 31, 3))
+    # Pairs rotate across the road, so every lane gets traffic
+    assert {lane for _, lanes in report["spawns"] for lane in lanes} == {0, 1, 2, 3}
+
+
+def test_stress_mode_keeps_many_pairs_in_flight():
+    size = lane_poster_size(8)
+    core = GameCore(pairs(500), lambda title: size, lane_count=8, spawn_interval=2)
+    core.start()
+
+    spawned = 0
+    for _ in range(400):
+        spawned += sum(event[0] == SPAWN for event in core.tick())
+
+    assert spawned == 200
+    assert len(core.posters) > 100
+    for poster in core.posters:
+        assert 0 <= poster.x and poster.x + poster.width <= GAME_WIDTH
+        lane_x = poster.lane * lane_width(8)
+        assert poster in core.lanes[poster.lane]
+        assert lane_x <= poster.x and poster.x + poster.width <= lane_x + lane_width(8)
+
+
+def test_without_a_stress_interval_the_next_pair_waits():
+    core = GameCore(pairs(10), lane_count=2)
+    core.start()
+
+    spawns = [core.ticks for _ in range(600) for event in core.tick() if event[0] == SPAWN]
+
+    # One pair at a time: it has to fall off the screen before the next one comes
+    assert spawns[0] == 1
+    assert len(spawns) > 1
+    assert all(later - earlier > 100 for earlier, later in zip(spawns, spawns[1:]))
+
+
+# --- skip_ticks ---
+
+def play_past_the_player(core):
+    """A one-title pair falls in lane 1 while the player waits in lane 0, who then moves under it once it's by."""
+    core.start()
+    while not core.posters or core.posters[0].top < core.player_rect[1] + core.player_rect[3]:
+        core.tick()
+    core.move_right()
+
+
+def test_a_poster_that_went_by_below_does_not_stop_the_skip():
+    core = GameCore([("Solo",)], lane_count=2)
+    play_past_the_player(core)
+
+    assert core.skip_ticks(10_000) > 0
+
+
+def test_a_poster_that_went_by_ends_the_same_either_way():
+    stepped, skipped = GameCore([("Solo",), ("Next",)], lane_count=2), GameCore([("Solo",), ("Next",)], lane_count=2)
+    play_past_the_player(stepped)
+    play_past_the_player(skipped)
+
+    while stepped.state == RUNNING:
+        stepped.tick()
+    while skipped.state == RUNNING:
+        skipped.skip_ticks(10_000)
+        skipped.tick()
+
+    assert (skipped.ticks, skipped.selections) == (stepped.ticks, stepped.selections)
+
+
+@pytest.mark.parametrize("bot_name", ["random", "alphabetical", "left"])
+@pytest.mark.parametrize("lane_count", [2, 4])
+def test_skipping_and_stepping_end_the_same(bot_name, lane_count):
+    movie_categories = load_movie_categories()
+    for seed in range(3):
+        outcomes = []
+        for step in (True, False):
+            rng = random.Random(seed)
+            movie_pairs = make_movie_pairs(movie_categories, rng)
+            core = run_session(movie_pairs, BOTS[bot_name](rng), max_picks=40, step=step, lane_count=lane_count)
+            outcomes.append((core.ticks, core.selections))
+        assert outcomes[0] == outcomes[1]
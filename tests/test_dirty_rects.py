@@ -0,0 +1,69 @@
+# tests/test_dirty_rects.py
+import random
+import time
+
+import pygame
+import pytest
+
+from src.dirty_rects import MAX_DIRTY_RECTS, DirtyRectTracker
+
+
+@pytest.fixture
+def tracker():
+    pygame.display.init()
+    pygame.display.set_mode((800, 600))
+    tracker = DirtyRectTracker((800, 600))
+    tracker.present() # the first frame is always full
+    return tracker
+
+
+def covered(rects):
+    return {(x, y) for rect in rects for x in range(rect.left, rect.right) for y in range(rect.top, rect.bottom)}
+
+
+def test_overlapping_rects_are_merged(tracker):
+    for rect in [(0, 0, 10, 10), (5, 5, 10, 10), (100, 100, 10, 10), (14, 14, 2, 2)]:
+        tracker.invalidate(rect)
+
+    assert sorted(map(tuple, tracker._merged_rects())) == [(0, 0, 16, 16), (100, 100, 10, 10)]
+
+
+def test_a_union_picks_up_rects_it_grew_into(tracker):
+    # Neither of the first two touches the other; the tall one bridges them
+    for rect in [(0, 0, 50, 10), (0, 100, 50, 10), (40, 0, 20, 200)]:
+        tracker.invalidate(rect)
+
+    assert [tuple(rect) for rect in tracker._merged_rects()] == [(0, 0, 60, 200)]
+
+
+def test_merged_rects_cover_every_change(tracker):
+    rng = random.Random(3)
+    for _ in range(60):
+        tracker.invalidate((rng.randrange(200), rng.randrange(200), rng.randrange(1, 30), rng.randrange(1, 30)))
+
+    merged = tracker._merged_rects()
+
+    assert covered(merged) >= covered(tracker.rects)
+    assert len(merged) < 60
+
+
+def test_many_rects_merge_in_about_linear_time(tracker):
+    # Thousands of small rects that don't touch: nothing to merge, but each is looked at
+    tracker.rects = [pygame.Rect(x * 8, y * 6, 2, 2) for x in range(100) for y in range(100)]
+    random.Random(1).shuffle(tracker.rects)
+
+    started = time.perf_counter()
+    merged = tracker._merged_rects()
+
+    assert time.perf_counter() - started < 1.0
+    assert len(merged) == 10_000
+
+
+def test_too_many_rects_flip_the_whole_screen(tracker):
+    for i in range(MAX_DIRTY_RECTS + 1):
+        tracker.invalidate((i % 800, 0, 1, 1))
+
+    tracker.present()
+
+    assert tracker.last_frame_pixels == 800 * 600
+    assert tracker.rects == []
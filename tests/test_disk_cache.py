@@ -0,0 +1,185 @@
+# tests/test_disk_cache.py
+import os
+import threading
+
+from src.disk_cache import DiskCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(path, max_bytes=1000, **kwargs):
+    clock = FakeClock()
+    return DiskCache(str(path), max_bytes=max_bytes, clock=clock, **kwargs), clock
+
+
+def blob_files(root):
+    objects = os.path.join(root, "objects")
+    return [name for _, _, names in os.walk(objects) for name in names]
+
+
+def test_round_trip(tmp_path):
+    cache, _ = make_cache(tmp_path)
+
+    cache.put_bytes("image:a", b"poster bytes")
+    cache.put_json("omdb:A", {"Title": "A"})
+
+    assert cache.get_bytes("image:a") == b"poster bytes"
+    assert cache.get_json("omdb:A") == {"Title": "A"}
+    assert cache.get_bytes("image:missing") is None
+
+
+def test_least_recently_used_goes_first(tmp_path):
+    cache, clock = make_cache(tmp_path, max_bytes=300)
+    for key in ("a", "b", "c"):
+        cache.put_bytes(key, key.encode() * 100)
+        clock.now += 1
+    cache.get_bytes("a") # a is now the most recently used
+
+    cache.put_bytes("d", b"d" * 100)
+
+    assert cache.get_bytes("b") is None
+    assert [cache.get_bytes(key) is not None for key in ("a", "c", "d")] == [True, True, True]
+    assert cache.total_bytes() == 300
+    assert len(blob_files(tmp_path)) == 3
+
+
+def test_shared_blobs_are_stored_and_counted_once(tmp_path):
+    cache, _ = make_cache(tmp_path, max_bytes=250)
+
+    cache.put_bytes("a", b"x" * 100)
+    cache.put_bytes("b", b"x" * 100)
+    cache.put_bytes("c", b"y" * 100)
+
+    assert cache.total_bytes() == 200
+    assert len(blob_files(tmp_path)) == 2
+    # Dropping one key keeps the blob the other still points at
+    cache.discard("a")
+    assert cache.get_bytes("b") == b"x" * 100
+    cache.discard("b")
+    assert cache.total_bytes() == 100
+    assert len(blob_files(tmp_path)) == 1
+
+
+def test_negative_results_expire(tmp_path):
+    cache, clock = make_cache(tmp_path)
+    cache.put_json("omdb:Missing", {"Response": "False"}, ttl=60)
+
+    clock.now += 59
+    assert cache.get_json("omdb:Missing") == {"Response": "False"}
+    clock.now += 2
+    assert cache.get_json("omdb:Missing") is None
+    assert cache.total_bytes() == 0
+
+
+def test_the_index_survives_a_reload(tmp_path):
+    cache, clock = make_cache(tmp_path, max_bytes=300)
+    cache.put_bytes("old", b"o" * 100)
+    clock.now += 1
+    cache.put_bytes("new", b"n" * 100)
+    cache.close()
+
+    reloaded, _ = make_cache(tmp_path, max_bytes=300)
+    assert reloaded.total_bytes() == 200
+    # The least recently used order came back too
+    reloaded.put_bytes("newer", b"w" * 200)
+    assert reloaded.get_bytes("old") is None
+    assert reloaded.get_bytes("new") == b"n" * 100
+    assert reloaded.get_bytes("newer") == b"w" * 200
+
+
+def test_puts_write_the_index_only_every_flush_interval(tmp_path):
+    cache, _ = make_cache(tmp_path, flush_interval=3600)
+    index_path = os.path.join(tmp_path, "index.json")
+
+    cache.put_bytes("a", b"a")
+    assert not os.path.exists(index_path)
+    cache.flush()
+    assert os.path.exists(index_path)
+
+
+def test_verify_drops_corrupted_blobs(tmp_path):
+    cache, _ = make_cache(tmp_path)
+    cache.put_bytes("good", b"good bytes")
+    cache.put_bytes("bad", b"bad bytes")
+    cache.put_bytes("also bad", b"bad bytes")
+    [path] = [os.path.join(root, name) for root, _, names in os.walk(tmp_path / "objects") for name in names
+              if open(os.path.join(root, name), "rb").read() == b"bad bytes"]
+    with open(path, "wb") as f:
+        f.write(b"tampered!")
+
+    assert sorted(cache.verify()) == ["also bad", "bad"]
+    assert cache.get_bytes("good") == b"good bytes"
+    assert cache.get_bytes("bad") is None
+    assert cache.total_bytes() == len(b"good bytes")
+
+
+def test_a_corrupted_blob_is_a_miss(tmp_path):
+    cache, _ = make_cache(tmp_path)
+    cache.put_bytes("a", b"original")
+    [name] = blob_files(tmp_path)
+    with open(os.path.join(tmp_path, "objects", name[:2], name), "wb") as f:
+        f.write(b"garbage")
+
+    assert cache.get_bytes("a") is None
+    assert cache.total_bytes() == 0
+
+
+def test_a_value_bigger_than_the_cache_is_not_stored(tmp_path):
+    cache, _ = make_cache(tmp_path, max_bytes=100)
+    cache.put_bytes("small", b"s" * 50)
+
+    assert cache.put_bytes("huge", b"h" * 101) is False
+
+    assert cache.get_bytes("huge") is None
+    assert cache.get_bytes("small") == b"s" * 50
+    assert len(blob_files(tmp_path)) == 1
+
+
+def test_the_key_being_stored_is_never_evicted(tmp_path):
+    cache, _ = make_cache(tmp_path, max_bytes=100)
+    cache.put_bytes("a", b"a" * 60)
+
+    assert cache.put_bytes("b", b"b" * 100) is True
+
+    assert cache.get_bytes("a") is None
+    assert cache.get_bytes("b") == b"b" * 100
+
+
+def test_empty_object_directories_are_removed(tmp_path):
+    cache, _ = make_cache(tmp_path)
+    cache.put_bytes("a", b"a")
+
+    cache.discard("a")
+
+    assert os.listdir(tmp_path / "objects") == []
+
+
+def test_concurrent_puts_and_gets(tmp_path):
+    cache, _ = make_cache(tmp_path, max_bytes=50_000)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(200):
+                key = f"k{(n * 7 + i) % 60}"
+                cache.put_bytes(key, key.encode() * 100)
+                data = cache.get_bytes(key)
+                assert data is None or data == key.encode() * 100
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert cache.total_bytes() <= 50_000
+    assert cache.verify() == []
@@ -0,0 +1,211 @@
+# tests/test_http_client.py
+import threading
+
+import pytest
+import requests
+
+from src.http_client import CircuitBreaker, CircuitOpenError, HttpClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_client(**kwargs):
+    sleeps = []
+    client = HttpClient(connect_timeout=2, read_timeout=5, sleep=sleeps.append, **kwargs)
+    return client, sleeps
+
+
+def test_retries_until_the_server_recovers(stub_server):
+    client, sleeps = make_client(retries=2)
+    stub_server.fail_next(2)
+
+    response = client.get(stub_server.url, params={"t": "Alien"})
+    assert response.status_code == 200
+    assert response.json()["Title"] == "Alien"
+    assert stub_server.stats()["requests"] == 3
+    assert len(sleeps) == 2
+
+
+def test_gives_up_after_the_last_retry(stub_server):
+    client, sleeps = make_client(retries=2, failure_threshold=10)
+    stub_server.fail_next(5, status=500)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get(stub_server.url, params={"t": "Alien"})
+    assert stub_server.stats()["requests"] == 3
+
+
+def test_backoff_is_jittered_under_an_exponential_cap(stub_server):
+    client, sleeps = make_client(retries=4, backoff=0.25, backoff_max=1.0, failure_threshold=10)
+    stub_server.fail_next(4, status=429)
+
+    assert client.get(stub_server.url, params={"t": "Alien"}).status_code == 200
+    caps = [0.25, 0.5, 1.0, 1.0]
+    assert len(sleeps) == len(caps)
+    for slept, cap in zip(sleeps, caps):
+        assert 0 <= slept <= cap
+
+
+def test_not_found_is_not_retried(stub_server):
+    client, sleeps = make_client(retries=2)
+    stub_server.fail_next(1, status=404)
+
+    assert client.get(stub_server.url, params={"t": "Alien"}).status_code == 404
+    assert stub_server.stats()["requests"] == 1
+    assert sleeps == []
+
+
+def test_circuit_opens_then_half_opens(stub_server):
+    clock = FakeClock()
+    client, _ = make_client(retries=0, failure_threshold=3, reset_timeout=30, clock=clock)
+    breaker = client.breaker_for(stub_server.url)
+    stub_server.fail_next(3)
+
+    for _ in range(3):
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get(stub_server.url, params={"t": "Alien"})
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Open: fails fast without calling the host
+    with pytest.raises(CircuitOpenError):
+        client.get(stub_server.url, params={"t": "Alien"})
+    assert stub_server.stats()["requests"] == 3
+
+    # Half-open after reset_timeout: a failed trial re-opens it
+    clock.now += 30
+    stub_server.fail_next(1)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get(stub_server.url, params={"t": "Alien"})
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        client.get(stub_server.url, params={"t": "Alien"})
+
+    # ...and a successful one closes it
+    clock.now += 30
+    assert client.get(stub_server.url, params={"t": "Alien"}).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert stub_server.stats()["requests"] == 5
+
+
+def test_half_open_lets_one_trial_through():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    clock.now += 10
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow() # the trial is still in flight
+
+
+def test_a_garbled_answer_is_retried(stub_server):
+    client, sleeps = make_client(retries=1)
+    stub_server.break_next(1)
+
+    assert client.get(stub_server.url, params={"t": "Alien"}).status_code == 200
+    assert stub_server.stats()["requests"] == 2
+    assert len(sleeps) == 1
+
+
+def test_a_garbled_trial_reopens_the_circuit(stub_server):
+    clock = FakeClock()
+    client, _ = make_client(retries=0, failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker = client.breaker_for(stub_server.url)
+    stub_server.fail_next(1)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get(stub_server.url, params={"t": "Alien"})
+
+    clock.now += 30
+    stub_server.break_next(1)
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        client.get(stub_server.url, params={"t": "Alien"})
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # The trial was accounted for, so the next one is let through
+    clock.now += 30
+    assert client.get(stub_server.url, params={"t": "Alien"}).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_an_error_before_the_host_frees_the_trial(stub_server, monkeypatch):
+    clock = FakeClock()
+    client, _ = make_client(retries=0, failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker = client.breaker_for(stub_server.url)
+    stub_server.fail_next(1)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get(stub_server.url, params={"t": "Alien"})
+
+    clock.now += 30
+    session, _ = client._host_state(stub_server.url)
+
+    def broken_get(*args, **kwargs):
+        raise KeyError("boom")
+
+    monkeypatch.setattr(session, "get", broken_get)
+    with pytest.raises(KeyError):
+        client.get(stub_server.url, params={"t": "Alien"})
+    monkeypatch.undo()
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert client.get(stub_server.url, params={"t": "Alien"}).status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_concurrent_gets_of_one_url_share_a_request(stub_server):
+    client, _ = make_client()
+    stub_server.delay = 0.3
+    callers = 8
+    start = threading.Barrier(callers)
+    responses = [None] * callers
+
+    def fetch(i):
+        start.wait()
+        responses[i] = client.get(stub_server.url, params={"t": "Alien"})
+
+    threads = [threading.Thread(target=fetch, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert stub_server.stats()["requests"] == 1
+    assert all(response is responses[0] for response in responses)
+
+
+def test_concurrent_gets_share_a_failure(stub_server):
+    client, _ = make_client(retries=0)
+    stub_server.delay = 0.3
+    stub_server.fail_next(1)
+    callers = 4
+    start = threading.Barrier(callers)
+    errors = [None] * callers
+
+    def fetch(i):
+        start.wait()
+        try:
+            client.get(stub_server.url, params={"t": "Alien"})
+        except requests.exceptions.HTTPError as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=fetch, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert stub_server.stats()["requests"] == 1
+    assert all(error is errors[0] and error is not None for error in errors)
+
+
+def test_different_urls_are_not_collapsed(stub_server):
+    client, _ = make_client()
+    client.get(stub_server.url, params={"t": "Alien"})
+    client.get(stub_server.url, params={"t": "Aliens"})
+    assert stub_server.stats()["requests"] == 2
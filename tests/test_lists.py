@@ -0,0 +1,147 @@
+# tests/test_lists.py
+import pygame
+import pytest
+
+ENTRIES = 10_000
+
+
+def titles(count):
+    return [f"Movie {i:05}" for i in range(count)]
+
+
+def region(screen, rect):
+    return pygame.image.tobytes(screen.subsurface(rect), "RGB")
+
+
+def count_calls(monkeypatch, obj, name):
+    calls = []
+    original = getattr(obj, name)
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(obj, name, counted)
+    return calls
+
+
+# --- Selection panel ---
+
+@pytest.fixture
+def panel(game):
+    panel = game.SelectionPanel(game.PANEL_X, game.PANEL_WIDTH)
+    for title in titles(ENTRIES):
+        panel.add_title(title)
+    return panel
+
+
+def expected_panel_row(game, panel, index):
+    """The panel's entry index drawn on its own, as the list pages draw it."""
+    line = panel.entry_lines[index][0]
+    width, height = game.text_renderer.measure(panel.font, line)
+    row = pygame.Surface((width, height)).convert()
+    row.fill(game.PANEL_BG)
+    game.text_renderer.draw(row, panel.font, line, game.WHITE, (0, 0))
+    return pygame.image.tobytes(row, "RGB"), (width, height)
+
+
+def test_panel_builds_only_the_pages_under_the_viewport(game, panel, monkeypatch):
+    rendered = count_calls(monkeypatch, panel, "_render_entry")
+    panel.scroll_y = -(panel.total_content_height // 2)
+
+    panel.draw(game.screen)
+
+    assert 1 <= len(panel.list_pages) <= 2
+    visible_top = -panel.scroll_y
+    for page_index in panel.list_pages:
+        page_top = page_index * panel.LIST_PAGE_HEIGHT
+        assert page_top < visible_top + panel.VIEWPORT_HEIGHT and visible_top < page_top + panel.LIST_PAGE_HEIGHT
+    # A page's worth of entries, not the whole history
+    assert 0 < len(rendered) < 2 * panel.LIST_PAGE_HEIGHT // 20
+
+    rendered.clear()
+    panel.draw(game.screen)
+    assert rendered == []
+
+
+def test_panel_scrolls_to_any_entry(game, panel):
+    for index in (0, 1234, ENTRIES // 2, ENTRIES - 1):
+        panel.scroll_y = -panel.entry_tops[index]
+        panel.draw(game.screen)
+
+        top = panel.VIEWPORT_Y_START + panel.scroll_y + panel.entry_tops[index]
+        pixels, size = expected_panel_row(game, panel, index)
+        assert top == panel.VIEWPORT_Y_START
+        assert region(game.screen, pygame.Rect((panel.VIEWPORT_RECT.x, top + 1), (size[0], size[1] - 1))) == \
+            pixels[size[0] * 3:]
+
+
+def test_panel_scroll_is_clamped(game, panel):
+    panel.scroll_y = 500
+    panel.draw(game.screen)
+    assert panel.scroll_y == 0
+
+    panel.scroll_y = -10 ** 9
+    panel.draw(game.screen)
+    assert panel.scroll_y == -(panel.total_content_height - panel.VIEWPORT_HEIGHT)
+
+
+def test_panel_keeps_a_few_pages_while_scrolling_through(game, panel):
+    for scroll in range(0, panel.total_content_height, panel.VIEWPORT_HEIGHT):
+        panel.scroll_y = -scroll
+        panel.draw(game.screen)
+        assert len(panel.list_pages) <= panel.MAX_CACHED_PAGES
+
+
+# --- Results list ---
+
+@pytest.fixture
+def results_list(game):
+    results_list = game.ResultsList(game.results_content_rect(), game.RESULTS_LIST_FONT)
+    results_list.sync(titles(ENTRIES))
+    return results_list
+
+
+def test_results_list_renders_only_the_visible_rows(game, results_list, monkeypatch):
+    rendered = count_calls(monkeypatch, game.text_renderer, "render")
+    row_height = results_list.entry_tops[1] - results_list.entry_tops[0]
+
+    results_list.draw(game.screen, -(results_list.total_content_height // 2))
+
+    visible_rows = results_list.content_box_rect.height // row_height + 2
+    assert 0 < len(rendered) <= visible_rows
+    # The same rows again come from the line cache
+    rendered.clear()
+    results_list.draw(game.screen, -(results_list.total_content_height // 2))
+    assert rendered == []
+
+
+def test_results_list_scrolls_to_any_entry(game, results_list):
+    viewport_top = results_list.VIEWPORT_Y_START
+    for index in (0, 4321, ENTRIES - 1):
+        game.screen.fill(game.BLACK)
+        scroll_y = results_list.draw(game.screen, -results_list.entry_tops[index])
+
+        line = results_list.entry_lines[index][0]
+        expected = game.text_renderer.render(results_list.font, line, game.WHITE)
+        top = viewport_top + scroll_y + results_list.entry_tops[index]
+        assert top == viewport_top
+        row = pygame.Surface(expected.get_size()).convert()
+        row.fill(game.BLACK)
+        row.blit(expected, (0, 0))
+        assert region(game.screen, pygame.Rect((results_list.VIEWPORT_X_START, top), expected.get_size())) == \
+            pygame.image.tobytes(row, "RGB")
+
+
+def test_results_list_scroll_is_clamped(game, results_list):
+    assert results_list.draw(game.screen, 100) == 0
+    max_scroll = results_list.total_content_height - results_list.VIEWPORT_HEIGHT
+    assert results_list.draw(game.screen, -10 ** 9) == -max_scroll
+
+
+def test_results_list_sync_lays_out_only_new_titles(game, results_list):
+    results_list.sync(titles(ENTRIES + 5))
+    assert len(results_list.entry_lines) == ENTRIES + 5
+
+    results_list.sync(titles(3))
+    assert len(results_list.entry_lines) == 3
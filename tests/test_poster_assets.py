@@ -0,0 +1,102 @@
+# tests/test_poster_assets.py
+import json
+import os
+
+import pygame
+import pytest
+
+from src.poster_assets import (MANIFEST_FILENAME, PIXEL_FORMAT, CompiledPosters, build, compile_surface,
+                               thumbnail_surface, verify)
+
+WIDTH, HEIGHT_LIMIT = 60, 90
+PAGE_SIZE = (128, 128) # two 60x90 posters to a page
+
+
+def striped_poster(path, size, colors, alpha=False):
+    surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0, 32)
+    for row in range(size[1]):
+        color = colors[(row // 7) % len(colors)]
+        surface.fill(color, (0, row, size[0], 1))
+    if alpha:
+        surface.fill((0, 0, 0, 0), (0, 0, size[0] // 3, size[1]))
+    pygame.image.save(surface, str(path))
+
+
+@pytest.fixture
+def sources(tmp_path):
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    striped_poster(assets / "Alien.png", (300, 450), [(200, 30, 30), (20, 20, 20)])
+    striped_poster(assets / "Heat.png", (200, 300), [(30, 30, 200), (240, 240, 240), (10, 120, 10)])
+    striped_poster(assets / "Up.png", (300, 400), [(250, 200, 0), (0, 0, 0)], alpha=True)
+    catalog = tmp_path / "movies_by_category.json"
+    catalog.write_text(json.dumps({"Films": ["Alien", "Heat", "Up", "No Poster"]}), encoding="utf-8")
+    return assets, catalog
+
+
+def compile_expected(assets):
+    expected = {}
+    for name in sorted(os.listdir(assets)):
+        surface, _ = compile_surface(str(assets / name), WIDTH, HEIGHT_LIMIT)
+        expected[os.path.splitext(name)[0]] = (surface.get_size(), pygame.image.tobytes(surface, PIXEL_FORMAT))
+    return expected
+
+
+@pytest.mark.parametrize("atlas_page_size", [None, PAGE_SIZE], ids=["files", "atlas"])
+def test_compiled_posters_load_back_pixel_for_pixel(tmp_path, sources, atlas_page_size):
+    assets, catalog = sources
+    output = tmp_path / "compiled"
+
+    manifest = build(str(assets), str(output), str(catalog), WIDTH, HEIGHT_LIMIT, atlas_page_size=atlas_page_size)
+
+    assert sorted(manifest["posters"]) == ["Alien", "Heat", "Up"]
+    if atlas_page_size is not None:
+        assert len(manifest["atlas"]["pages"]) == 2
+    compiled = CompiledPosters(str(output))
+    for title, (size, pixels) in compile_expected(assets).items():
+        surface = compiled.load(title, WIDTH, HEIGHT_LIMIT)
+        assert surface.get_size() == size
+        assert pygame.image.tobytes(surface, PIXEL_FORMAT) == pixels
+        assert thumbnail_surface(compiled.thumbnail(title), WIDTH, HEIGHT_LIMIT).get_size() == size
+    assert compiled.load("No Poster", WIDTH, HEIGHT_LIMIT) is None
+    # Compiled at another size: not used
+    assert compiled.load("Alien", WIDTH * 2, HEIGHT_LIMIT * 2) is None
+    assert verify(str(output)) == []
+
+
+def test_verify_rejects_a_truncated_atlas_page(tmp_path, sources):
+    assets, catalog = sources
+    output = tmp_path / "compiled"
+    manifest = build(str(assets), str(output), str(catalog), WIDTH, HEIGHT_LIMIT, atlas_page_size=PAGE_SIZE)
+    page_path = output / manifest["atlas"]["pages"][1]
+    on_page = sorted(title for title, entry in manifest["posters"].items() if entry["page"] == 1)
+
+    with open(page_path, "r+b") as f:
+        f.truncate(os.path.getsize(page_path) // 2)
+
+    assert sorted(verify(str(output))) == on_page
+    # The game won't map the damaged page either
+    assert CompiledPosters(str(output)).load(on_page[0], WIDTH, HEIGHT_LIMIT) is None
+
+
+def test_verify_rejects_a_truncated_poster_file(tmp_path, sources):
+    assets, catalog = sources
+    output = tmp_path / "compiled"
+    manifest = build(str(assets), str(output), str(catalog), WIDTH, HEIGHT_LIMIT)
+    path = output / manifest["posters"]["Heat"]["file"]
+
+    with open(path, "r+b") as f:
+        f.truncate(100)
+
+    assert verify(str(output)) == ["Heat"]
+    assert CompiledPosters(str(output)).load("Heat", WIDTH, HEIGHT_LIMIT) is None
+
+
+def test_a_rebuild_removes_stale_files(tmp_path, sources):
+    assets, catalog = sources
+    output = tmp_path / "compiled"
+    build(str(assets), str(output), str(catalog), WIDTH, HEIGHT_LIMIT)
+
+    manifest = build(str(assets), str(output), str(catalog), WIDTH, HEIGHT_LIMIT, atlas_page_size=PAGE_SIZE)
+
+    assert sorted(os.listdir(output)) == sorted(manifest["atlas"]["pages"] + [MANIFEST_FILENAME])
@@ -0,0 +1,85 @@
+# tests/test_prefetch.py
+import threading
+import time
+
+from src.prefetch import PosterPrefetcher
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def make_prefetcher(load_delay=0.0, previews=None):
+    """A prefetcher whose 'surfaces' are strings, previews made from the previews dict."""
+    threads = []
+
+    def loader(title):
+        time.sleep(load_delay)
+        return f"poster:{title}"
+
+    def previewer(title):
+        threads.append(threading.current_thread())
+        return (previews or {}).get(title)
+
+    return PosterPrefetcher(loader, lookahead=1, workers=1, previewer=previewer), threads
+
+
+def test_previews_are_made_on_a_worker_and_handed_over():
+    prefetcher, threads = make_prefetcher(load_delay=0.5, previews={"A": "preview:A"})
+    try:
+        prefetcher.schedule([("A", "B")], 0)
+        wait_for(lambda: prefetcher.stats()["previews"] == 1)
+
+        assert prefetcher.get("A", keep_loading=True) is None
+        assert prefetcher.preview("A") == "preview:A"
+        assert prefetcher.preview("A") is None # handed over once
+        assert prefetcher.preview("B") is None # no thumbnail
+        assert threads and threading.current_thread() not in threads
+        wait_for(lambda: prefetcher.collect("A") == "poster:A")
+    finally:
+        prefetcher.shutdown()
+
+
+def test_previews_of_pairs_no_longer_coming_are_dropped():
+    prefetcher, _ = make_prefetcher(load_delay=0.5, previews={"A": "preview:A", "C": "preview:C"})
+    try:
+        pairs = [("A", "B"), ("C", "D")]
+        prefetcher.schedule(pairs, 0)
+        wait_for(lambda: prefetcher.stats()["previews"] == 1)
+
+        prefetcher.schedule(pairs, 1)
+        wait_for(lambda: prefetcher.stats()["previews"] == 1 and prefetcher.preview("C") == "preview:C")
+        assert prefetcher.preview("A") is None
+    finally:
+        prefetcher.shutdown()
+
+
+def test_a_hit_drops_the_preview():
+    prefetcher, _ = make_prefetcher(previews={"A": "preview:A"})
+    try:
+        prefetcher.schedule([("A", "B")], 0)
+        wait_for(lambda: prefetcher.stats()["ready"] == 2 and prefetcher.stats()["previews"] == 1)
+
+        assert prefetcher.get("A") == "poster:A"
+        assert prefetcher.preview("A") is None
+    finally:
+        prefetcher.shutdown()
+
+
+def test_discard_drops_loads_nobody_waits_on():
+    prefetcher, _ = make_prefetcher()
+    try:
+        prefetcher.schedule([("A", "B"), ("C", "D")], 1) # wants C and D
+        assert prefetcher.get("A", keep_loading=True) is None
+        wait_for(lambda: prefetcher.stats()["ready"] == 3)
+
+        prefetcher.discard("A")
+        prefetcher.discard("C")
+
+        assert prefetcher.collect("A") is None
+        assert prefetcher.collect("C") == "poster:C"
+    finally:
+        prefetcher.shutdown()
@@ -0,0 +1,98 @@
+# tests/test_replay.py
+import os
+import re
+import subprocess
+import sys
+
+from src.core import lane_poster_size
+from src.replay import SIZES, SessionLog
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs main.py with its arguments, pressing keys on a schedule when recording and
+# reporting the size every poster is loaded at
+DRIVER = '''
+import os, runpy, sys
+import pygame
+
+RECORDING = "--record" in sys.argv
+FRAMES = int(os.environ["TEST_FRAMES"])
+frame = 0
+
+def press(key):
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+def hook():
+    global frame
+    frame += 1
+    if RECORDING:
+        if frame == 5:
+            press(pygame.K_SPACE)
+        elif frame % 23 == 0:
+            press(pygame.K_RIGHT)
+        elif frame % 31 == 0:
+            press(pygame.K_LEFT)
+    if frame >= (FRAMES if RECORDING else 20 * FRAMES):
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+for name in ("flip", "update"):
+    def wrapped(*args, _original=getattr(pygame.display, name), **kwargs):
+        hook()
+        return _original(*args, **kwargs)
+    setattr(pygame.display, name, wrapped)
+
+from src import game
+
+load = game.get_poster_image
+def get_poster_image(title, api_key, poster_width=216, poster_height_limit=320):
+    print(f"POSTER_SIZE {poster_width} {poster_height_limit}", flush=True)
+    return load(title, api_key, poster_width, poster_height_limit)
+game.get_poster_image = get_poster_image
+
+sys.argv = [os.path.join(os.environ["REPO_DIR"], "main.py")] + sys.argv[1:]
+runpy.run_path(sys.argv[0], run_name="__main__")
+'''
+
+
+def run_game(tmp_path, stub_server, args, **env):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER)
+    env = dict(
+        os.environ,
+        SDL_VIDEODRIVER="dummy",
+        PYTHONPATH=REPO_DIR,
+        REPO_DIR=REPO_DIR,
+        OMDB_URL=stub_server.url,
+        POSTER_CACHE_DIR=str(tmp_path / "posters"),
+        CHOICE_LOG_DIR=str(tmp_path / "choices"),
+        SIMULATION_SPEED="8",
+        TEST_FRAMES="240",
+        **env,
+    )
+    result = subprocess.run([sys.executable, str(driver)] + args, cwd=tmp_path, env=env,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
+
+
+def poster_sizes(output):
+    # Prefetch threads print too, so lines can run into each other
+    return {(int(width), int(height)) for width, height in re.findall(r"POSTER_SIZE (\d+) (\d+)", output)}
+
+
+def test_replay_loads_posters_at_the_recorded_lane_count(tmp_path, stub_server):
+    path = str(tmp_path / "session.mmr")
+    expected = lane_poster_size(8)
+
+    output = run_game(tmp_path, stub_server, ["--record", path], LANES="8")
+    assert poster_sizes(output) == {expected}
+
+    log = SessionLog.load(path)
+    assert log.metadata["lanes"] == 8
+    recorded = [size for record in log.records if record.kind == SIZES for size in record.value]
+    assert recorded and all(width == expected[0] for width, _ in recorded)
+
+    # Nothing in the environment says 8 lanes this time; the log does
+    output = run_game(tmp_path, stub_server, ["--replay", path])
+    assert poster_sizes(output) == {expected}
+    assert "0 differed from the recording" in output
@@ -0,0 +1,135 @@
+# tests/test_scheduler.py
+import math
+import random
+
+import pytest
+
+from src.scheduler import InformationGainScheduler, SortScheduler, make_scheduler
+
+
+def titles(n, seed=1):
+    shuffled = [f"Movie {i:03}" for i in range(n)]
+    random.Random(seed).shuffle(shuffled)
+    return shuffled
+
+
+def play(scheduler, better):
+    """Answers every pair with better() until the scheduler has no more; returns the picks made."""
+    picks = 0
+    while scheduler.next_pair(scheduler._state) is not None:
+        index = len(scheduler) - 1
+        a, b = scheduler[index]
+        scheduler.choose(index, a if better(a, b) else b)
+        picks += 1
+    return picks
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 32, 150])
+def test_sort_returns_the_scripted_order(n):
+    pool = titles(n)
+    scheduler = SortScheduler(pool)
+
+    picks = play(scheduler, lambda a, b: a < b)
+
+    assert scheduler.ranking() == sorted(pool)
+    assert picks <= math.ceil(n * math.log2(max(n, 2)))
+
+
+def test_sort_never_asks_a_pair_twice():
+    scheduler = SortScheduler(titles(64))
+    play(scheduler, lambda a, b: a > b)
+
+    asked = {frozenset(pair) for pair in scheduler._pairs}
+    assert len(asked) == len(scheduler)
+
+
+@pytest.mark.parametrize("k", [1, 3, 10])
+def test_top_k_returns_the_best_k(k):
+    pool = titles(150)
+    scheduler = SortScheduler(pool, top_k=k)
+
+    picks = play(scheduler, lambda a, b: a > b)
+
+    assert scheduler.ranking() == sorted(pool, reverse=True)[:k]
+    assert picks < 150 * math.log2(150)
+
+
+def test_no_pick_asks_the_same_pair_again():
+    scheduler = SortScheduler(titles(8))
+    pair = scheduler[0]
+
+    scheduler.choose(0, None)
+
+    assert len(scheduler) == 2
+    assert scheduler[1] == pair
+
+
+def test_choices_for_other_pairs_are_ignored():
+    scheduler = SortScheduler(titles(8))
+    scheduler.choose(0, scheduler[0][0])
+    pair = scheduler[1]
+
+    scheduler.choose(0, scheduler[0][1])
+
+    assert len(scheduler) == 2
+    assert scheduler[1] == pair
+
+
+@pytest.mark.parametrize("make", [lambda pool: SortScheduler(pool), lambda pool: SortScheduler(pool, top_k=3),
+                                  lambda pool: InformationGainScheduler(pool, seed=1)],
+                         ids=["sort", "top-k", "information"])
+def test_upcoming_holds_both_branches(make):
+    scheduler = make(titles(16))
+    scheduler.choose(0, scheduler[0][0])
+    scheduler.choose(1, scheduler[1][1])
+    index = len(scheduler) - 1
+    pair = scheduler[index]
+    state = scheduler._state
+
+    upcoming = scheduler.upcoming(index, 2)
+
+    assert upcoming[0] == pair
+    for winner in pair:
+        assert scheduler.next_pair(scheduler.with_outcome(state, pair, winner)) in upcoming
+    # Looking ahead changes nothing
+    assert scheduler._state is state
+    assert len(scheduler) == index + 1
+
+
+def test_branching_leaves_the_state_alone():
+    scheduler = SortScheduler(titles(32))
+    for index in range(20):
+        scheduler.choose(index, min(scheduler[index]))
+    state = scheduler._state
+    pair = scheduler.next_pair(state)
+
+    for winner in pair:
+        scheduler.with_outcome(state, pair, winner)
+
+    assert scheduler.next_pair(state) == pair
+
+
+def test_ranking_before_the_end_goes_by_wins():
+    scheduler = SortScheduler(titles(8))
+    a, b = scheduler[0]
+    scheduler.choose(0, b)
+
+    assert scheduler.ranking()[0] == b
+
+
+def test_the_pool_defaults_to_every_title():
+    pool = titles(150)
+    pairs = [tuple(pool[i:i + 2]) for i in range(0, 150, 2)]
+
+    assert sorted(make_scheduler("sort", pairs).titles) == sorted(pool)
+    assert len(make_scheduler("information", pairs, pool_size=10).titles) == 10
+
+
+def test_make_scheduler_rejects_an_unknown_mode():
+    with pytest.raises(ValueError, match="bogo"):
+        make_scheduler("bogo", [("A", "B")])
+
+
+def test_random_mode_returns_the_pairs_as_they_are():
+    pairs = [("A", "B"), ("C", "D")]
+    assert make_scheduler("random", pairs) is pairs
@@ -0,0 +1,45 @@
+# tests/test_text.py
+import pygame
+import pytest
+
+from src.text import TextRenderer
+
+LINES = ["The Lord of the Rings: The Return of the King", "AVAWAY Tj’ – fi", "WALL·E", ""]
+
+
+@pytest.fixture
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 36)
+
+
+@pytest.mark.parametrize("line", LINES)
+def test_measure_matches_what_is_drawn(font, line):
+    renderer = TextRenderer()
+    surface = pygame.Surface((1200, 100), pygame.SRCALPHA)
+
+    width, height = renderer.measure(font, line)
+    drawn = renderer.draw(surface, font, line, (255, 255, 255), (10, 20))
+
+    assert (width, height) == font.size(line)
+    assert drawn == pygame.Rect(10, 20, width, height)
+    # Nothing is drawn outside the measured rect
+    inked = surface.get_bounding_rect()
+    assert inked.width == 0 or drawn.contains(inked)
+
+
+def test_wrapped_lines_fit_when_drawn(font):
+    from src import game
+
+    renderer = game.text_renderer
+    for line in game.wrap_text_multi("Harry Potter and the Deathly Hallows: Part 2", font, 206):
+        assert renderer.render(font, line, (255, 255, 255)).get_width() <= 206
+
+
+def test_render_gives_a_surface_the_caller_owns(font):
+    renderer = TextRenderer()
+    first = renderer.render(font, "Alien", (255, 255, 255))
+    first.fill((0, 0, 0, 0))
+
+    assert renderer.render(font, "Alien", (255, 255, 255)).get_bounding_rect().width > 0
+    assert renderer.render(font, "", (255, 255, 255)).get_width() == 1
@@ -0,0 +1,58 @@
+# tests/test_warm_cache.py
+import json
+
+from src import warm_cache
+from src.catalog import CATALOG_JSON_PATH
+from src.disk_cache import DiskCache
+
+
+def test_warm_cache_fills_the_cache_get_poster_image_reads(game, stub_server, tmp_path):
+    with open(CATALOG_JSON_PATH, "r", encoding="utf-8") as f:
+        titles = json.load(f)["Action"]
+    cache_dir = tmp_path / "warmed"
+    report = tmp_path / "report.json"
+
+    status = warm_cache.main([
+        "--catalog", str(tmp_path / "no-catalog.sqlite3"), # falls back to the JSON catalog
+        "--categories", "Action",
+        "--omdb-url", stub_server.url,
+        "--cache-dir", str(cache_dir),
+        "--rate", "0",
+        "--report", str(report),
+    ])
+    assert status == 0
+    summary = json.loads(report.read_text())
+    local = [title for title in titles if game.local_poster_path(title) is not None]
+    assert summary["counts"]["fetched"] == len(titles) - len(local)
+    assert summary["counts"]["local"] == len(local)
+    assert stub_server.stats()["omdb_requests"] == len(titles) - len(local)
+
+    # A new process: only what reached the disk, index included, is there
+    game.poster_cache = DiskCache(str(cache_dir))
+    game.poster_surface_cache.clear()
+    requests_before = stub_server.stats()
+    for title in titles:
+        if title in local:
+            continue
+        poster = game.get_poster_image(title, game.OMDB_API_KEY)
+        assert poster.get_size() == (216, 320) # the stub's 300x450 poster, scaled
+        assert tuple(poster.get_at((100, 100)))[:3] == (150, 40, 40)
+    assert stub_server.stats() == requests_before
+
+
+def test_second_run_is_served_from_the_cache(game, stub_server, tmp_path):
+    args = [
+        "--catalog", str(tmp_path / "no-catalog.sqlite3"),
+        "--categories", "Comedy",
+        "--omdb-url", stub_server.url,
+        "--cache-dir", str(tmp_path / "warmed"),
+        "--rate", "0",
+        "--report", str(tmp_path / "report.json"),
+    ]
+    assert warm_cache.main(args) == 0
+    requests_after_first = stub_server.stats()
+
+    assert warm_cache.main(args) == 0
+    summary = json.loads((tmp_path / "report.json").read_text())
+    assert summary["counts"]["fetched"] == 0
+    assert stub_server.stats() == requests_after_first